@@ -1,6 +1,7 @@
 import csv
 import time
 import threading
+import heapq
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import List, Dict, Any
@@ -15,10 +16,20 @@ class SistemaAeropuertoMejorado:
         self.eventos_log = []
         self.vuelos = []
         self.pistas = []
-        self.pistas_ocupadas = []
-        self.flujo_aterrizaje = []
-        self.flujo_despegue = []
+        self.pistas_ocupadas = {}  # id_pista -> ocupación actual
+        self.liberaciones_pistas = []  # Montículo (tiempo_fin, orden de asignación, id_pista)
+        self.asignaciones_realizadas = 0
+        self.flujo_aterrizaje = {}  # orden_cola -> vuelo, en orden de entrada
+        self.flujo_despegue = {}
+        self.colas_prioridad = {'aterrizajes_emergencia': [], 'despegues_emergencia': [], 'normales': []}
+        self.cola_de_vuelo = {}  # orden_cola -> cola de prioridad donde está el vuelo
+        self.vuelos_encolados = 0  # Contador para numerar la entrada en cola
         self.vuelos_completados = []
+        self.operaciones_pistas = {}  # id_pista -> operaciones completadas
+        self.minutos_ocupacion_pistas = {}  # id_pista -> minutos ocupada en esas operaciones
+        self.espera_total = 0  # Suma de las esperas (entrada en cola -> asignación) de los completados
+        self.calendario_llegadas = []  # Vuelos PENDIENTE ordenados por ETA/ETD
+        self.cursor_calendario = 0  # Primer vuelo del calendario que aún no ha entrado en cola
         self.aviones_animados = {}
         self.hilo_simulacion = None
         
@@ -82,6 +93,7 @@ class SistemaAeropuertoMejorado:
                         'posicion_animacion': 0  # Para controlar animación
                     }
                     self.vuelos.append(vuelo)
+            self.preparar_calendario_llegadas()
             self.registrar_evento("CARGA_INICIAL", f"vuelos={len(self.vuelos)}")
         except Exception as e:
             print(f"Error cargando vuelos: {e}")
@@ -303,7 +315,7 @@ class SistemaAeropuertoMejorado:
         for i, pos in enumerate(pista_positions):
             if i < len(self.pistas):
                 pista = self.pistas[i]
-                pista_ocupada = any(po['id_pista'] == pista['id_pista'] for po in self.pistas_ocupadas)
+                pista_ocupada = pista['id_pista'] in self.pistas_ocupadas
                 
                 # Color de pista según estado
                 color_pista = '#ff4444' if pista_ocupada else '#2ecc71'
@@ -340,7 +352,7 @@ class SistemaAeropuertoMejorado:
     def dibujar_aviones(self):
         """Dibuja todos los aviones según su estado actual"""
         # Aviones en pistas (asignados)
-        for pista_ocupada in self.pistas_ocupadas:
+        for pista_ocupada in self.pistas_ocupadas.values():
             vuelo = next((v for v in self.vuelos if v['id'] == pista_ocupada['vuelo_id']), None)
             if vuelo:
                 pista_idx = next(i for i, p in enumerate(self.pistas) if p['id_pista'] == pista_ocupada['id_pista'])
@@ -360,7 +372,7 @@ class SistemaAeropuertoMejorado:
                                            'rojo' if vuelo['tipo'] == 'ATERRIZAJE' else 'azul')
         
         # Aviones esperando aterrizar (volando en círculo)
-        for i, vuelo in enumerate([v for v in self.flujo_aterrizaje if v['estado'] == 'EN_COLA']):
+        for i, vuelo in enumerate([v for v in self.flujo_aterrizaje.values() if v['estado'] == 'EN_COLA']):
             angle = (self.reloj_virtual * 15 + i * 90) % 360
             radius = 60
             center_x, center_y = 500, 100 + i * 30
@@ -377,7 +389,7 @@ class SistemaAeropuertoMejorado:
                                   outline='yellow', dash=(4, 2), width=1)
         
         # Aviones esperando despegar (en plataforma)
-        for i, vuelo in enumerate([v for v in self.flujo_despegue if v['estado'] == 'EN_COLA']):
+        for i, vuelo in enumerate([v for v in self.flujo_despegue.values() if v['estado'] == 'EN_COLA']):
             avion_x = 1200
             avion_y = 380 - i * 25
             self.dibujar_avion_detallado(avion_x, avion_y, vuelo['id'], 'azul')
@@ -489,95 +501,136 @@ class SistemaAeropuertoMejorado:
                 if vuelo['combustible'] <= 0:
                     vuelo['estado'] = "CANCELADO"
                     self.registrar_evento("CANCELADO", f"Vuelo {vuelo['id']} - SIN COMBUSTIBLE")
-                    if vuelo in self.flujo_aterrizaje:
-                        self.flujo_aterrizaje.remove(vuelo)
+                    self.flujo_aterrizaje.pop(vuelo.get('orden_cola'), None)
+                    self.cola_de_vuelo.pop(vuelo.get('orden_cola'), None)
                 
                 elif vuelo['combustible'] <= 5 and vuelo['prioridad'] != 2:
                     vuelo['prioridad'] = 2
+                    # Pasa a la cola de emergencias
+                    if vuelo.get('orden_cola') in self.cola_de_vuelo:
+                        self.encolar_por_prioridad(vuelo)
                     self.registrar_evento("EMERGENCIA", 
                                         f"Vuelo {vuelo['id']} - COMBUSTIBLE CRÍTICO: {vuelo['combustible']}min")
 
+    def preparar_calendario_llegadas(self):
+        """Ordena por ETA/ETD los vuelos pendientes"""
+        pendientes = []
+        for indice, vuelo in enumerate(self.vuelos):
+            if vuelo['estado'] == "PENDIENTE":
+                hora_prevista = vuelo['eta'] if vuelo['tipo'] == "ATERRIZAJE" else vuelo['etd']
+                if hora_prevista is not None:
+                    pendientes.append((hora_prevista, indice, vuelo))
+        pendientes.sort(key=lambda entrada: entrada[:2])
+        self.calendario_llegadas = pendientes
+        self.cursor_calendario = 0
+
     def gestionar_entrada_colas(self):
         """Gestiona la entrada de vuelos a las colas"""
-        for vuelo in self.vuelos:
+        # Avanzar el cursor sobre los vuelos cuyo ETA/ETD ya ha llegado
+        inicio = self.cursor_calendario
+        while (self.cursor_calendario < len(self.calendario_llegadas) and
+               self.calendario_llegadas[self.cursor_calendario][0] <= self.reloj_virtual):
+            self.cursor_calendario += 1
+        
+        # Entran en cola en el mismo orden en que se cargaron
+        for _, _, vuelo in sorted(self.calendario_llegadas[inicio:self.cursor_calendario], key=lambda entrada: entrada[1]):
             if vuelo['estado'] == "PENDIENTE":
-                hora_prevista = vuelo['eta'] if vuelo['tipo'] == "ATERRIZAJE" else vuelo['etd']
+                vuelo['estado'] = "EN_COLA"
+                vuelo['minuto_entrada_cola'] = self.reloj_virtual
+                self.vuelos_encolados += 1
+                vuelo['orden_cola'] = self.vuelos_encolados
                 
-                if hora_prevista <= self.reloj_virtual:
-                    vuelo['estado'] = "EN_COLA"
-                    vuelo['minuto_entrada_cola'] = self.reloj_virtual
-                    
-                    if vuelo['tipo'] == "ATERRIZAJE":
-                        self.flujo_aterrizaje.append(vuelo)
-                    else:
-                        self.flujo_despegue.append(vuelo)
-                    
-                    self.registrar_evento("EN_COLA", f"Vuelo {vuelo['id']} ({vuelo['tipo']})")
+                if vuelo['tipo'] == "ATERRIZAJE":
+                    self.flujo_aterrizaje[vuelo['orden_cola']] = vuelo
+                else:
+                    self.flujo_despegue[vuelo['orden_cola']] = vuelo
+                self.encolar_por_prioridad(vuelo)
+                
+                self.registrar_evento("EN_COLA", f"Vuelo {vuelo['id']} ({vuelo['tipo']})")
 
     def liberar_pistas(self):
         """Libera pistas que han completado su tiempo"""
         pistas_a_liberar = []
-        for pista_ocupada in self.pistas_ocupadas[:]:
-            if pista_ocupada['tiempo_fin'] <= self.reloj_virtual:
-                vuelo = next((v for v in self.vuelos if v['id'] == pista_ocupada['vuelo_id']), None)
-                if vuelo:
-                    vuelo['estado'] = "COMPLETADO"
-                    vuelo['minuto_completado'] = self.reloj_virtual
-                    self.vuelos_completados.append(vuelo)
-                    self.registrar_evento("COMPLETADO", 
-                                        f"Vuelo {vuelo['id']} - Pista {pista_ocupada['id_pista']}")
-                
-                pistas_a_liberar.append(pista_ocupada)
-                self.pistas_ocupadas.remove(pista_ocupada)
+        # Sacar del montículo las pistas vencidas, en el orden en que se asignaron
+        vencidas = []
+        while self.liberaciones_pistas and self.liberaciones_pistas[0][0] <= self.reloj_virtual:
+            vencidas.append(heapq.heappop(self.liberaciones_pistas))
+        vencidas.sort(key=lambda liberacion: liberacion[1])
+        for _, _, id_pista in vencidas:
+            pista_ocupada = self.pistas_ocupadas.pop(id_pista)
+            self.operaciones_pistas[id_pista] = self.operaciones_pistas.get(id_pista, 0) + 1
+            self.minutos_ocupacion_pistas[id_pista] = (self.minutos_ocupacion_pistas.get(id_pista, 0) +
+                                                       self.reloj_virtual - pista_ocupada['tiempo_inicio'])
+            vuelo = next((v for v in self.vuelos if v['id'] == pista_ocupada['vuelo_id']), None)
+            if vuelo:
+                vuelo['estado'] = "COMPLETADO"
+                vuelo['minuto_completado'] = self.reloj_virtual
+                self.vuelos_completados.append(vuelo)
+                self.espera_total += vuelo['minuto_asignacion'] - vuelo['minuto_entrada_cola']
+                self.registrar_evento("COMPLETADO", 
+                                    f"Vuelo {vuelo['id']} - Pista {pista_ocupada['id_pista']}")
+            
+            pistas_a_liberar.append(pista_ocupada)
     
     def asignar_pistas(self):
         """Asigna pistas disponibles a vuelos"""
         pistas_disponibles = [p for p in self.pistas 
                             if p['habilitada'] and 
-                            p['id_pista'] not in [po['id_pista'] for po in self.pistas_ocupadas]]
+                            p['id_pista'] not in self.pistas_ocupadas]
         
         for pista in pistas_disponibles:
             vuelo = self.seleccionar_proximo_vuelo()
             if vuelo:
                 self.asignar_pista_a_vuelo(vuelo, pista)
 
+    def encolar_por_prioridad(self, vuelo: Dict):
+        """Coloca un vuelo en cola dentro de la cola ordenada de su prioridad"""
+        orden = vuelo['orden_cola']
+        es_aterrizaje = vuelo['tipo'] == "ATERRIZAJE"
+        hora_prevista = vuelo['eta'] if es_aterrizaje else vuelo['etd']
+        
+        if vuelo['prioridad'] == 2 and es_aterrizaje:
+            # El combustible de los aterrizajes en cola baja 1 por minuto:
+            # combustible + reloj mantiene el orden sin reordenar la cola
+            if vuelo['combustible'] is None:
+                clave = (float('inf'), orden)
+            else:
+                clave = (vuelo['combustible'] + self.reloj_virtual, orden)
+            nombre = 'aterrizajes_emergencia'
+        elif vuelo['prioridad'] == 2:
+            clave = (hora_prevista, orden)
+            nombre = 'despegues_emergencia'
+        elif vuelo['prioridad'] in (0, 1):
+            # Aterrizajes primero, menor ETA/ETD; a igualdad, prioridad 1 y orden de entrada
+            clave = (0 if es_aterrizaje else 1, hora_prevista, 1 - vuelo['prioridad'], orden)
+            nombre = 'normales'
+        else:
+            self.cola_de_vuelo.pop(orden, None)
+            return
+        
+        # Si el vuelo ya estaba en otra cola, esa entrada queda obsoleta
+        self.cola_de_vuelo[orden] = nombre
+        heapq.heappush(self.colas_prioridad[nombre], (clave, vuelo))
+
+    def primero_de_cola(self, nombre: str):
+        """Devuelve el primer vuelo vigente de una cola de prioridad"""
+        cola = self.colas_prioridad[nombre]
+        while cola:
+            vuelo = cola[0][1]
+            if self.cola_de_vuelo.get(vuelo['orden_cola']) == nombre and vuelo['estado'] == "EN_COLA":
+                return vuelo
+            # Descartar vuelos ya asignados, cancelados o cambiados de cola
+            heapq.heappop(cola)
+        return None
+
     def seleccionar_proximo_vuelo(self):
         """Selecciona el próximo vuelo según prioridad"""
-        # Combinar y filtrar vuelos en cola
-        todos_vuelos_en_cola = [v for v in self.flujo_aterrizaje + self.flujo_despegue 
-                               if v['estado'] == 'EN_COLA']
-        
-        if not todos_vuelos_en_cola:
-            return None
-        
-        # Ordenar por prioridad (emergencias primero)
-        vuelos_prioridad_2 = [v for v in todos_vuelos_en_cola if v['prioridad'] == 2]
-        vuelos_prioridad_1 = [v for v in todos_vuelos_en_cola if v['prioridad'] == 1]
-        vuelos_prioridad_0 = [v for v in todos_vuelos_en_cola if v['prioridad'] == 0]
-        
-        # Procesar emergencias primero (prioridad 2)
-        if vuelos_prioridad_2:
-            # Para emergencias: aterrizajes con menos combustible primero
-            aterrizajes_emergencia = [v for v in vuelos_prioridad_2 if v['tipo'] == "ATERRIZAJE"]
-            despegues_emergencia = [v for v in vuelos_prioridad_2 if v['tipo'] == "DESPEGUE"]
-            
-            if aterrizajes_emergencia:
-                aterrizajes_emergencia.sort(key=lambda x: x['combustible'])
-                return aterrizajes_emergencia[0]
-            elif despegues_emergencia:
-                despegues_emergencia.sort(key=lambda x: x['etd'])
-                return despegues_emergencia[0]
-        
-        # Combinar prioridad 1 y 0
-        candidatos = vuelos_prioridad_1 + vuelos_prioridad_0
-        
-        if candidatos:
-            # Ordenar por tipo (aterrizaje primero) y luego por tiempo de espera
-            candidatos.sort(key=lambda x: (
-                0 if x['tipo'] == 'ATERRIZAJE' else 1,  # Aterrizajes primero
-                x['eta'] if x['tipo'] == 'ATERRIZAJE' else x['etd']  # Menor ETA/ETD primero
-            ))
-            return candidatos[0]
+        # Emergencias primero (aterrizajes con menos combustible, luego despegues),
+        # después el resto de vuelos
+        for nombre in ['aterrizajes_emergencia', 'despegues_emergencia', 'normales']:
+            vuelo = self.primero_de_cola(nombre)
+            if vuelo:
+                return vuelo
         
         return None
 
@@ -585,20 +638,25 @@ class SistemaAeropuertoMejorado:
         """Asigna una pista a un vuelo"""
         tiempo_fin = self.reloj_virtual + pista['tiempo_uso']
         
-        self.pistas_ocupadas.append({
+        self.pistas_ocupadas[pista['id_pista']] = {
             'id_pista': pista['id_pista'],
             'vuelo_id': vuelo['id'],
+            'tiempo_inicio': self.reloj_virtual,
             'tiempo_fin': tiempo_fin
-        })
+        }
+        self.asignaciones_realizadas += 1
+        heapq.heappush(self.liberaciones_pistas, (tiempo_fin, self.asignaciones_realizadas, pista['id_pista']))
         
         vuelo['estado'] = "ASIGNADO"
         vuelo['minuto_asignacion'] = self.reloj_virtual
         
         # Remover de la cola correspondiente
-        if vuelo in self.flujo_aterrizaje:
-            self.flujo_aterrizaje.remove(vuelo)
-        elif vuelo in self.flujo_despegue:
-            self.flujo_despegue.remove(vuelo)
+        orden = vuelo.get('orden_cola')
+        self.cola_de_vuelo.pop(orden, None)
+        if orden in self.flujo_aterrizaje:
+            del self.flujo_aterrizaje[orden]
+        elif orden in self.flujo_despegue:
+            del self.flujo_despegue[orden]
         
         self.registrar_evento("ASIGNACION", 
                             f"Vuelo {vuelo['id']} - Pista {pista['id_pista']} ({vuelo['tipo']})")
@@ -654,7 +712,7 @@ class SistemaAeropuertoMejorado:
                 self.despegue_tree.delete(item)
             
             # Añadir vuelos de aterrizaje
-            for vuelo in self.flujo_aterrizaje:
+            for vuelo in self.flujo_aterrizaje.values():
                 if vuelo['estado'] == 'EN_COLA':
                     prioridad_text = {0: 'Normal', 1: 'Alta', 2: 'EMERGENCIA'}[vuelo['prioridad']]
                     estado_text = 'En Espera'
@@ -671,7 +729,7 @@ class SistemaAeropuertoMejorado:
                     ), tags=tags)
             
             # Añadir vuelos de despegue
-            for vuelo in self.flujo_despegue:
+            for vuelo in self.flujo_despegue.values():
                 if vuelo['estado'] == 'EN_COLA':
                     prioridad_text = {0: 'Normal', 1: 'Alta', 2: 'EMERGENCIA'}[vuelo['prioridad']]
                     estado_text = 'En Espera'
@@ -718,13 +776,13 @@ class SistemaAeropuertoMejorado:
         """Retorna el estado actual del sistema"""
         return {
             'reloj': self.reloj_virtual,
-            'vuelos_en_cola_aterrizaje': len([v for v in self.flujo_aterrizaje if v['estado'] == 'EN_COLA']),
-            'vuelos_en_cola_despegue': len([v for v in self.flujo_despegue if v['estado'] == 'EN_COLA']),
+            'vuelos_en_cola_aterrizaje': len([v for v in self.flujo_aterrizaje.values() if v['estado'] == 'EN_COLA']),
+            'vuelos_en_cola_despegue': len([v for v in self.flujo_despegue.values() if v['estado'] == 'EN_COLA']),
             'vuelos_asignados': len([v for v in self.vuelos if v['estado'] == 'ASIGNADO']),
             'vuelos_completados': len(self.vuelos_completados),
             'pistas_ocupadas': len(self.pistas_ocupadas),
             'pistas_totales': len(self.pistas),
-            'detalle_pistas': self.pistas_ocupadas
+            'detalle_pistas': list(self.pistas_ocupadas.values())
         }
     
     def detener_simulacion(self):
@@ -749,18 +807,18 @@ class SistemaAeropuertoMejorado:
                 f.write(f"🛬 Aterrizajes completados: {aterrizajes_completados}\n")
                 f.write(f"🛫 Despegues completados: {despegues_completados}\n")
                 
-                # Tiempos de espera
+                # Tiempos de espera (entrada en cola -> asignación), acumulados al completar
                 if self.vuelos_completados:
-                    tiempos_espera = [v['minuto_asignacion'] - (v['eta'] if v['tipo'] == 'ATERRIZAJE' else v['etd']) 
-                                    for v in self.vuelos_completados]
-                    tiempo_medio = sum(tiempos_espera) / len(tiempos_espera)
+                    tiempo_medio = self.espera_total / len(self.vuelos_completados)
                     f.write(f"⏱️  Tiempo medio de espera: {tiempo_medio:.1f} minutos\n")
                 
-                # Uso de pistas
+                # Uso de pistas: operaciones completadas y minutos ocupada
                 f.write(f"\n🛣️  USO DE PISTAS:\n")
                 for pista in self.pistas:
-                    count = len([po for po in self.pistas_ocupadas if po['id_pista'] == pista['id_pista']])
-                    f.write(f"   - Pista {pista['id_pista']} ({pista['categoria']}): {count} operaciones\n")
+                    operaciones = self.operaciones_pistas.get(pista['id_pista'], 0)
+                    minutos = self.minutos_ocupacion_pistas.get(pista['id_pista'], 0)
+                    f.write(f"   - Pista {pista['id_pista']} ({pista['categoria']}): {operaciones} operaciones, "
+                           f"{minutos} min ocupada\n")
                 
                 # Emergencias
                 emergencias = len([v for v in self.vuelos_completados if v['prioridad'] == 2])
@@ -770,7 +828,7 @@ class SistemaAeropuertoMejorado:
                 f.write(f"\n📋 DETALLE DE OPERACIONES COMPLETADAS:\n")
                 for vuelo in self.vuelos_completados:
                     tipo_extra = " (EMERGENCIA)" if vuelo['prioridad'] == 2 else ""
-                    tiempo_espera = vuelo['minuto_asignacion'] - (vuelo['eta'] if vuelo['tipo'] == 'ATERRIZAJE' else vuelo['etd'])
+                    tiempo_espera = vuelo['minuto_asignacion'] - vuelo['minuto_entrada_cola']
                     f.write(f"   • {vuelo['id']} ({vuelo['tipo']}{tipo_extra}) | "
                            f"Espera: {tiempo_espera}min | "
                            f"Operación: {vuelo['minuto_asignacion']}-{vuelo['minuto_completado']}\n")
@@ -788,10 +846,20 @@ class SistemaAeropuertoMejorado:
         # Reiniciar variables
         self.reloj_virtual = 0
         self.vuelos = []
-        self.pistas_ocupadas = []
-        self.flujo_aterrizaje = []
-        self.flujo_despegue = []
+        self.calendario_llegadas = []
+        self.cursor_calendario = 0
+        self.pistas_ocupadas = {}
+        self.liberaciones_pistas = []
+        self.asignaciones_realizadas = 0
+        self.flujo_aterrizaje = {}
+        self.flujo_despegue = {}
+        self.colas_prioridad = {'aterrizajes_emergencia': [], 'despegues_emergencia': [], 'normales': []}
+        self.cola_de_vuelo = {}
+        self.vuelos_encolados = 0
         self.vuelos_completados = []
+        self.operaciones_pistas = {}
+        self.minutos_ocupacion_pistas = {}
+        self.espera_total = 0
         self.eventos_log = []
         self.aviones_animados = {}
         
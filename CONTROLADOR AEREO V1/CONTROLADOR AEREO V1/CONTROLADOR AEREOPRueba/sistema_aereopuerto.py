@@ -1,6 +1,7 @@
 import csv
 import time
 import threading
+import heapq
 from typing import List, Dict, Any
 
 class SistemaAeropuerto:
@@ -10,10 +11,20 @@ class SistemaAeropuerto:
         self.eventos_log = []
         self.vuelos = []
         self.pistas = []
-        self.pistas_ocupadas = []
-        self.flujo_aterrizaje = []
-        self.flujo_despegue = []
+        self.pistas_ocupadas = {}  # id_pista -> ocupación actual
+        self.liberaciones_pistas = []  # Montículo (tiempo_fin, orden de asignación, id_pista)
+        self.asignaciones_realizadas = 0
+        self.flujo_aterrizaje = {}  # orden_cola -> vuelo, en orden de entrada
+        self.flujo_despegue = {}
+        self.colas_prioridad = {'aterrizajes_emergencia': [], 'despegues_emergencia': [], 'normales': []}
+        self.cola_de_vuelo = {}  # orden_cola -> cola de prioridad donde está el vuelo
+        self.vuelos_encolados = 0
         self.vuelos_completados = []
+        self.operaciones_pistas = {}  # id_pista -> operaciones completadas
+        self.minutos_ocupacion_pistas = {}  # id_pista -> minutos ocupada en esas operaciones
+        self.espera_total = 0  # Suma de las esperas (entrada en cola -> asignación) de los completados
+        self.calendario_llegadas = []  # (minuto previsto, orden de carga, vuelo) de los vuelos pendientes
+        self.cursor_calendario = 0
         
     def cargar_vuelos_desde_csv(self, archivo: str = "vuelos.csv"):
         """Carga los vuelos desde el archivo CSV"""
@@ -34,6 +45,7 @@ class SistemaAeropuerto:
                         'minuto_completado': None
                     }
                     self.vuelos.append(vuelo)
+            self.preparar_calendario_llegadas()
             self.registrar_evento("CARGA_INICIAL", f"vuelos={len(self.vuelos)}")
         except FileNotFoundError:
             print(f"Error: Archivo {archivo} no encontrado")
@@ -98,88 +110,131 @@ class SistemaAeropuerto:
                 # Verificar emergencia por combustible bajo
                 if vuelo['combustible'] <= 5 and vuelo['prioridad'] != 2:
                     vuelo['prioridad'] = 2
+                    if vuelo.get('orden_cola') in self.cola_de_vuelo:
+                        self.encolar_por_prioridad(vuelo)
                     self.registrar_evento("EMERGENCIA", 
                                         f"id_vuelo={vuelo['id']} prioridad=2 motivo=combustible<={vuelo['combustible']}")
 
+    def preparar_calendario_llegadas(self):
+        """Ordena por ETA/ETD los vuelos que aún no han entrado en cola"""
+        pendientes = []
+        for indice, vuelo in enumerate(self.vuelos):
+            if vuelo['estado'] not in ["EN_COLA", "ASIGNADO", "COMPLETADO", "CANCELADO"]:
+                hora_prevista = vuelo['eta'] if vuelo['tipo'] == "ATERRIZAJE" else vuelo['etd']
+                if hora_prevista is not None:
+                    pendientes.append((hora_prevista, indice, vuelo))
+        pendientes.sort(key=lambda entrada: entrada[:2])
+        self.calendario_llegadas = pendientes
+        self.cursor_calendario = 0
+
     def gestionar_entrada_colas(self):
         """Gestiona la entrada de vuelos a las colas según ETA/ETD"""
-        for vuelo in self.vuelos:
+        # Solo se miran los vuelos cuyo minuto previsto ya ha llegado
+        inicio = self.cursor_calendario
+        while (self.cursor_calendario < len(self.calendario_llegadas) and
+               self.calendario_llegadas[self.cursor_calendario][0] <= self.reloj_virtual):
+            self.cursor_calendario += 1
+        
+        for _, _, vuelo in sorted(self.calendario_llegadas[inicio:self.cursor_calendario], key=lambda entrada: entrada[1]):
             if vuelo['estado'] not in ["EN_COLA", "ASIGNADO", "COMPLETADO", "CANCELADO"]:
-                hora_prevista = vuelo['eta'] if vuelo['tipo'] == "ATERRIZAJE" else vuelo['etd']
+                vuelo['estado'] = "EN_COLA"
+                vuelo['minuto_entrada_cola'] = self.reloj_virtual
+                self.vuelos_encolados += 1
+                vuelo['orden_cola'] = self.vuelos_encolados
+                
+                if vuelo['tipo'] == "ATERRIZAJE":
+                    self.flujo_aterrizaje[vuelo['orden_cola']] = vuelo
+                else:
+                    self.flujo_despegue[vuelo['orden_cola']] = vuelo
+                self.encolar_por_prioridad(vuelo)
                 
-                if hora_prevista <= self.reloj_virtual:
-                    vuelo['estado'] = "EN_COLA"
-                    vuelo['minuto_entrada_cola'] = self.reloj_virtual
-                    
-                    if vuelo['tipo'] == "ATERRIZAJE":
-                        self.flujo_aterrizaje.append(vuelo)
-                    else:
-                        self.flujo_despegue.append(vuelo)
-                    
-                    self.registrar_evento("EN_COLA", 
-                                        f"id_vuelo={vuelo['id']} tipo={vuelo['tipo']}")
+                self.registrar_evento("EN_COLA", 
+                                    f"id_vuelo={vuelo['id']} tipo={vuelo['tipo']}")
 
     def liberar_pistas(self):
         """Libera pistas que han completado su tiempo de uso"""
         pistas_liberar = []
-        for pista_ocupada in self.pistas_ocupadas[:]:
-            if pista_ocupada['tiempo_fin'] <= self.reloj_virtual:
-                # Encontrar el vuelo y marcarlo como completado
-                vuelo = next((v for v in self.vuelos if v['id'] == pista_ocupada['vuelo_id']), None)
-                if vuelo:
-                    vuelo['estado'] = "COMPLETADO"
-                    vuelo['minuto_completado'] = self.reloj_virtual
-                    self.vuelos_completados.append(vuelo)
-                
-                self.pistas_ocupadas.remove(pista_ocupada)
-                pistas_liberar.append(pista_ocupada['id_pista'])
-                
-                self.registrar_evento("COMPLETADO", 
-                                    f"id_vuelo={pista_ocupada['vuelo_id']} pista={pista_ocupada['id_pista']}")
+        # Pistas cuyo tiempo de uso ha terminado, en el orden en que se asignaron
+        vencidas = []
+        while self.liberaciones_pistas and self.liberaciones_pistas[0][0] <= self.reloj_virtual:
+            vencidas.append(heapq.heappop(self.liberaciones_pistas))
+        vencidas.sort(key=lambda liberacion: liberacion[1])
+        for _, _, id_pista in vencidas:
+            pista_ocupada = self.pistas_ocupadas.pop(id_pista)
+            self.operaciones_pistas[id_pista] = self.operaciones_pistas.get(id_pista, 0) + 1
+            self.minutos_ocupacion_pistas[id_pista] = (self.minutos_ocupacion_pistas.get(id_pista, 0) +
+                                                       self.reloj_virtual - pista_ocupada['tiempo_inicio'])
+            # Encontrar el vuelo y marcarlo como completado
+            vuelo = next((v for v in self.vuelos if v['id'] == pista_ocupada['vuelo_id']), None)
+            if vuelo:
+                vuelo['estado'] = "COMPLETADO"
+                vuelo['minuto_completado'] = self.reloj_virtual
+                self.vuelos_completados.append(vuelo)
+                self.espera_total += vuelo['minuto_asignacion'] - vuelo['minuto_entrada_cola']
+            
+            pistas_liberar.append(id_pista)
+            
+            self.registrar_evento("COMPLETADO", 
+                                f"id_vuelo={pista_ocupada['vuelo_id']} pista={pista_ocupada['id_pista']}")
 
     def asignar_pistas(self):
         """Asigna pistas disponibles a vuelos según política de prioridad"""
         pistas_disponibles = [p for p in self.pistas 
                             if p['habilitada'] and 
-                            p['id_pista'] not in [po['id_pista'] for po in self.pistas_ocupadas]]
+                            p['id_pista'] not in self.pistas_ocupadas]
         
         for pista in pistas_disponibles:
             vuelo = self.seleccionar_proximo_vuelo()
             if vuelo:
                 self.asignar_pista_a_vuelo(vuelo, pista)
 
-    def seleccionar_proximo_vuelo(self):
-        """Selecciona el próximo vuelo según política de prioridad"""
-        todos_vuelos = self.flujo_aterrizaje + self.flujo_despegue
-        vuelos_en_cola = [v for v in todos_vuelos if v['estado'] == "EN_COLA"]
-        
-        if not vuelos_en_cola:
-            return None
-        
-        # Ordenar por prioridad (emergencias primero)
-        vuelos_prioridad_2 = [v for v in vuelos_en_cola if v['prioridad'] == 2]
-        vuelos_prioridad_1 = [v for v in vuelos_en_cola if v['prioridad'] == 1]
-        vuelos_prioridad_0 = [v for v in vuelos_en_cola if v['prioridad'] == 0]
+    def encolar_por_prioridad(self, vuelo: Dict):
+        """Coloca un vuelo del flujo en la cola ordenada de su prioridad"""
+        orden = vuelo['orden_cola']
+        hora_prevista = vuelo['eta'] if vuelo['tipo'] == "ATERRIZAJE" else vuelo['etd']
         
-        # Para emergencias: aterrizajes con menos combustible primero
-        if vuelos_prioridad_2:
-            aterrizajes = [v for v in vuelos_prioridad_2 if v['tipo'] == "ATERRIZAJE"]
-            despegues = [v for v in vuelos_prioridad_2 if v['tipo'] == "DESPEGUE"]
-            
-            if aterrizajes:
-                aterrizajes.sort(key=lambda x: x['combustible'])
-                return aterrizajes[0]
-            elif despegues:
-                despegues.sort(key=lambda x: x['etd'])
-                return despegues[0]
+        if vuelo['prioridad'] == 2 and vuelo['tipo'] == "ATERRIZAJE":
+            # Todos los aterrizajes en cola gastan un minuto de combustible por minuto,
+            # así que combustible + reloj conserva el orden sin reordenar la cola
+            if vuelo['combustible'] is None:
+                clave = (float('inf'), orden)
+            else:
+                clave = (vuelo['combustible'] + self.reloj_virtual, orden)
+            nombre = 'aterrizajes_emergencia'
+        elif vuelo['prioridad'] == 2:
+            clave = (hora_prevista, orden)
+            nombre = 'despegues_emergencia'
+        elif vuelo['prioridad'] in (0, 1):
+            # Mismo desempate que antes: prioridad 1, luego aterrizajes, luego orden de entrada
+            clave = (hora_prevista, 1 - vuelo['prioridad'], 0 if vuelo['tipo'] == "ATERRIZAJE" else 1, orden)
+            nombre = 'normales'
+        else:
+            self.cola_de_vuelo.pop(orden, None)
+            return
         
+        # La entrada anterior del vuelo, si la hay, queda obsoleta
+        self.cola_de_vuelo[orden] = nombre
+        heapq.heappush(self.colas_prioridad[nombre], (clave, vuelo))
+
+    def primero_de_cola(self, nombre: str):
+        """Devuelve el primer vuelo vigente de una cola de prioridad"""
+        cola = self.colas_prioridad[nombre]
+        while cola:
+            vuelo = cola[0][1]
+            if self.cola_de_vuelo.get(vuelo['orden_cola']) == nombre and vuelo['estado'] == "EN_COLA":
+                return vuelo
+            # Vuelo ya asignado o cambiado de cola
+            heapq.heappop(cola)
+        return None
+
+    def seleccionar_proximo_vuelo(self):
+        """Selecciona el próximo vuelo según política de prioridad"""
+        # Emergencias primero: aterrizajes con menos combustible, luego despegues por ETD
         # Para prioridad 1 y 0: mayor atraso primero
-        candidatos = vuelos_prioridad_1 + vuelos_prioridad_0
-        if candidatos:
-            candidatos.sort(key=lambda x: (
-                x['eta'] if x['tipo'] == 'ATERRIZAJE' else x['etd']
-            ))
-            return candidatos[0]
+        for nombre in ['aterrizajes_emergencia', 'despegues_emergencia', 'normales']:
+            vuelo = self.primero_de_cola(nombre)
+            if vuelo:
+                return vuelo
         
         return None
 
@@ -187,20 +242,25 @@ class SistemaAeropuerto:
         """Asigna una pista a un vuelo específico"""
         tiempo_fin = self.reloj_virtual + pista['tiempo_uso']
         
-        self.pistas_ocupadas.append({
+        self.pistas_ocupadas[pista['id_pista']] = {
             'id_pista': pista['id_pista'],
             'vuelo_id': vuelo['id'],
+            'tiempo_inicio': self.reloj_virtual,
             'tiempo_fin': tiempo_fin
-        })
+        }
+        self.asignaciones_realizadas += 1
+        heapq.heappush(self.liberaciones_pistas, (tiempo_fin, self.asignaciones_realizadas, pista['id_pista']))
         
         vuelo['estado'] = "ASIGNADO"
         vuelo['minuto_asignacion'] = self.reloj_virtual
         
         # Remover de la cola correspondiente
-        if vuelo in self.flujo_aterrizaje:
-            self.flujo_aterrizaje.remove(vuelo)
-        elif vuelo in self.flujo_despegue:
-            self.flujo_despegue.remove(vuelo)
+        orden = vuelo.get('orden_cola')
+        self.cola_de_vuelo.pop(orden, None)
+        if orden in self.flujo_aterrizaje:
+            del self.flujo_aterrizaje[orden]
+        elif orden in self.flujo_despegue:
+            del self.flujo_despegue[orden]
         
         self.registrar_evento("ASIGNACION", 
                             f"id_vuelo={vuelo['id']} pista={pista['id_pista']} tipo={vuelo['tipo']}")
@@ -222,21 +282,16 @@ class SistemaAeropuerto:
             f.write(f"- Tiempo simulado (min): {self.reloj_virtual}\n")
             f.write(f"- Vuelos atendidos: {len(self.vuelos_completados)}\n")
             
-            # Calcular tiempo medio de espera
+            # Tiempo medio de espera (entrada en cola -> asignación), acumulado al completar
             if self.vuelos_completados:
-                tiempos_espera = [v['minuto_asignacion'] - (v['eta'] if v['tipo'] == 'ATERRIZAJE' else v['etd']) 
-                                for v in self.vuelos_completados]
-                tiempo_medio = sum(tiempos_espera) / len(tiempos_espera)
+                tiempo_medio = self.espera_total / len(self.vuelos_completados)
                 f.write(f"- Tiempo medio de espera (min): {tiempo_medio:.1f}\n")
             
-            # Uso de pistas
-            operaciones_por_pista = {}
+            # Uso de pistas: operaciones completadas y minutos ocupada
             for pista in self.pistas:
-                count = len([po for po in self.pistas_ocupadas if po['id_pista'] == pista['id_pista']])
-                operaciones_por_pista[pista['id_pista']] = count
-            
-            for pista_id, count in operaciones_por_pista.items():
-                f.write(f"- Uso de pistas: {pista_id}={count} operaciones\n")
+                operaciones = self.operaciones_pistas.get(pista['id_pista'], 0)
+                minutos = self.minutos_ocupacion_pistas.get(pista['id_pista'], 0)
+                f.write(f"- Uso de pistas: {pista['id_pista']}={operaciones} operaciones ({minutos} min ocupada)\n")
             
             # Emergencias
             emergencias = len([v for v in self.vuelos_completados if v['prioridad'] == 2])
@@ -270,9 +325,9 @@ class SistemaAeropuerto:
             'pistas_ocupadas': len(self.pistas_ocupadas),
             'pistas_totales': len(self.pistas),
             'detalle_vuelos': self.vuelos,
-            'detalle_pistas': self.pistas_ocupadas,
-            'flujo_aterrizaje': self.flujo_aterrizaje,
-            'flujo_despegue': self.flujo_despegue
+            'detalle_pistas': list(self.pistas_ocupadas.values()),
+            'flujo_aterrizaje': list(self.flujo_aterrizaje.values()),
+            'flujo_despegue': list(self.flujo_despegue.values())
         }
 
     def detener_simulacion(self):
@@ -2,16 +2,65 @@ import time
 import threading
 from datetime import datetime, timedelta
 import csv
+import heapq
+from collections import deque
 from typing import List, Dict, Any
 
+class RegistroEventos:
+    """Log de eventos que solo añade líneas nuevas al archivo y guarda en memoria los últimos"""
+    def __init__(self, archivo: str = "simulacion.log", max_memoria: int = 1000, max_pendientes: int = 200):
+        self.archivo = archivo
+        self.ultimos = deque(maxlen=max_memoria)  # Cola acotada para mostrar los eventos recientes
+        self.total = 0  # Eventos registrados desde el inicio
+        self.pendientes = []  # Líneas aún no escritas en el archivo
+        self.max_pendientes = max_pendientes
+        self.iniciado = False  # La cabecera se escribe una sola vez, al primer volcado
+        self.cerrojo = threading.Lock()  # El hilo de simulación y el principal registran eventos
+
+    def agregar(self, evento: Dict):
+        """Guarda un evento y vuelca el búfer al archivo si está lleno"""
+        with self.cerrojo:
+            self.ultimos.append(evento)
+            self.total += 1
+            self.pendientes.append(f"[Min {evento['minuto']:04d}] [{evento['tipo']}] {evento['mensaje']}\n")
+            lleno = len(self.pendientes) >= self.max_pendientes
+        if lleno:
+            self.vaciar()
+
+    def vaciar(self):
+        """Añade al archivo las líneas pendientes; la primera vez lo crea con la cabecera"""
+        with self.cerrojo:
+            if not self.pendientes and self.iniciado:
+                return
+            try:
+                with open(self.archivo, "a" if self.iniciado else "w", encoding="utf-8") as file:
+                    if not self.iniciado:
+                        file.write("LOG DE SIMULACIÓN - SISTEMA AEROPUERTO\n")
+                        file.write("=" * 50 + "\n")
+                        self.iniciado = True
+                    file.writelines(self.pendientes)
+                self.pendientes.clear()
+            except Exception as e:
+                print(f"Error guardando log: {e}")
+
+    def __len__(self):
+        return self.total
+
+    def __iter__(self):
+        return iter(list(self.ultimos))
+
 class SistemaAeropuerto:
     def __init__(self):
         self.reloj_virtual = 0  # Minutos simulados desde el inicio
         self.en_ejecucion = False
-        self.eventos_log = []
+        self.eventos_log = RegistroEventos()  # Últimos eventos en memoria; el archivo solo crece
         self.vuelos = []  # Todos los vuelos cargados desde CSV
+        self.calendario_llegadas = []  # (minuto previsto, orden de carga, vuelo) de los vuelos pendientes
+        self.cursor_calendario = 0  # Entradas del calendario ya admitidas en cola
         self.pistas = []  # Pistas cargadas desde CSV
-        self.pistas_ocupadas = []  # Pistas actualmente ocupadas
+        self.pistas_ocupadas = {}  # Ocupación actual de cada pista, por id_pista
+        self.liberaciones_pistas = []  # Montículo (tiempo_fin, orden de asignación, id_pista)
+        self.asignaciones_realizadas = 0  # Contador para liberar en el orden de asignación
         
     def cargar_vuelos_desde_csv(self, archivo: str = "vuelos.csv"):
         """Carga los vuelos desde el archivo CSV al iniciar el programa"""
@@ -30,6 +79,7 @@ class SistemaAeropuerto:
                         'estado': row['estado']
                     }
                     self.vuelos.append(vuelo)
+            self.preparar_calendario_llegadas()
             self.registrar_evento("SISTEMA", f"Vuelos cargados: {len(self.vuelos)} vuelos desde {archivo}")
         except FileNotFoundError:
             self.registrar_evento("ERROR", f"Archivo {archivo} no encontrado")
@@ -63,6 +113,7 @@ class SistemaAeropuerto:
         
         self.en_ejecucion = True
         self.registrar_evento("SISTEMA", "Simulación iniciada")
+        self.guardar_log_archivo()
         print(f"Simulación iniciada. Reloj virtual: {self.reloj_virtual} minutos")
         
         # Hilo principal de simulación
@@ -99,6 +150,9 @@ class SistemaAeropuerto:
             
         except Exception as e:
             self.registrar_evento("ERROR", f"Error en actualización minuto {self.reloj_virtual}: {str(e)}")
+        finally:
+            # 7. Volcar al archivo los eventos de este minuto
+            self.guardar_log_archivo()
     
     def actualizar_combustible(self):
         """Actualiza el consumo de combustible de vuelos de aterrizaje en espera"""
@@ -125,32 +179,55 @@ class SistemaAeropuerto:
         """Libera pistas que han completado su tiempo de uso"""
         pistas_a_liberar = []
         
-        for pista_ocupada in self.pistas_ocupadas[:]:
-            if pista_ocupada['tiempo_fin'] <= self.reloj_virtual:
-                # Liberar pista
-                self.pistas_ocupadas.remove(pista_ocupada)
-                pistas_a_liberar.append(pista_ocupada['id_pista'])
-                
-                # Actualizar estado del vuelo
-                vuelo = self.buscar_vuelo_por_id(pista_ocupada['vuelo_id'])
-                if vuelo:
-                    vuelo['estado'] = "COMPLETADO"
-                
-                self.registrar_evento("PISTA", 
-                                    f"Pista {pista_ocupada['id_pista']} liberada - Vuelo {pista_ocupada['vuelo_id']} completado")
+        # Sacar del montículo las pistas cuyo tiempo de uso ha terminado
+        vencidas = []
+        while self.liberaciones_pistas and self.liberaciones_pistas[0][0] <= self.reloj_virtual:
+            vencidas.append(heapq.heappop(self.liberaciones_pistas))
+        vencidas.sort(key=lambda liberacion: liberacion[1])
+        
+        for _, _, id_pista in vencidas:
+            # Liberar pista
+            pista_ocupada = self.pistas_ocupadas.pop(id_pista)
+            pistas_a_liberar.append(id_pista)
+            
+            # Actualizar estado del vuelo
+            vuelo = self.buscar_vuelo_por_id(pista_ocupada['vuelo_id'])
+            if vuelo:
+                vuelo['estado'] = "COMPLETADO"
+            
+            self.registrar_evento("PISTA", 
+                                f"Pista {pista_ocupada['id_pista']} liberada - Vuelo {pista_ocupada['vuelo_id']} completado")
         
         return pistas_a_liberar
     
+    def preparar_calendario_llegadas(self):
+        """Ordena por ETA/ETD los vuelos que aún no han entrado en cola"""
+        pendientes = []
+        for indice, vuelo in enumerate(self.vuelos):
+            if vuelo['estado'] in ["EN_COLA", "ASIGNADO", "COMPLETADO", "CANCELADO"]:
+                continue
+            # Solo los aterrizajes con ETA y los despegues con ETD llegan a entrar en cola
+            hora_prevista = {'ATERRIZAJE': vuelo['eta'], 'DESPEGUE': vuelo['etd']}.get(vuelo['tipo'])
+            if hora_prevista is not None:
+                pendientes.append((hora_prevista, indice, vuelo))
+        pendientes.sort(key=lambda entrada: entrada[:2])
+        self.calendario_llegadas = pendientes
+        self.cursor_calendario = 0
+    
     def gestionar_colas_vuelos(self):
         """Gestiona la entrada de vuelos a cola según su ETA/ETD"""
         vuelos_entraron_cola = []
         
-        for vuelo in self.vuelos:
-            # Verificar si el vuelo debe entrar en cola según el reloj actual
-            if (vuelo['estado'] not in ["EN_COLA", "ASIGNADO", "COMPLETADO", "CANCELADO"] and
-                ((vuelo['tipo'] == "ATERRIZAJE" and vuelo['eta'] <= self.reloj_virtual) or
-                 (vuelo['tipo'] == "DESPEGUE" and vuelo['etd'] <= self.reloj_virtual))):
-                
+        # Avanzar el cursor hasta el primer vuelo que aún no toca
+        inicio = self.cursor_calendario
+        while (self.cursor_calendario < len(self.calendario_llegadas) and
+               self.calendario_llegadas[self.cursor_calendario][0] <= self.reloj_virtual):
+            self.cursor_calendario += 1
+        
+        # Admitirlos en el orden en que se cargaron
+        admitidos = sorted(self.calendario_llegadas[inicio:self.cursor_calendario], key=lambda entrada: entrada[1])
+        for _, _, vuelo in admitidos:
+            if vuelo['estado'] not in ["EN_COLA", "ASIGNADO", "COMPLETADO", "CANCELADO"]:
                 vuelo['estado'] = "EN_COLA"
                 vuelos_entraron_cola.append(vuelo['id'])
                 self.registrar_evento("VUELO", 
@@ -163,8 +240,7 @@ class SistemaAeropuerto:
         # Obtener pistas disponibles (habilitadas y no ocupadas)
         pistas_disponibles = [
             pista for pista in self.pistas 
-            if pista['habilitada'] and 
-            pista['id_pista'] not in [po['id_pista'] for po in self.pistas_ocupadas]
+            if pista['habilitada'] and pista['id_pista'] not in self.pistas_ocupadas
         ]
         
         # Obtener vuelos en cola ordenados por prioridad (emergencia primero)
@@ -184,12 +260,14 @@ class SistemaAeropuerto:
         """Asigna una pista específica a un vuelo"""
         tiempo_fin = self.reloj_virtual + pista['tiempo_uso']
         
-        # Registrar ocupación de pista
-        self.pistas_ocupadas.append({
+        # Registrar ocupación de pista y su liberación futura
+        self.pistas_ocupadas[pista['id_pista']] = {
             'id_pista': pista['id_pista'],
             'vuelo_id': vuelo['id'],
             'tiempo_fin': tiempo_fin
-        })
+        }
+        self.asignaciones_realizadas += 1
+        heapq.heappush(self.liberaciones_pistas, (tiempo_fin, self.asignaciones_realizadas, pista['id_pista']))
         
         # Actualizar estado del vuelo
         vuelo['estado'] = "ASIGNADO"
@@ -211,22 +289,13 @@ class SistemaAeropuerto:
             'tipo': tipo,
             'mensaje': mensaje
         }
-        self.eventos_log.append(evento)
-        
-        # Mostrar en consola y guardar en archivo
+        # Mostrar en consola; el archivo se actualiza al volcar el búfer
         print(f"[Min {self.reloj_virtual:04d}] [{tipo}] {mensaje}")
-        self.guardar_log_archivo()
+        self.eventos_log.agregar(evento)
     
     def guardar_log_archivo(self):
-        """Guarda el log completo en un archivo .log"""
-        try:
-            with open("simulacion.log", "w", encoding="utf-8") as file:
-                file.write("LOG DE SIMULACIÓN - SISTEMA AEROPUERTO\n")
-                file.write("=" * 50 + "\n")
-                for evento in self.eventos_log:
-                    file.write(f"[Min {evento['minuto']:04d}] [{evento['tipo']}] {evento['mensaje']}\n")
-        except Exception as e:
-            print(f"Error guardando log: {e}")
+        """Añade al archivo .log los eventos aún no guardados"""
+        self.eventos_log.vaciar()
     
     def mostrar_estado_actual(self):
         """Muestra el estado actual del sistema"""
@@ -246,6 +315,7 @@ class SistemaAeropuerto:
         """Detiene la simulación"""
         self.en_ejecucion = False
         self.registrar_evento("SISTEMA", "Simulación detenida")
+        self.guardar_log_archivo()
         print("Simulación detenida")
 
 # Función principal
@@ -0,0 +1,318 @@
+"""Batería de benchmarks del minuto simulado y de la carga de CSV por motor.
+
+Uso: python benchmark_motores.py [--vuelos N ...] [--pistas P ...] [--minutos M]
+                                 [--motores final reloj aeropuerto] [--max-v1 N]
+                                 [--salida resultados.json] [--comparar anterior.json]
+
+Mide tres motores con los mismos escenarios generados (semilla fija):
+  final       sistema_vuelos.MotorVuelos
+  reloj       SistemaAeropuerto de V1/reloj.py
+  aeropuerto  SistemaAeropuerto de V1/CONTROLADOR AEREOPRueba/sistema_aereopuerto.py
+
+Cada caso (motor, vuelos, pistas) corre en un proceso nuevo dentro de un
+directorio temporal, así el pico de memoria (ru_maxrss) es solo suyo. Se
+mide la carga de los CSV una vez y, por minuto, cada fase del ciclo en
+milisegundos de media, además de la selección del siguiente vuelo. Los
+motores V1 recorren todos los vuelos en cada fase y reescriben el log, así
+que por defecto solo se miden hasta --max-v1 vuelos.
+
+El resultado se guarda en JSON; con --comparar se marcan las fases que
+empeoran más de --tolerancia respecto a una ejecución anterior.
+"""
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Sin resource (Windows) no hay pico de memoria
+    resource = None
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+RUTA_V1 = os.path.join(DIRECTORIO, "..", "..", "CONTROLADOR AEREO V1", "CONTROLADOR AEREO V1")
+MODULOS_V1 = {
+    "reloj": os.path.join(RUTA_V1, "reloj.py"),
+    "aeropuerto": os.path.join(RUTA_V1, "CONTROLADOR AEREOPRueba", "sistema_aereopuerto.py"),
+}
+MOTORES = ["final", "reloj", "aeropuerto"]
+TAMANOS = [1_000, 10_000, 100_000, 1_000_000]
+NUM_PISTAS = [4, 32]
+MINUTOS = 10
+MAX_VUELOS_V1 = 10_000
+SELECCIONES = 1_000
+TOLERANCIA = 0.2
+CATEGORIAS = ["larga", "estandar", "corta"]
+
+# ========== ESCENARIOS ==========
+
+def generar_escenario(directorio, cantidad, num_pistas, semilla=1):
+    """Escribe los CSV del escenario y devuelve sus rutas (final, v1, pistas).
+
+    Los ETA/ETD se reparten en [0, cantidad] (un vuelo por minuto de media).
+    El CSV del motor final entra en cola al cargar; el de V1 usa PENDIENTE,
+    que es como esos motores incorporan los vuelos según el reloj.
+    """
+    rnd = random.Random(semilla * 1_000_003 + cantidad)
+    ruta_final = os.path.join(directorio, f"vuelos_final_{cantidad}.csv")
+    ruta_v1 = os.path.join(directorio, f"vuelos_v1_{cantidad}.csv")
+    ruta_pistas = os.path.join(directorio, f"pistas_{num_pistas}.csv")
+    if not os.path.exists(ruta_final):
+        with open(ruta_final, "w", encoding="utf-8") as final, open(ruta_v1, "w", encoding="utf-8") as v1:
+            final.write("id_vuelo,tipo,eta,etd,prioridad,combustible,estado\n")
+            v1.write("id,tipo,eta,etd,prioridad,combustible,estado\n")
+            for i in range(cantidad):
+                tiempo = rnd.randint(0, cantidad)
+                prioridad = rnd.choices([0, 1, 2], weights=[80, 15, 5])[0]
+                if rnd.random() < 0.5:
+                    fila = f"V{i:07d},ATERRIZAJE,{tiempo},,{prioridad},{rnd.randint(30, 600)}"
+                else:
+                    fila = f"V{i:07d},DESPEGUE,,{tiempo},{prioridad},"
+                final.write(f"{fila},EN_COLA\n")
+                v1.write(f"{fila},PENDIENTE\n")
+    if not os.path.exists(ruta_pistas):
+        with open(ruta_pistas, "w", encoding="utf-8") as f:
+            f.write("id_pista,categoria,tiempo_uso,habilitada\n")
+            for i in range(num_pistas):
+                f.write(f"R{i + 1},{CATEGORIAS[i % len(CATEGORIAS)]},3,1\n")
+    return ruta_final, ruta_v1, ruta_pistas
+
+# ========== MEDICIÓN DE UN CASO ==========
+
+class Cronometro:
+    """Acumula segundos por fase"""
+
+    def __init__(self):
+        self.fases = {}
+
+    @contextlib.contextmanager
+    def medir(self, fase):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.fases[fase] = self.fases.get(fase, 0.0) + time.perf_counter() - inicio
+
+def memoria_pico_mb():
+    """Pico de memoria residente del proceso en MB (None si no se puede medir)"""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux da KB y macOS bytes
+    return pico / (1024 * 1024) if sys.platform == "darwin" else pico / 1024
+
+def preparar_final(ruta_vuelos, ruta_pistas, cronometro):
+    """Carga el escenario en un MotorVuelos; devuelve (avanzar_reloj, fases, seleccionar)"""
+    sys.path.insert(0, DIRECTORIO)
+    import sistema_vuelos as sv
+    motor = sv.MotorVuelos()
+    motor.salida_consola = False
+    with cronometro.medir("carga_pistas"):
+        motor.cargar_pistas_desde_csv(ruta_pistas)
+    with cronometro.medir("carga_vuelos"):
+        motor.cargar_vuelos_desde_csv(ruta_vuelos)
+    with cronometro.medir("inicializar_flujos"):
+        motor.inicializar_flujos()
+
+    def avanzar_reloj():
+        motor.reloj_simulado += 1
+
+    # Las mismas fases y en el mismo orden que avanzar_minuto()
+    fases = [
+        ("consumir_combustible", motor.consumir_combustible),
+        ("actualizar_prioridades", motor.actualizar_prioridades_combustible),
+        ("liberar_pistas", motor.liberar_pistas_completadas),
+        ("asignar_pistas", motor.asignar_pistas_libres),
+        ("incorporar_vuelos", motor.incorporar_vuelos_programados),
+    ]
+    return avanzar_reloj, fases, motor.obtener_siguiente_vuelo
+
+def cargar_modulo_v1(motor):
+    """Importa un motor V1 desde su archivo (los dos se llaman SistemaAeropuerto)"""
+    spec = importlib.util.spec_from_file_location(f"{motor}_v1", MODULOS_V1[motor])
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+def preparar_reloj(ruta_vuelos, ruta_pistas, cronometro):
+    """Carga el escenario en el SistemaAeropuerto de reloj.py"""
+    sistema = cargar_modulo_v1("reloj").SistemaAeropuerto()
+    with cronometro.medir("carga_pistas"):
+        sistema.cargar_pistas_desde_csv(ruta_pistas)
+    with cronometro.medir("carga_vuelos"):
+        sistema.cargar_vuelos_desde_csv(ruta_vuelos)
+
+    def avanzar_reloj():
+        sistema.reloj_virtual += 1
+
+    # Las mismas fases y en el mismo orden que ejecutar_actualizaciones()
+    fases = [
+        ("actualizar_combustible", sistema.actualizar_combustible),
+        ("liberar_pistas", sistema.liberar_pistas),
+        ("gestionar_colas", sistema.gestionar_colas_vuelos),
+        ("asignar_pistas", sistema.asignar_pistas_disponibles),
+        ("mostrar_estado", sistema.mostrar_estado_actual),
+        ("registrar_ciclo", lambda: sistema.registrar_evento("RELÓJ", f"Ciclo completado - Minuto {sistema.reloj_virtual}")),
+    ]
+    return avanzar_reloj, fases, None
+
+def preparar_aeropuerto(ruta_vuelos, ruta_pistas, cronometro):
+    """Carga el escenario en el SistemaAeropuerto de sistema_aereopuerto.py"""
+    sistema = cargar_modulo_v1("aeropuerto").SistemaAeropuerto()
+    with cronometro.medir("carga_pistas"):
+        sistema.cargar_pistas_desde_csv(ruta_pistas)
+    with cronometro.medir("carga_vuelos"):
+        sistema.cargar_vuelos_desde_csv(ruta_vuelos)
+
+    def avanzar_reloj():
+        sistema.reloj_virtual += 1
+
+    # Las mismas fases y en el mismo orden que ejecutar_ciclo_simulacion()
+    fases = [
+        ("actualizar_combustible", sistema.actualizar_combustible),
+        ("gestionar_colas", sistema.gestionar_entrada_colas),
+        ("liberar_pistas", sistema.liberar_pistas),
+        ("asignar_pistas", sistema.asignar_pistas),
+        ("registrar_ciclo", lambda: sistema.registrar_evento("CICLO", f"Minuto {sistema.reloj_virtual} completado")),
+    ]
+    return avanzar_reloj, fases, sistema.seleccionar_proximo_vuelo
+
+PREPARAR = {"final": preparar_final, "reloj": preparar_reloj, "aeropuerto": preparar_aeropuerto}
+
+def medir_caso(motor, ruta_vuelos, ruta_pistas, minutos):
+    """Mide un caso en este proceso y devuelve sus resultados (sin vuelos ni pistas)"""
+    memoria_base = memoria_pico_mb()
+    carga = Cronometro()
+    ciclo = Cronometro()
+    # Los motores imprimen cada evento: la salida no forma parte de la medida
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        avanzar_reloj, fases, seleccionar = PREPARAR[motor](ruta_vuelos, ruta_pistas, carga)
+        for _ in range(minutos):
+            avanzar_reloj()
+            with ciclo.medir("minuto"):
+                for fase, funcion in fases:
+                    with ciclo.medir(fase):
+                        funcion()
+        seleccion_us = None
+        if seleccionar is not None:
+            inicio = time.perf_counter()
+            for _ in range(SELECCIONES):
+                seleccionar()
+            seleccion_us = (time.perf_counter() - inicio) / SELECCIONES * 1e6
+    if motor == "final":
+        import sistema_vuelos as sv
+        sv.vaciar_log()
+    return {
+        "carga_ms": {fase: s * 1e3 for fase, s in carga.fases.items()},
+        "minuto_ms": {fase: s * 1e3 / minutos for fase, s in ciclo.fases.items()} if minutos else {},
+        "seleccion_us": seleccion_us,
+        "memoria_base_mb": memoria_base,
+        "memoria_pico_mb": memoria_pico_mb(),
+    }
+
+def ejecutar_caso(motor, cantidad, num_pistas, minutos, directorio):
+    """Lanza un caso en un proceso nuevo y devuelve su fila de resultados"""
+    ruta_final, ruta_v1, ruta_pistas = generar_escenario(directorio, cantidad, num_pistas)
+    ruta_vuelos = ruta_final if motor == "final" else ruta_v1
+    caso = tempfile.mkdtemp(dir=directorio)  # Aquí escribe cada motor sus logs
+    salida = subprocess.run([sys.executable, os.path.abspath(__file__), "--caso", motor,
+                             ruta_vuelos, ruta_pistas, str(minutos)],
+                            cwd=caso, capture_output=True, text=True, check=True)
+    fila = {"motor": motor, "vuelos": cantidad, "pistas": num_pistas, "minutos": minutos}
+    fila.update(json.loads(salida.stdout.splitlines()[-1]))
+    return fila
+
+# ========== INFORME Y COMPARACIÓN ==========
+
+def clave_caso(fila):
+    return (fila["motor"], fila["vuelos"], fila["pistas"])
+
+def imprimir_fila(fila):
+    minuto = fila["minuto_ms"].get("minuto", 0.0)
+    carga = sum(fila["carga_ms"].values())
+    seleccion = "-" if fila["seleccion_us"] is None else f"{fila['seleccion_us']:.2f}"
+    memoria = "-" if fila["memoria_pico_mb"] is None else f"{fila['memoria_pico_mb']:.1f}"
+    print(f"{fila['motor']:>10} {fila['vuelos']:>9} {fila['pistas']:>6} {carga:>12.1f} "
+          f"{minuto:>12.3f} {seleccion:>10} {memoria:>10}", flush=True)
+
+def comparar(resultados, anterior, tolerancia=TOLERANCIA):
+    """Devuelve las líneas de las fases que empeoran más de `tolerancia` (0.2 = 20 %)"""
+    previos = {clave_caso(f): f for f in anterior["resultados"]}
+    avisos = []
+    for fila in resultados:
+        previa = previos.get(clave_caso(fila))
+        if previa is None:
+            continue
+        for grupo in ("carga_ms", "minuto_ms"):
+            for fase, valor in fila[grupo].items():
+                antes = previa[grupo].get(fase)
+                if antes and valor > antes * (1 + tolerancia):
+                    avisos.append(f"{fila['motor']} vuelos={fila['vuelos']} pistas={fila['pistas']} "
+                                  f"{grupo}.{fase}: {antes:.3f} -> {valor:.3f} (x{valor / antes:.2f})")
+    return avisos
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de los motores de simulación")
+    parser.add_argument("--vuelos", type=int, nargs="+", default=TAMANOS, help="tamaños de flota")
+    parser.add_argument("--pistas", type=int, nargs="+", default=NUM_PISTAS, help="números de pistas")
+    parser.add_argument("--minutos", type=int, default=MINUTOS, help="minutos simulados por caso")
+    parser.add_argument("--motores", nargs="+", choices=MOTORES, default=MOTORES, help="motores a medir")
+    parser.add_argument("--max-v1", type=int, default=MAX_VUELOS_V1,
+                        help="flota máxima para los motores V1 (recorren todos los vuelos)")
+    parser.add_argument("--salida", default="benchmark_motores.json", help="JSON de resultados")
+    parser.add_argument("--comparar", metavar="JSON", help="resultados anteriores con los que comparar")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA,
+                        help="empeoramiento admitido al comparar (0.2 = 20 %%)")
+    parser.add_argument("--caso", nargs=4, metavar=("MOTOR", "VUELOS", "PISTAS", "MINUTOS"),
+                        help=argparse.SUPPRESS)
+    argumentos = parser.parse_args(argv)
+
+    if argumentos.caso:
+        # Proceso hijo: mide un caso e imprime el resultado como JSON
+        motor, ruta_vuelos, ruta_pistas, minutos = argumentos.caso
+        print(json.dumps(medir_caso(motor, ruta_vuelos, ruta_pistas, int(minutos))))
+        return 0
+
+    resultados = []
+    print(f"{'MOTOR':>10} {'VUELOS':>9} {'PISTAS':>6} {'CARGA (ms)':>12} {'MINUTO (ms)':>12} "
+          f"{'SELEC (µs)':>10} {'PICO (MB)':>10}")
+    with tempfile.TemporaryDirectory() as directorio:
+        for cantidad in sorted(argumentos.vuelos):
+            for num_pistas in argumentos.pistas:
+                for motor in argumentos.motores:
+                    if motor != "final" and cantidad > argumentos.max_v1:
+                        continue
+                    fila = ejecutar_caso(motor, cantidad, num_pistas, argumentos.minutos, directorio)
+                    imprimir_fila(fila)
+                    resultados.append(fila)
+
+    informe = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+    with open(argumentos.salida, "w", encoding="utf-8") as f:
+        json.dump(informe, f, indent=2)
+    print(f"Resultados guardados en {argumentos.salida}")
+
+    if argumentos.comparar:
+        with open(argumentos.comparar, encoding="utf-8") as f:
+            avisos = comparar(resultados, json.load(f), argumentos.tolerancia)
+        for aviso in avisos:
+            print(f"REGRESIÓN {aviso}")
+        if avisos:
+            return 1
+        print("Sin regresiones")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""Benchmark del coste por minuto de sistema_vuelos según el número de vuelos.
+
+Uso: python benchmark_vuelos.py [max_vuelos] [columnar]
+
+Mide el coste de actualizar_estado_vuelo() y de las fases de liberación y
+despacho de cada minuto simulado, que son las que cambian el estado de los
+vuelos. Con los índices por id ambas deben mantenerse planas de 1k a 1M.
+Con "columnar" el minuto completo usa el almacén NumPy (requiere NumPy).
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+import sistema_vuelos as sv
+
+TAMANOS = [1_000, 10_000, 100_000, 1_000_000]
+NUM_PISTAS = 10
+MINUTOS = 20
+CAMBIOS_ESTADO = 2_000
+
+def preparar_escenario(cantidad, semilla=1, columnar=False):
+    """Devuelve un motor con `cantidad` vuelos en cola y NUM_PISTAS pistas.
+
+    La programación se alarga con la flota (un vuelo por minuto de media),
+    como un calendario real, en lugar de concentrar todos los ETA/ETD.
+    """
+    rnd = random.Random(semilla)
+    motor = sv.MotorVuelos()
+    motor.salida_consola = False  # Pintar el estado no forma parte de la medida
+    motor.pistas = [sv.Pista(f"R{i + 1}", "larga", 3, 1) for i in range(NUM_PISTAS)]
+    motor.indexar_pistas()
+    for i in range(cantidad):
+        if rnd.random() < 0.5:
+            vuelo = sv.Vuelo(f"V{i:07d}", "ATERRIZAJE", rnd.randint(0, cantidad), 0, rnd.randint(30, 600), "EN_COLA")
+        else:
+            vuelo = sv.Vuelo(f"V{i:07d}", "DESPEGUE", rnd.randint(0, cantidad), 0, 0, "EN_COLA")
+        motor.vuelos.append(vuelo)
+    sv.indexar_vuelos(motor.vuelos, motor.indice_vuelos)
+    motor.contadores_vuelos.reconstruir(motor.vuelos)
+    motor.inicializar_flujos()
+    if columnar:
+        motor.activar_almacen_columnar()
+    return motor
+
+def medir(cantidad, columnar=False):
+    """Devuelve (µs por cambio de estado, ms por liberación+despacho, ms por minuto).
+
+    Cada minuto avanza el reloj una vez y ejecuta las fases de avanzar_minuto()
+    en su orden, midiendo por separado la liberación y el despacho.
+    """
+    motor = preparar_escenario(cantidad, columnar=columnar)
+    rnd = random.Random(2)
+    ids = [motor.vuelos[rnd.randrange(cantidad)][sv.ID] for _ in range(CAMBIOS_ESTADO)]
+
+    inicio = time.perf_counter()
+    for id_vuelo in ids:
+        motor.actualizar_estado_vuelo(id_vuelo, "ASIGNADO")
+        motor.actualizar_estado_vuelo(id_vuelo, "EN_COLA")
+    cambio_us = (time.perf_counter() - inicio) / (2 * len(ids)) * 1e6
+
+    despacho = 0.0
+    minuto = 0.0
+    for _ in range(MINUTOS):
+        motor.reloj_simulado += 1
+        inicio = time.perf_counter()
+        motor.consumir_combustible()
+        motor.actualizar_prioridades_combustible()
+        inicio_despacho = time.perf_counter()
+        motor.liberar_pistas_completadas()
+        motor.asignar_pistas_libres()
+        despacho += time.perf_counter() - inicio_despacho
+        motor.incorporar_vuelos_programados()
+        minuto += time.perf_counter() - inicio
+    return cambio_us, despacho / MINUTOS * 1e3, minuto / MINUTOS * 1e3
+
+def main():
+    max_vuelos = int(sys.argv[1]) if len(sys.argv) > 1 else TAMANOS[-1]
+    columnar = len(sys.argv) > 2 and sys.argv[2] == "columnar"
+    directorio_original = os.getcwd()
+    with tempfile.TemporaryDirectory() as directorio:
+        # Los logs del motor se escriben en un directorio temporal
+        os.chdir(directorio)
+        try:
+            print(f"{'VUELOS':>10} {'ESTADO (µs)':>12} {'LIB+DESP (ms)':>14} {'MINUTO (ms)':>12}")
+            for cantidad in TAMANOS:
+                if cantidad > max_vuelos:
+                    break
+                with contextlib.redirect_stdout(io.StringIO()):
+                    cambio, despacho, minuto = medir(cantidad, columnar)
+                print(f"{cantidad:>10} {cambio:>12.2f} {despacho:>14.3f} {minuto:>12.3f}")
+        finally:
+            # Volcar el log pendiente antes de borrar el directorio temporal
+            sv.vaciar_log()
+            os.chdir(directorio_original)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Réplicas Monte Carlo de días de tráfico aleatorio para dimensionar pistas.
+
+Uso: python montecarlo_vuelos.py [--replicas N] [--minutos M] [--llegadas L]
+                                 [--runways pistas.csv] [--semilla S] [--procesos P] [--csv archivo]
+
+Cada réplica crea su propio MotorVuelos con las pistas del CSV y, minuto
+a minuto, da de alta vuelos con generar_vuelos_automaticos(). Cada réplica usa
+su propio flujo aleatorio, derivado de la semilla base y de su número, así
+que los resultados son reproducibles sea cual sea el reparto entre procesos.
+Las réplicas se reparten entre procesos para usar todos los núcleos y al
+final se imprime una tabla.
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+import sistema_vuelos as sv
+
+COLUMNAS = [
+    ("replica", "RÉPLICA", "d"),
+    ("generados", "VUELOS", "d"),
+    ("completados", "COMPLETADOS", "d"),
+    ("por_hora", "VUELOS/H", ".2f"),
+    ("espera_media", "ESPERA MEDIA", ".2f"),
+    ("espera_maxima", "ESPERA MÁX", "d"),
+    ("emergencias", "EMERGENCIAS", "d"),
+    ("utilizacion", "USO PISTAS %", ".1f"),
+    ("pendientes", "EN COLA", "d"),
+]
+
+def semilla_replica(semilla_base, replica):
+    """Semilla de una réplica; las cadenas se siembran con SHA-512, así que los flujos no se solapan"""
+    return f"{semilla_base}-{replica}"
+
+def simular_replica(semilla_base, replica, minutos, llegadas, archivo_pistas):
+    """Simula un día de tráfico en un motor propio y devuelve sus métricas en un diccionario"""
+    # El log de las réplicas no interesa: se descarta
+    motor = sv.MotorVuelos(archivo_log=os.devnull, semilla=semilla_replica(semilla_base, replica))
+    motor.salida_consola = False
+    with contextlib.redirect_stdout(io.StringIO()):
+        motor.cargar_pistas_desde_csv(archivo_pistas)
+        generados = 0
+        emergencias_iniciales = 0
+        minutos_ocupados = 0
+        for _ in range(minutos):
+            cantidad = motor.generador_aleatorio.randint(0, 2 * llegadas)
+            # Solo cuentan los vuelos dados de alta: sin ids libres se descartan algunos
+            emergencias_antes = motor.contadores_vuelos.contar("prioridad", 2)
+            generados += motor.generar_vuelos_automaticos(cantidad)
+            emergencias_iniciales += motor.contadores_vuelos.contar("prioridad", 2) - emergencias_antes
+            motor.avanzar_minuto()
+            minutos_ocupados += motor.contadores_pistas.contar("estado", "OCUPADA")
+    # Espera de los vuelos atendidos, como en generar_informe(): de la entrada en cola a la asignación
+    esperas = [asignacion - entrada for _, _, _, entrada, asignacion, _ in motor.vuelos_atendidos]
+    habilitadas = motor.contadores_pistas.contar("habilitada", 1)
+    completados = motor.contadores_vuelos.contar("estado", "COMPLETADO")
+    return {
+        "replica": replica,
+        "generados": generados,
+        "completados": completados,
+        "por_hora": completados * 60 / minutos if minutos else 0.0,
+        "espera_media": statistics.fmean(esperas) if esperas else 0.0,
+        "espera_maxima": max(esperas, default=0),
+        "emergencias": motor.contadores_vuelos.contar("prioridad", 2) - emergencias_iniciales,
+        "utilizacion": 100 * minutos_ocupados / (minutos * habilitadas) if minutos and habilitadas else 0.0,
+        "pendientes": motor.contadores_vuelos.contar("estado", "EN_COLA"),
+    }
+
+def ejecutar_replicas(replicas, minutos, llegadas, archivo_pistas, semilla_base=0, procesos=None):
+    """Reparte las réplicas entre procesos y devuelve sus métricas ordenadas por réplica"""
+    archivo_pistas = os.path.abspath(archivo_pistas)
+    numeros = range(replicas)
+    with ProcessPoolExecutor(max_workers=procesos or os.cpu_count()) as ejecutor:
+        resultados = ejecutor.map(simular_replica, [semilla_base] * replicas, numeros,
+                                  [minutos] * replicas, [llegadas] * replicas,
+                                  [archivo_pistas] * replicas)
+        return list(resultados)
+
+def imprimir_tabla(resultados):
+    """Imprime una fila por réplica y la media de cada columna"""
+    anchos = [max(len(titulo), 8) for _, titulo, _ in COLUMNAS]
+    print(" ".join(f"{titulo:>{ancho}}" for (_, titulo, _), ancho in zip(COLUMNAS, anchos)))
+    for fila in resultados:
+        print(" ".join(f"{fila[campo]:>{ancho}{formato}}" for (campo, _, formato), ancho in zip(COLUMNAS, anchos)))
+    if resultados:
+        medias = ["MEDIA"] + [f"{statistics.fmean(f[campo] for f in resultados):.2f}" for campo, _, _ in COLUMNAS[1:]]
+        print(" ".join(f"{valor:>{ancho}}" for valor, ancho in zip(medias, anchos)))
+
+def guardar_csv(resultados, archivo):
+    """Escribe la tabla de resultados en CSV"""
+    with open(archivo, "w", encoding="utf-8") as f:
+        f.write(",".join(campo for campo, _, _ in COLUMNAS) + "\n")
+        for fila in resultados:
+            f.write(",".join(str(fila[campo]) for campo, _, _ in COLUMNAS) + "\n")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Réplicas Monte Carlo de días de tráfico")
+    parser.add_argument("--replicas", type=int, default=20, help="número de réplicas")
+    parser.add_argument("--minutos", type=int, default=1440, help="minutos simulados por réplica")
+    parser.add_argument("--llegadas", type=int, default=1, help="vuelos nuevos por minuto (media)")
+    parser.add_argument("--runways", default="pistas.csv", help="CSV de pistas (por defecto pistas.csv)")
+    parser.add_argument("--semilla", type=int, default=0, help="semilla base de las réplicas")
+    parser.add_argument("--procesos", type=int, help="procesos en paralelo (por defecto todos los núcleos)")
+    parser.add_argument("--csv", help="guardar también la tabla en este CSV")
+    argumentos = parser.parse_args(argv)
+    resultados = ejecutar_replicas(argumentos.replicas, argumentos.minutos, argumentos.llegadas,
+                                   argumentos.runways, argumentos.semilla, argumentos.procesos)
+    imprimir_tabla(resultados)
+    if argumentos.csv:
+        guardar_csv(resultados, argumentos.csv)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""Red de aeropuertos: cada uno en su propio proceso y sus despegues aterrizan en otro.
+
+Uso: python red_aeropuertos.py red.csv rutas.csv --minutos M [--streaming VENTANA]
+                               [--salida DIR] [--en-proceso]
+
+red.csv tiene las columnas aeropuerto,vuelos,pistas (rutas relativas a
+red.csv; valen los CSV o las tablas binarias de sistema_vuelos). rutas.csv
+tiene origen,destino,tiempo_vuelo,combustible. Cada despegue completado en
+un aeropuerto con rutas sale por la siguiente de ellas (por turnos) y entra
+en la cola de aterrizaje del destino tiempo_vuelo minutos después, con el
+combustible de la ruta.
+
+Sincronización conservadora: el vuelo más corto de la red (lookahead) fija
+el tamaño de las ventanas. Un despegue dentro de una ventana no puede
+aterrizar antes de que empiece la siguiente, así que todos los aeropuertos
+simulan cada ventana a la vez sin esperarse y solo se intercambian los
+traspasos al cerrarla. El resultado es el mismo con procesos o sin ellos.
+"""
+import argparse
+import contextlib
+import csv
+import heapq
+import io
+import multiprocessing
+import os
+import sys
+import time
+
+import sistema_vuelos as sv
+
+COLUMNAS = [
+    ("aeropuerto", "AEROPUERTO", "s"),
+    ("vuelos", "VUELOS", "d"),
+    ("completados", "COMPLETADOS", "d"),
+    ("en_cola", "EN COLA", "d"),
+    ("salidas", "SALIDAS RED", "d"),
+    ("llegadas", "LLEGADAS RED", "d"),
+    ("cpu", "CPU (s)", ".2f"),
+]
+
+def leer_red(archivo):
+    """Devuelve [(aeropuerto, vuelos, pistas)] con las rutas de archivo resueltas"""
+    directorio = os.path.dirname(os.path.abspath(archivo))
+    with open(archivo, "r", encoding="utf-8", newline="") as f:
+        return [(fila["aeropuerto"].strip(), os.path.join(directorio, fila["vuelos"].strip()),
+                 os.path.join(directorio, fila["pistas"].strip()))
+                for fila in csv.DictReader(f)]
+
+def leer_rutas(archivo, aeropuertos):
+    """Devuelve {origen: [(destino, tiempo_vuelo, combustible)]} en el orden del archivo"""
+    rutas = {}
+    with open(archivo, "r", encoding="utf-8", newline="") as f:
+        for numero_linea, fila in enumerate(csv.DictReader(f), start=2):
+            origen, destino = fila["origen"].strip(), fila["destino"].strip()
+            tiempo_vuelo, combustible = int(fila["tiempo_vuelo"]), int(fila["combustible"])
+            if origen not in aeropuertos or destino not in aeropuertos:
+                raise ValueError(f"Ruta de la línea {numero_linea} con un aeropuerto fuera de la red")
+            if tiempo_vuelo < 1:
+                raise ValueError(f"Ruta de la línea {numero_linea}: el tiempo de vuelo debe ser >= 1")
+            rutas.setdefault(origen, []).append((destino, tiempo_vuelo, combustible))
+    return rutas
+
+class Aeropuerto:
+    """Motor de un aeropuerto y sus llegadas de red pendientes.
+
+    Los archivos del motor (eventos.log, informe.log) van a su directorio.
+    """
+
+    def __init__(self, nombre, archivo_vuelos, archivo_pistas, directorio, ventana=None):
+        self.nombre = nombre
+        self.directorio = directorio
+        os.makedirs(directorio, exist_ok=True)
+        # El log se vacía del anterior: es el de esta ejecución
+        self.archivo_log = os.path.join(directorio, "eventos.log")
+        open(self.archivo_log, "w").close()
+        self.motor = sv.MotorVuelos(archivo_log=self.archivo_log,
+                                    archivo_informe=os.path.join(directorio, "informe.log"))
+        self.motor.salida_consola = False
+        self.motor.cargar_pistas_desde_csv(archivo_pistas)
+        if ventana is None:
+            self.motor.cargar_vuelos_desde_csv(archivo_vuelos)
+            self.motor.inicializar_flujos()
+        else:
+            self.motor.cargar_vuelos_en_streaming(archivo_vuelos, ventana)
+        self.motor.registrar_log(f"Sistema iniciado aeropuerto={nombre}")
+        self.llegadas = []  # Montículo (minuto, secuencia, id, origen, combustible)
+        self.recibidas = 0
+        self.enviadas = 0
+        self.cpu = 0.0
+
+    def despegues_que_terminan(self):
+        """Ids de los despegues cuya pista se libera en el próximo minuto, en orden de la lista"""
+        motor = self.motor
+        minuto = motor.reloj_simulado + 1
+        return [pista[sv.PISTA_VUELO_ACTUAL] for pista in motor.pistas
+                if pista[sv.PISTA_ESTADO] == "OCUPADA" and pista[sv.PISTA_TIEMPO_LIBERACION] is not None
+                and pista[sv.PISTA_TIEMPO_LIBERACION] <= minuto
+                and motor.indice_vuelos[pista[sv.PISTA_VUELO_ACTUAL]][sv.TIPO] == "DESPEGUE"]
+
+    def incorporar_llegadas(self):
+        """Encola las llegadas de red que aterrizan en el minuto siguiente"""
+        motor = self.motor
+        while self.llegadas and self.llegadas[0][0] <= motor.reloj_simulado + 1:
+            _, _, id_vuelo, origen, combustible = heapq.heappop(self.llegadas)
+            if not motor.registrar_vuelo(sv.Vuelo(id_vuelo, "ATERRIZAJE", motor.reloj_simulado + 1, 0, combustible, "EN_COLA")):
+                continue
+            motor.registrar_log(f"EN_COLA id_vuelo={id_vuelo} tipo=ATERRIZAJE origen={origen}")
+            self.recibidas += 1
+
+    def avanzar(self, hasta, llegadas):
+        """Simula hasta el minuto `hasta` y devuelve los despegues [(minuto, id)] en orden"""
+        inicio = time.process_time()
+        for llegada in llegadas:
+            heapq.heappush(self.llegadas, llegada)
+        salidas = []
+        while self.motor.reloj_simulado < hasta:
+            self.incorporar_llegadas()
+            despegues = self.despegues_que_terminan()
+            self.motor.avanzar_minuto()
+            salidas.extend((self.motor.reloj_simulado, id_vuelo) for id_vuelo in despegues)
+        self.enviadas += len(salidas)
+        self.cpu += time.process_time() - inicio
+        return salidas
+
+    def terminar(self):
+        """Escribe informe.log y el final del log, y devuelve el resumen del aeropuerto"""
+        motor = self.motor
+        motor.generar_informe()
+        motor.registrar_log("Sistema finalizado")
+        sv.vaciar_log(durable=True)
+        return {
+            "aeropuerto": self.nombre,
+            "vuelos": motor.contadores_vuelos.total,
+            "completados": motor.contadores_vuelos.contar("estado", "COMPLETADO"),
+            "en_cola": motor.contadores_vuelos.contar("estado", "EN_COLA"),
+            "salidas": self.enviadas,
+            "llegadas": self.recibidas,
+            "en_vuelo": len(self.llegadas),
+            "cpu": self.cpu,
+        }
+
+def trabajador(conexion, nombre, archivo_vuelos, archivo_pistas, directorio, ventana):
+    """Bucle de un proceso de aeropuerto: atiende órdenes hasta recibir 'terminar'"""
+    # Los avisos de carga e informe no deben mezclarse con la tabla del coordinador
+    sys.stdout = open(os.devnull, "w")
+    aeropuerto = Aeropuerto(nombre, archivo_vuelos, archivo_pistas, directorio, ventana)
+    while True:
+        orden, *argumentos = conexion.recv()
+        if orden == "avanzar":
+            conexion.send(aeropuerto.avanzar(*argumentos))
+        else:
+            conexion.send(aeropuerto.terminar())
+            break
+    conexion.close()
+
+class AeropuertoLocal:
+    """Aeropuerto simulado en el proceso del coordinador (para depurar o comparar)"""
+
+    def __init__(self, nombre, archivo_vuelos, archivo_pistas, directorio, ventana=None):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self._aeropuerto = Aeropuerto(nombre, archivo_vuelos, archivo_pistas, directorio, ventana)
+        self._respuesta = None
+
+    def enviar(self, orden, *argumentos):
+        with contextlib.redirect_stdout(io.StringIO()):
+            if orden == "avanzar":
+                self._respuesta = self._aeropuerto.avanzar(*argumentos)
+            else:
+                self._respuesta = self._aeropuerto.terminar()
+
+    def recibir(self):
+        return self._respuesta
+
+    def cerrar(self):
+        pass
+
+class AeropuertoRemoto:
+    """Aeropuerto simulado en su propio proceso; las órdenes van por una tubería"""
+
+    def __init__(self, nombre, archivo_vuelos, archivo_pistas, directorio, ventana=None):
+        self._conexion, extremo = multiprocessing.Pipe()
+        self._proceso = multiprocessing.Process(target=trabajador, name=f"aeropuerto-{nombre}",
+                                                args=(extremo, nombre, archivo_vuelos, archivo_pistas,
+                                                      directorio, ventana))
+        self._proceso.start()
+        extremo.close()
+
+    def enviar(self, orden, *argumentos):
+        self._conexion.send((orden, *argumentos))
+
+    def recibir(self):
+        return self._conexion.recv()
+
+    def cerrar(self):
+        self._conexion.close()
+        self._proceso.join()
+
+def simular_red(red, rutas, minutos, salida="red", en_proceso=False, ventana=None):
+    """Simula la red por ventanas de lookahead y devuelve el resumen de cada aeropuerto.
+
+    Con ventana cada aeropuerto carga sus vuelos por streaming con esa antelación.
+    """
+    clase = AeropuertoLocal if en_proceso else AeropuertoRemoto
+    aeropuertos = {nombre: clase(nombre, vuelos, pistas, os.path.join(os.path.abspath(salida), nombre), ventana)
+                   for nombre, vuelos, pistas in red}
+    lookahead = min((tiempo for destinos in rutas.values() for _, tiempo, _ in destinos), default=max(minutos, 1))
+    turnos = {nombre: 0 for nombre in aeropuertos}  # Siguiente ruta de cada origen
+    pendientes = {nombre: [] for nombre in aeropuertos}
+    secuencia = 0  # Desempate estable de las llegadas al mismo minuto
+    reloj = 0
+    while reloj < minutos:
+        hasta = min(reloj + lookahead, minutos)
+        # Todos simulan la ventana a la vez; ningún traspaso de ella aterriza antes de `hasta`
+        for nombre, aeropuerto in aeropuertos.items():
+            aeropuerto.enviar("avanzar", hasta, pendientes[nombre])
+            pendientes[nombre] = []
+        for nombre, aeropuerto in aeropuertos.items():
+            destinos = rutas.get(nombre)
+            for minuto, id_vuelo in aeropuerto.recibir():
+                if not destinos:
+                    continue
+                destino, tiempo_vuelo, combustible = destinos[turnos[nombre] % len(destinos)]
+                turnos[nombre] += 1
+                pendientes[destino].append((minuto + tiempo_vuelo, secuencia, f"{id_vuelo}@{nombre}", nombre, combustible))
+                secuencia += 1
+        reloj = hasta
+    for aeropuerto in aeropuertos.values():
+        aeropuerto.enviar("terminar")
+    resumenes = [aeropuerto.recibir() for aeropuerto in aeropuertos.values()]
+    for aeropuerto in aeropuertos.values():
+        aeropuerto.cerrar()
+    # Los traspasos de la última ventana que no llegaron a entregarse siguen en vuelo
+    for resumen in resumenes:
+        resumen["en_vuelo"] += len(pendientes[resumen["aeropuerto"]])
+    return resumenes
+
+def imprimir_tabla(resumenes):
+    """Imprime una fila por aeropuerto y el total de la red"""
+    anchos = [max(len(titulo), 10) for _, titulo, _ in COLUMNAS]
+    print(" ".join(f"{titulo:>{ancho}}" for (_, titulo, _), ancho in zip(COLUMNAS, anchos)))
+    for fila in resumenes:
+        print(" ".join(f"{fila[campo]:>{ancho}{formato}}" for (campo, _, formato), ancho in zip(COLUMNAS, anchos)))
+    totales = {"aeropuerto": "RED"}
+    for campo, _, _ in COLUMNAS[1:]:
+        totales[campo] = sum(fila[campo] for fila in resumenes)
+    print(" ".join(f"{totales[campo]:>{ancho}{formato}}" for (campo, _, formato), ancho in zip(COLUMNAS, anchos)))
+    print(f"En vuelo al terminar: {sum(fila['en_vuelo'] for fila in resumenes)}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Red de aeropuertos simulados en paralelo")
+    parser.add_argument("red", help="CSV aeropuerto,vuelos,pistas")
+    parser.add_argument("rutas", help="CSV origen,destino,tiempo_vuelo,combustible")
+    parser.add_argument("--minutos", type=int, required=True, help="minutos a simular")
+    parser.add_argument("--streaming", type=int, metavar="VENTANA", dest="ventana",
+                        help="cargar los vuelos de cada aeropuerto por streaming, VENTANA minutos antes")
+    parser.add_argument("--salida", default="red", help="directorio con un subdirectorio de logs por aeropuerto")
+    parser.add_argument("--en-proceso", action="store_true",
+                        help="simular todos los aeropuertos en este proceso (sin paralelismo)")
+    argumentos = parser.parse_args(argv)
+    if argumentos.minutos < 0:
+        parser.error("--minutos no puede ser negativo")
+    try:
+        red = leer_red(argumentos.red)
+        rutas = leer_rutas(argumentos.rutas, {nombre for nombre, _, _ in red})
+    except (OSError, KeyError, ValueError) as e:
+        parser.error(f"red o rutas no válidas: {e}")
+    if len({nombre for nombre, _, _ in red}) != len(red):
+        parser.error("hay aeropuertos repetidos en la red")
+
+    inicio = time.perf_counter()
+    resumenes = simular_red(red, rutas, argumentos.minutos, argumentos.salida, argumentos.en_proceso,
+                            argumentos.ventana)
+    imprimir_tabla(resumenes)
+    print(f"Tiempo total: {time.perf_counter() - inicio:.2f} s")
+
+if __name__ == "__main__":
+    main()
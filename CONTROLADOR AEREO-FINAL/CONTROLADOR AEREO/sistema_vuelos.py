@@ -1,6 +1,28 @@
 import os
 import time
 import random
+import heapq
+import io
+import sys
+import atexit
+import argparse
+import json
+import mmap
+import pickle
+import struct
+import zlib
+import threading
+import tempfile
+import contextlib
+import gc
+from collections import Counter
+from itertools import chain, groupby, islice
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él solo está el motor de registros
+    np = None
 
 # Constantes para índices
 ID = 0
@@ -10,801 +32,2507 @@ PRIORIDAD = 3
 COMBUSTIBLE = 4
 ESTADO = 5
 
-# Constantes para pistas
-PISTA_ID = 0
-PISTA_CATEGORIA = 1
-PISTA_TIEMPO_USO = 2
-PISTA_HABILITADA = 3
-PISTA_ESTADO = 4
-PISTA_VUELO_ACTUAL = 5
-PISTA_TIEMPO_LIBERACION = 6
+# Constantes para pistas
+PISTA_ID = 0
+PISTA_CATEGORIA = 1
+PISTA_TIEMPO_USO = 2
+PISTA_HABILITADA = 3
+PISTA_ESTADO = 4
+PISTA_VUELO_ACTUAL = 5
+PISTA_TIEMPO_LIBERACION = 6
+
+ESTADOS = ["EN_COLA", "ASIGNADO", "COMPLETADO", "CANCELADO"]
+CATEGORIAS_PISTAS = ["corta", "estandar", "larga"]
+AEROLINEAS = ["IB", "UX", "VY", "AF", "BA", "LH", "AA", "DL", "TK", "EK"]
+
+# Combustible ficticio de los despegues en la clave de despacho (van después)
+COMBUSTIBLE_DESPEGUE = 999
+# Valor del componente de atraso mientras el vuelo aún no acumula atraso
+SIN_ATRASO = float("inf")
+# Categorías de pista admitidas por (tipo de vuelo, emergencia), de menor a
+# mayor; None admite cualquier categoría
+CATEGORIAS_COMPATIBLES = {
+    ("ATERRIZAJE", False): None,
+    ("ATERRIZAJE", True): ("estandar", "larga"),
+    ("DESPEGUE", False): ("estandar", "larga"),
+    ("DESPEGUE", True): ("estandar", "larga"),
+}
+# Tabla precalculada (tipo, emergencia, categoría) -> compatible
+TABLA_COMPATIBILIDAD = {
+    (tipo, emergencia, categoria): admitidas is None or categoria in admitidas
+    for (tipo, emergencia), admitidas in CATEGORIAS_COMPATIBLES.items()
+    for categoria in CATEGORIAS_PISTAS
+}
+
+# (tramo, agotamiento) de los despegues en la clave: empatan con 999 de combustible
+TRAMO_DESPEGUE = (2, 0)
+# Combustible a partir del cual un aterrizaje pasa a emergencia
+UMBRAL_EMERGENCIA = 5
+# Ranuras (minutos) de la rueda de temporizadores de emergencia
+RANURAS_RUEDA = 1024
+# Líneas de log acumuladas que provocan una escritura inmediata
+LOG_MAX_LINEAS = 1000
+# Segundos máximos que una línea de log espera en el búfer
+LOG_INTERVALO = 0.5
+# Carga por streaming: minutos de antelación con que un vuelo entra en cola
+VENTANA_INCORPORACION = 60
+# Vuelos por bloque al ordenar un CSV por tiempo (el resto espera en disco)
+BLOQUE_ORDENACION = 100_000
+# Checkpoint binario: firma, versión del formato y cabecera (firma, versión, crc32, longitud)
+CHECKPOINT_MAGIA = b"SVCK"
+CHECKPOINT_VERSION = 1
+CABECERA_CHECKPOINT = struct.Struct("<4sHIQ")
+# Tablas binarias de registro fijo: cabecera (firma, versión, tamaño de registro, registros)
+CABECERA_TABLA = struct.Struct("<4sHHQ")
+TABLA_VERSION = 1
+MAGIA_VUELOS = b"SVVU"
+MAGIA_PISTAS = b"SVPI"
+# Registro de vuelo: id, tipo, prioridad, estado, tiempo, combustible (40 bytes)
+REGISTRO_VUELO = struct.Struct("<16sBBB5xqq")
+# Registro de pista: id, categoría, tiempo de uso, habilitada (48 bytes)
+REGISTRO_PISTA = struct.Struct("<16s16sqB7x")
+# Entrada del índice por ETA/ETD que sigue a los registros de vuelo
+ENTRADA_INDICE = struct.Struct("<Q")
+
+# ========== ESTRUCTURAS DE DATOS ==========
+
+class Registro:
+    """Base de los registros con __slots__ que también se leen por índice.
+
+    Mantiene la compatibilidad con el acceso de las antiguas tuplas
+    (vuelo[ESTADO], pista[PISTA_ID], ...), pero se modifica en el sitio.
+    """
+    __slots__ = ()
+    CAMPOS = ()  # Nombres de los campos en el orden de la antigua tupla
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return tuple(self)[indice]
+        return getattr(self, self.CAMPOS[indice])
+
+    def __setitem__(self, indice, valor):
+        setattr(self, self.CAMPOS[indice], valor)
+
+    def __len__(self):
+        return len(self.CAMPOS)
+
+    def __iter__(self):
+        return (getattr(self, campo) for campo in self.CAMPOS)
+
+    def __repr__(self):
+        return f"{type(self).__name__}{tuple(self)}"
+
+class Vuelo(Registro):
+    """Vuelo compartido por referencia entre vuelos, flujos y cola de despacho.
+
+    El combustible no se descuenta minuto a minuto: mientras el aterrizaje
+    espera en cola se guarda el combustible de referencia y el minuto desde
+    el que consume, y el valor actual se calcula con el reloj de su motor.
+    """
+    __slots__ = ("id", "tipo", "tiempo", "prioridad", "_combustible", "_desde", "_motor", "estado", "orden")
+    CAMPOS = ("id", "tipo", "tiempo", "prioridad", "combustible", "estado")
+
+    def __init__(self, id_vuelo, tipo, tiempo, prioridad, combustible, estado):
+        self.id = id_vuelo
+        self.tipo = tipo
+        self.tiempo = tiempo
+        self.prioridad = prioridad
+        self._combustible = combustible
+        self._desde = None  # Minuto desde el que consume, None si no está en espera
+        self._motor = None  # Motor cuyo reloj marca el consumo mientras espera
+        self.estado = estado
+        self.orden = None  # Posición de llegada al flujo de aterrizaje, None si no está en él
+
+    @property
+    def combustible(self):
+        if self._desde is None:
+            return self._combustible
+        return max(0, self._combustible - (self._motor.reloj_simulado - self._desde))
+
+    @combustible.setter
+    def combustible(self, valor):
+        self._combustible = valor
+        if self._desde is not None:
+            self._desde = self._motor.reloj_simulado
+
+    def empezar_consumo(self, motor):
+        """Empieza a consumir combustible desde el minuto actual del motor (si no lo hacía ya)"""
+        if self._desde is None:
+            self._motor = motor
+            self._desde = motor.reloj_simulado
+
+    def detener_consumo(self):
+        """Congela el combustible actual al salir de la espera"""
+        if self._desde is not None:
+            self._combustible = self.combustible
+            self._desde = None
+            self._motor = None
+
+class Pista(Registro):
+    """Pista con su estado de ocupación, modificada en el sitio"""
+    __slots__ = ("id", "categoria", "tiempo_uso", "habilitada", "estado",
+                 "vuelo_actual", "tiempo_liberacion")
+    CAMPOS = __slots__
+
+    def __init__(self, id_pista, categoria, tiempo_uso, habilitada,
+                 estado="LIBRE", vuelo_actual=None, tiempo_liberacion=0):
+        self.id = id_pista
+        self.categoria = categoria
+        self.tiempo_uso = tiempo_uso
+        self.habilitada = habilitada
+        self.estado = estado
+        self.vuelo_actual = vuelo_actual
+        self.tiempo_liberacion = tiempo_liberacion
+
+    def liberar(self):
+        """Deja la pista libre y sin vuelo asignado"""
+        self.estado = "LIBRE"
+        self.vuelo_actual = None
+        self.tiempo_liberacion = 0
+
+class ColaPrioridadIndexada:
+    """Montículo binario indexado por id de vuelo.
+
+    Permite insertar, extraer la cima, eliminar y actualizar la clave de
+    un vuelo ya encolado en O(log n), sin reordenar toda la cola.
+    """
+
+    def __init__(self):
+        # Entradas [clave, secuencia, id, vuelo]: la secuencia de inserción desempata
+        # claves iguales para que nunca se comparen los registros
+        self._monticulo = []
+        self._posicion = {}   # id -> índice en el montículo
+        self._secuencia = 0
+
+    def __len__(self):
+        return len(self._monticulo)
+
+    def __contains__(self, id_vuelo):
+        return id_vuelo in self._posicion
+
+    def vaciar(self, elementos=()):
+        """Reconstruye la cola en O(n) a partir de pares (clave, vuelo)"""
+        self._monticulo = [[clave, secuencia, vuelo[ID], vuelo]
+                           for secuencia, (clave, vuelo) in enumerate(elementos)]
+        self._secuencia = len(self._monticulo)
+        heapq.heapify(self._monticulo)
+        self._posicion = {entrada[2]: i for i, entrada in enumerate(self._monticulo)}
+
+    def instantanea(self):
+        """Pares (clave, vuelo) en el orden interno del montículo"""
+        return [(clave, vuelo) for clave, _, _, vuelo in self._monticulo]
+
+    def restaurar(self, entradas):
+        """Vuelve a una instantánea sin recalcular las claves ni reordenar"""
+        self._monticulo = [[clave, secuencia, vuelo.id, vuelo]
+                           for secuencia, (clave, vuelo) in enumerate(entradas)]
+        self._secuencia = len(self._monticulo)
+        self._posicion = {entrada[2]: i for i, entrada in enumerate(self._monticulo)}
+
+    def insertar(self, clave, vuelo):
+        """Inserta un vuelo o actualiza su clave si ya estaba en la cola"""
+        if vuelo[ID] in self._posicion:
+            if self.registro(vuelo[ID]) is not vuelo:
+                raise ValueError(f"Ya hay otro vuelo {vuelo[ID]} en la cola de despacho")
+            self.actualizar(clave, vuelo)
+            return
+        self._monticulo.append([clave, self._secuencia, vuelo[ID], vuelo])
+        self._secuencia += 1
+        self._posicion[vuelo[ID]] = len(self._monticulo) - 1
+        self._subir(len(self._monticulo) - 1)
+
+    def actualizar(self, clave, vuelo):
+        """Cambia la clave (y el registro) de un vuelo encolado"""
+        i = self._posicion[vuelo[ID]]
+        entrada = self._monticulo[i]
+        clave_anterior = entrada[0]
+        entrada[0] = clave
+        entrada[3] = vuelo
+        if clave < clave_anterior:
+            self._subir(i)
+        elif clave > clave_anterior:
+            self._bajar(i)
+
+    def eliminar(self, id_vuelo):
+        """Quita un vuelo de la cola; no hace nada si no estaba"""
+        i = self._posicion.pop(id_vuelo, None)
+        if i is None:
+            return
+        ultima = self._monticulo.pop()
+        if i < len(self._monticulo):
+            self._monticulo[i] = ultima
+            self._posicion[ultima[2]] = i
+            self._subir(i)
+            self._bajar(self._posicion[ultima[2]])
+
+    def clave(self, id_vuelo):
+        """Devuelve la clave actual de un vuelo encolado"""
+        return self._monticulo[self._posicion[id_vuelo]][0]
+
+    def registro(self, id_vuelo):
+        """Devuelve el registro guardado de un vuelo encolado"""
+        return self._monticulo[self._posicion[id_vuelo]][3]
+
+    def cima(self):
+        """Devuelve el vuelo más prioritario sin extraerlo"""
+        return self._monticulo[0][3] if self._monticulo else None
+
+    def extraer(self):
+        """Extrae y devuelve el vuelo más prioritario"""
+        if not self._monticulo:
+            return None
+        vuelo = self._monticulo[0][3]
+        self.eliminar(vuelo[ID])
+        return vuelo
+
+    def _intercambiar(self, i, j):
+        m = self._monticulo
+        m[i], m[j] = m[j], m[i]
+        self._posicion[m[i][2]] = i
+        self._posicion[m[j][2]] = j
+
+    def _subir(self, i):
+        m = self._monticulo
+        while i > 0:
+            padre = (i - 1) // 2
+            if m[i][0] < m[padre][0]:
+                self._intercambiar(i, padre)
+                i = padre
+            else:
+                break
+
+    def _bajar(self, i):
+        m = self._monticulo
+        n = len(m)
+        while True:
+            menor = i
+            izq, der = 2 * i + 1, 2 * i + 2
+            if izq < n and m[izq][0] < m[menor][0]:
+                menor = izq
+            if der < n and m[der][0] < m[menor][0]:
+                menor = der
+            if menor == i:
+                break
+            self._intercambiar(i, menor)
+            i = menor
+
+class MonticuloLiberaciones:
+    """Montículo (minuto de liberación, posición) de las pistas ocupadas.
+
+    Cada minuto solo se miran las pistas que se liberan en él. Las entradas
+    obsoletas (pista liberada o reocupada entretanto) se descartan al salir.
+    """
+
+    def __init__(self):
+        self._monticulo = []
+
+    def reconstruir(self, lista_pistas):
+        """Rehace el montículo con las pistas ocupadas de una lista"""
+        self._monticulo = [(p[PISTA_TIEMPO_LIBERACION], i) for i, p in enumerate(lista_pistas)
+                           if p[PISTA_ESTADO] == "OCUPADA" and p[PISTA_TIEMPO_LIBERACION] is not None]
+        heapq.heapify(self._monticulo)
+
+    def programar(self, minuto, posicion):
+        """Apunta el minuto de liberación de la pista en esa posición"""
+        heapq.heappush(self._monticulo, (minuto, posicion))
+
+    def vencidas(self, minuto, lista_pistas):
+        """Posiciones de las pistas ocupadas cuya liberación es <= minuto.
+
+        Se devuelven en el orden de la lista, que es el orden en que el
+        recorrido completo las liberaba.
+        """
+        posiciones = set()
+        while self._monticulo and self._monticulo[0][0] <= minuto:
+            _, posicion = heapq.heappop(self._monticulo)
+            pista = lista_pistas[posicion]
+            if (pista[PISTA_ESTADO] == "OCUPADA" and pista[PISTA_TIEMPO_LIBERACION] is not None
+                    and pista[PISTA_TIEMPO_LIBERACION] <= minuto):
+                posiciones.add(posicion)
+        return sorted(posiciones)
+
+class RuedaTemporizadores:
+    """Rueda de temporizadores por minuto.
+
+    Cada temporizador va a la ranura de su minuto módulo el número de
+    ranuras; al avanzar el reloj solo se revisan las ranuras de los minutos
+    transcurridos, y de ellas solo vencen las entradas de esos minutos.
+    """
+
+    def __init__(self, ranuras=RANURAS_RUEDA, minuto=0):
+        self._ranuras = [[] for _ in range(ranuras)]
+        self._ultimo = minuto
+
+    def vaciar(self, minuto):
+        """Quita todos los temporizadores y toma `minuto` como ya revisado"""
+        for ranura in self._ranuras:
+            ranura.clear()
+        self._ultimo = minuto
+
+    def programar(self, minuto, elemento):
+        """Programa `elemento` para el minuto dado (como pronto el siguiente)"""
+        minuto = max(minuto, self._ultimo + 1)
+        self._ranuras[minuto % len(self._ranuras)].append((minuto, elemento))
+
+    def vencidos(self, minuto):
+        """Saca los elementos programados hasta `minuto` incluido"""
+        if minuto <= self._ultimo:
+            return []
+        n = len(self._ranuras)
+        desde = self._ultimo + 1
+        self._ultimo = minuto
+        salida = []
+        for m in range(desde, desde + min(minuto - desde + 1, n)):
+            ranura = self._ranuras[m % n]
+            if not ranura:
+                continue
+            salida.extend(e for t, e in ranura if t <= minuto)
+            ranura[:] = [(t, e) for t, e in ranura if t > minuto]
+        return salida
+
+    def instantanea(self):
+        """Devuelve (último minuto revisado, [(minuto, elemento)]) de los pendientes"""
+        return self._ultimo, [entrada for ranura in self._ranuras for entrada in ranura]
+
+    def restaurar(self, ultimo, entradas):
+        """Vuelve al estado de una instantánea"""
+        self.vaciar(ultimo)
+        for minuto, elemento in entradas:
+            self.programar(minuto, elemento)
+
+class IndicePistasLibres:
+    """Pistas libres y habilitadas agrupadas por categoría.
+
+    Cada categoría guarda las posiciones de sus pistas libres en un conjunto
+    y en un montículo con borrado perezoso, de modo que la primera pista
+    libre de una categoría se obtiene sin recorrer la lista de pistas.
+    """
+
+    def __init__(self):
+        self._libres = {}       # categoría -> posiciones libres
+        self._monticulos = {}   # categoría -> montículo de posiciones
+        self._en_monticulo = {} # categoría -> posiciones presentes en el montículo
+        self._categoria = {}    # posición -> categoría en la que está archivada
+
+    def __len__(self):
+        return len(self._categoria)
+
+    def reconstruir(self, lista_pistas):
+        """Rehace el índice a partir de una lista de pistas"""
+        self.__init__()
+        for posicion, pista in enumerate(lista_pistas):
+            self.actualizar(posicion, pista)
+
+    def actualizar(self, posicion, pista):
+        """Archiva o retira una pista según su estado, habilitación y categoría actuales"""
+        anterior = self._categoria.pop(posicion, None)
+        if anterior is not None:
+            self._libres[anterior].discard(posicion)
+        if pista[PISTA_ESTADO] != "LIBRE" or pista[PISTA_HABILITADA] != 1:
+            return
+        categoria = pista[PISTA_CATEGORIA]
+        self._categoria[posicion] = categoria
+        self._libres.setdefault(categoria, set()).add(posicion)
+        presentes = self._en_monticulo.setdefault(categoria, set())
+        if posicion not in presentes:
+            presentes.add(posicion)
+            heapq.heappush(self._monticulos.setdefault(categoria, []), posicion)
+
+    def _primera_de(self, categoria):
+        """Primera posición libre de una categoría o None"""
+        monticulo = self._monticulos.get(categoria)
+        if not monticulo:
+            return None
+        libres = self._libres[categoria]
+        while monticulo and monticulo[0] not in libres:
+            self._en_monticulo[categoria].discard(heapq.heappop(monticulo))
+        return monticulo[0] if monticulo else None
+
+    def _categorias(self, admitidas):
+        """Categorías candidatas de menor a mayor (las desconocidas al final)"""
+        if admitidas is not None:
+            return admitidas
+        conocidas = [c for c in CATEGORIAS_PISTAS if c in self._libres]
+        return conocidas + [c for c in self._libres if c not in CATEGORIAS_PISTAS]
+
+    def primera(self, admitidas):
+        """Posición más baja entre las pistas libres de las categorías admitidas"""
+        posiciones = [self._primera_de(c) for c in self._categorias(admitidas)]
+        posiciones = [p for p in posiciones if p is not None]
+        return min(posiciones) if posiciones else None
+
+    def mejor_ajuste(self, admitidas):
+        """Primera pista libre de la categoría admitida más pequeña que tenga alguna"""
+        for categoria in self._categorias(admitidas):
+            posicion = self._primera_de(categoria)
+            if posicion is not None:
+                return posicion
+        return None
+
+TIPOS_VUELO = ["ATERRIZAJE", "DESPEGUE"]
+CODIGO_TIPO = {tipo: i for i, tipo in enumerate(TIPOS_VUELO)}
+CODIGO_ESTADO = {estado: i for i, estado in enumerate(ESTADOS)}
+
+class AlmacenColumnar:
+    """Tabla de vuelos en columnas NumPy (una fila por vuelo).
+
+    Los registros VueloColumnar son vistas de una fila, así que el resto del
+    motor no distingue este almacén de la lista de Vuelo. Las fases que
+    recorren todos los aterrizajes se hacen con máscaras sobre las columnas.
+    Los estados fuera de ESTADOS (los de la GUI) no caben en la columna.
+    """
+
+    def __init__(self, capacidad=1024):
+        if np is None:
+            raise ImportError("El almacén columnar necesita NumPy instalado")
+        capacidad = max(capacidad, 1)
+        self.cantidad = 0
+        self.ids = []        # id de cada fila
+        self.registros = []  # VueloColumnar de cada fila
+        self.tipo = np.zeros(capacidad, dtype=np.int8)
+        self.tiempo = np.zeros(capacidad, dtype=np.int64)
+        self.prioridad = np.zeros(capacidad, dtype=np.int8)
+        self.combustible = np.zeros(capacidad, dtype=np.int64)
+        self.estado = np.zeros(capacidad, dtype=np.int8)
+        self.en_flujo = np.zeros(capacidad, dtype=bool)
+
+    def _crecer(self):
+        """Duplica la capacidad de todas las columnas"""
+        for nombre in ("tipo", "tiempo", "prioridad", "combustible", "estado", "en_flujo"):
+            columna = getattr(self, nombre)
+            nueva = np.zeros(2 * len(columna), dtype=columna.dtype)
+            nueva[:len(columna)] = columna
+            setattr(self, nombre, nueva)
+
+    def agregar(self, vuelo):
+        """Copia un vuelo en una fila nueva y devuelve su vista"""
+        if self.cantidad == len(self.tipo):
+            self._crecer()
+        fila = self.cantidad
+        self.cantidad += 1
+        self.tipo[fila] = CODIGO_TIPO[vuelo[TIPO]]
+        self.tiempo[fila] = vuelo[TIEMPO]
+        self.prioridad[fila] = vuelo[PRIORIDAD]
+        self.combustible[fila] = vuelo[COMBUSTIBLE]
+        self.estado[fila] = CODIGO_ESTADO[vuelo[ESTADO]]
+        registro = VueloColumnar(self, fila)
+        self.ids.append(vuelo[ID])
+        self.registros.append(registro)
+        return registro
+
+    def marcar_flujos(self, registros):
+        """Marca las filas que forman los flujos de aterrizaje y despegue"""
+        self.en_flujo[:] = False
+        self.en_flujo[[v._fila for v in registros]] = True
+
+    def _flujo(self, tipo):
+        """Máscara de las filas del flujo de un tipo de vuelo"""
+        n = self.cantidad
+        return self.en_flujo[:n] & (self.tipo[:n] == CODIGO_TIPO[tipo])
+
+    def _espera(self, tipo):
+        """Máscara de las filas del flujo de un tipo que siguen EN_COLA"""
+        return self._flujo(tipo) & (self.estado[:self.cantidad] == CODIGO_ESTADO["EN_COLA"])
+
+    def consumir_combustible(self, minutos=1):
+        """Descuenta combustible a todos los aterrizajes en espera de una vez"""
+        mascara = self._espera("ATERRIZAJE")
+        combustible = self.combustible[:self.cantidad]
+        combustible[mascara] = np.maximum(combustible[mascara] - minutos, 0)
+
+    def filas_emergencia(self, umbral):
+        """Filas del flujo de aterrizaje que deben pasar a emergencia, en orden del flujo"""
+        n = self.cantidad
+        mascara = (self._flujo("ATERRIZAJE") & (self.combustible[:n] <= umbral)
+                   & (self.prioridad[:n] < 2))
+        return np.flatnonzero(mascara)
+
+    def criticos(self, umbral):
+        """Vuelos en espera de aterrizar con combustible <= umbral"""
+        mascara = self._espera("ATERRIZAJE") & (self.combustible[:self.cantidad] <= umbral)
+        return [self.registros[fila] for fila in np.flatnonzero(mascara)]
+
+    def en_espera(self):
+        """Devuelve (aterrizajes, despegues) EN_COLA de los flujos"""
+        return (int(np.count_nonzero(self._espera("ATERRIZAJE"))),
+                int(np.count_nonzero(self._espera("DESPEGUE"))))
+
+class VueloColumnar(Registro):
+    """Vista de una fila del almacén columnar con la interfaz de Vuelo"""
+    __slots__ = ("_almacen", "_fila")
+    CAMPOS = Vuelo.CAMPOS
+
+    def __init__(self, almacen, fila):
+        self._almacen = almacen
+        self._fila = fila
+
+    @property
+    def id(self):
+        return self._almacen.ids[self._fila]
+
+    @property
+    def tipo(self):
+        return TIPOS_VUELO[self._almacen.tipo[self._fila]]
+
+    @property
+    def tiempo(self):
+        return int(self._almacen.tiempo[self._fila])
+
+    @property
+    def prioridad(self):
+        return int(self._almacen.prioridad[self._fila])
+
+    @prioridad.setter
+    def prioridad(self, valor):
+        self._almacen.prioridad[self._fila] = valor
+
+    @property
+    def combustible(self):
+        return int(self._almacen.combustible[self._fila])
+
+    @combustible.setter
+    def combustible(self, valor):
+        self._almacen.combustible[self._fila] = valor
+
+    @property
+    def estado(self):
+        return ESTADOS[self._almacen.estado[self._fila]]
+
+    @estado.setter
+    def estado(self, valor):
+        self._almacen.estado[self._fila] = CODIGO_ESTADO[valor]
+
+    def empezar_consumo(self, motor):
+        """El almacén columnar descuenta el combustible con máscaras en consumir_combustible()"""
+
+    def detener_consumo(self):
+        """El almacén columnar descuenta el combustible con máscaras en consumir_combustible()"""
+
+class Contadores:
+    """Recuentos por valor de varios campos, mantenidos en cada transición.
+
+    Quien modifica un registro llama a quitar() antes y a agregar() después;
+    así las estadísticas no tienen que recorrer las listas.
+    """
+
+    def __init__(self, campos):
+        self._campos = campos  # nombre -> función que extrae el valor del registro
+        self.reconstruir(())
+
+    def reconstruir(self, registros):
+        """Recuenta desde cero una colección de registros"""
+        self.total = 0
+        self._cuentas = {nombre: Counter() for nombre in self._campos}
+        for registro in registros:
+            self.agregar(registro)
+
+    def agregar(self, registro):
+        self.total += 1
+        for nombre, valor_de in self._campos.items():
+            self._cuentas[nombre][valor_de(registro)] += 1
+
+    def quitar(self, registro):
+        self.total -= 1
+        for nombre, valor_de in self._campos.items():
+            self._cuentas[nombre][valor_de(registro)] -= 1
+
+    def contar(self, campo, valor):
+        """Número de registros cuyo campo vale `valor`"""
+        return self._cuentas[campo][valor]
+
+    def instantanea(self):
+        """Devuelve (total, {campo: {valor: cuenta}}) con tipos básicos"""
+        return self.total, {nombre: dict(cuenta) for nombre, cuenta in self._cuentas.items()}
+
+    def restaurar(self, total, cuentas):
+        """Vuelve al estado de una instantánea sin recorrer los registros"""
+        self.total = total
+        self._cuentas = {nombre: Counter(cuentas.get(nombre, {})) for nombre in self._campos}
+
+def pista_libre(pista):
+    """Indica si una pista está libre y habilitada"""
+    return pista[PISTA_ESTADO] == "LIBRE" and pista[PISTA_HABILITADA] == 1
+
+# Campos con recuento en vivo de vuelos y de pistas
+CAMPOS_CONTADOS_VUELO = {"estado": itemgetter(ESTADO), "tipo": itemgetter(TIPO),
+                         "prioridad": itemgetter(PRIORIDAD)}
+CAMPOS_CONTADOS_PISTA = {"estado": itemgetter(PISTA_ESTADO), "habilitada": itemgetter(PISTA_HABILITADA),
+                         "libre": pista_libre}
+
+class FuenteVuelos:
+    """Vuelos ordenados por ETA/ETD que se sacan a medida que se acercan.
+
+    Un vuelo sale cuando el reloj llega a su tiempo menos la ventana; solo se
+    tiene en memoria el siguiente, no el resto del archivo.
+    """
+
+    def __init__(self, registros, ventana=VENTANA_INCORPORACION):
+        self._registros = iter(registros)
+        self.ventana = ventana
+        self.extraidos = 0  # Vuelos ya entregados (para reanudar desde un checkpoint)
+        self._siguiente = next(self._registros, None)
+
+    def proximo_minuto(self):
+        """Minuto en que sale el siguiente vuelo o None si no quedan"""
+        if self._siguiente is None:
+            return None
+        return self._siguiente[TIEMPO] - self.ventana
+
+    def extraer_hasta(self, minuto):
+        """Genera los vuelos que deben entrar en cola a más tardar en ese minuto"""
+        while self._siguiente is not None and self._siguiente[TIEMPO] - self.ventana <= minuto:
+            vuelo = self._siguiente
+            self._siguiente = next(self._registros, None)
+            self.extraidos += 1
+            yield vuelo
+
+class EscritorLog:
+    """Búfer de líneas de log que un hilo en segundo plano vuelca a disco.
+
+    Escribe cuando se acumulan max_lineas o pasan intervalo segundos, y al
+    salir del programa. Las líneas llegan al archivo en el orden registrado.
+    """
+
+    def __init__(self, max_lineas=LOG_MAX_LINEAS, intervalo=LOG_INTERVALO):
+        self.max_lineas = max_lineas
+        self.intervalo = intervalo
+        self._reiniciar()
+
+    def _reiniciar(self):
+        """Estado inicial, también en el proceso hijo tras un fork"""
+        self._pendientes = []          # Pares (ruta, línea)
+        self._sin_sincronizar = set()  # Archivos escritos sin fsync
+        self._condicion = threading.Condition()
+        self._escribiendo = threading.Lock()
+        self._hilo = None
+
+    def escribir(self, archivo, linea):
+        """Añade una línea al búfer; la ruta se fija con el directorio actual"""
+        with self._condicion:
+            self._pendientes.append((os.path.abspath(archivo), linea))
+            if self._hilo is None:
+                self._hilo = threading.Thread(target=self._bucle, name="escritor-log", daemon=True)
+                self._hilo.start()
+            if len(self._pendientes) >= self.max_lineas:
+                self._condicion.notify()
+
+    def _bucle(self):
+        while True:
+            with self._condicion:
+                self._condicion.wait_for(lambda: len(self._pendientes) >= self.max_lineas,
+                                         timeout=self.intervalo)
+            self.vaciar()
+
+    def vaciar(self, durable=False):
+        """Escribe las líneas pendientes; con durable=True además hace fsync"""
+        with self._escribiendo:
+            with self._condicion:
+                lote, self._pendientes = self._pendientes, []
+            for ruta, lineas in groupby(lote, key=lambda par: par[0]):
+                try:
+                    with open(ruta, "a", encoding="utf-8") as f:
+                        f.writelines(linea for _, linea in lineas)
+                    self._sin_sincronizar.add(ruta)
+                except Exception as e:
+                    print(f"Error al escribir en log: {e}")
+            if durable:
+                for ruta in self._sin_sincronizar:
+                    try:
+                        with open(ruta, "a", encoding="utf-8") as f:
+                            os.fsync(f.fileno())
+                    except Exception as e:
+                        print(f"Error al escribir en log: {e}")
+                self._sin_sincronizar.clear()
+
+# Escritor de log compartido por todos los motores; vuelca lo pendiente al terminar el programa
+escritor_log = EscritorLog()
+atexit.register(escritor_log.vaciar)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=escritor_log._reiniciar)
+
+class Instrumentacion:
+    """Temporizadores y contadores por fase del minuto simulado.
+
+    Las fases se miden por vueltas: cada marcar(fase) se queda con el tiempo
+    transcurrido desde la marca anterior (reloj monotónico perf_counter).
+    Desactivada, cada llamada se queda en comprobar un atributo.
+    """
+
+    def __init__(self):
+        self.activa = False
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Pone a cero tiempos, contadores y minutos simulados"""
+        self.fases = {}  # fase -> [llamadas, segundos, máximo]
+        self.contadores = Counter()
+        self.minutos_simulados = 0
+        self.segundos_simulando = 0.0
+        self._inicio = None
+        self._marca = None
+
+    def activar(self, activa=True):
+        """Activa o desactiva la medición (lo ya medido se conserva)"""
+        self.activa = activa
+        self._inicio = self._marca = None
+
+    def empezar(self):
+        """Abre un tramo de simulación"""
+        if self.activa:
+            self._inicio = self._marca = time.perf_counter()
+
+    def marcar(self, fase):
+        """Atribuye a `fase` el tiempo desde la marca anterior"""
+        if not self.activa or self._marca is None:
+            return
+        ahora = time.perf_counter()
+        duracion = ahora - self._marca
+        self._marca = ahora
+        datos = self.fases.get(fase)
+        if datos is None:
+            self.fases[fase] = [1, duracion, duracion]
+        else:
+            datos[0] += 1
+            datos[1] += duracion
+            if duracion > datos[2]:
+                datos[2] = duracion
+
+    def terminar(self, minutos=1):
+        """Cierra el tramo abierto con empezar(), que ha simulado `minutos`"""
+        if not self.activa or self._inicio is None:
+            return
+        self.segundos_simulando += time.perf_counter() - self._inicio
+        self.minutos_simulados += minutos
+        self._inicio = self._marca = None
+
+    def contar(self, contador, cantidad=1):
+        """Suma `cantidad` a un contador"""
+        if self.activa and cantidad:
+            self.contadores[contador] += cantidad
+
+    @property
+    def minutos_por_segundo(self):
+        """Minutos simulados por segundo de cálculo"""
+        if not self.segundos_simulando:
+            return 0.0
+        return self.minutos_simulados / self.segundos_simulando
+
+    def resumen(self):
+        """Diccionario con todo lo medido (milisegundos)"""
+        return {
+            "minutos_simulados": self.minutos_simulados,
+            "segundos_simulando": self.segundos_simulando,
+            "minutos_por_segundo": self.minutos_por_segundo,
+            "fases": {fase: {"llamadas": llamadas, "total_ms": total * 1e3,
+                             "medio_ms": total * 1e3 / llamadas, "max_ms": maximo * 1e3}
+                      for fase, (llamadas, total, maximo) in self.fases.items()},
+            "contadores": dict(self.contadores),
+        }
+
+    def mostrar(self):
+        """Imprime la tabla de fases, los contadores y el ritmo de simulación"""
+        print(f"Minutos simulados: {self.minutos_simulados} "
+              f"({self.minutos_por_segundo:.1f} min simulados/s)")
+        if self.fases:
+            print(f"{'FASE':<14} {'LLAMADAS':>9} {'TOTAL (ms)':>11} {'MEDIO (ms)':>11} {'MÁX (ms)':>10}")
+            for fase, datos in self.resumen()["fases"].items():
+                print(f"{fase:<14} {datos['llamadas']:>9} {datos['total_ms']:>11.3f} "
+                      f"{datos['medio_ms']:>11.4f} {datos['max_ms']:>10.3f}")
+        for contador, valor in self.contadores.items():
+            print(f"{contador}: {valor}")
+
+    def volcar(self, archivo):
+        """Escribe el resumen en un archivo JSON"""
+        with open(archivo, "w", encoding="utf-8") as f:
+            json.dump(self.resumen(), f, indent=2)
+
+class LectorCheckpoint(pickle.Unpickler):
+    """Unpickler que solo admite tipos básicos (tuplas, listas, dicts, números y cadenas).
+
+    Un checkpoint describe el estado con esos tipos, así que leerlo nunca
+    construye objetos arbitrarios aunque el archivo venga de fuera.
+    """
+
+    def find_class(self, modulo, nombre):
+        raise pickle.UnpicklingError(f"El checkpoint contiene un objeto no admitido: {modulo}.{nombre}")
+
+# ========== FUNCIONES AUXILIARES ==========
+
+def vaciar_log(durable=False):
+    """Fuerza la escritura del log pendiente; durable=True espera a que llegue al disco"""
+    escritor_log.vaciar(durable)
+
+def leer_vuelos_csv(archivo="vuelos.csv"):
+    """Generador de vuelos validados de un CSV, línea a línea y en orden del archivo"""
+    with open(archivo, "r", encoding="utf-8") as f:
+        next(f, None)  # Encabezado
+        for numero_linea, linea in enumerate(f, start=2):
+            datos = linea.strip().split(",")
+            try:
+                if len(datos) < 7:  # Ahora son 7 columnas
+                    continue
+                
+                id_vuelo = datos[0].strip()
+                tipo = datos[1].strip().upper()
+                
+                # Manejar eta/etd - CORREGIDO
+                if tipo == "ATERRIZAJE":
+                    tiempo_str = datos[2].strip()  # eta
+                else:  # DESPEGUE
+                    tiempo_str = datos[3].strip()  # etd
+                
+                # Convertir a int, manejar campos vacíos
+                tiempo = int(tiempo_str) if tiempo_str else 0
+                prioridad_str = datos[4].strip()
+                prioridad = int(prioridad_str) if prioridad_str else 0
+                
+                # Combustible - solo para aterrizajes
+                combustible_str = datos[5].strip()
+                combustible = int(combustible_str) if combustible_str and tipo == "ATERRIZAJE" else 0
+                
+                estado = datos[6].strip().upper()
+                
+                if tipo not in ["ATERRIZAJE", "DESPEGUE"]:
+                    continue
+                if estado not in ESTADOS:
+                    estado = "EN_COLA"
+                if prioridad not in [0, 1, 2]:
+                    prioridad = 0
+                
+                yield Vuelo(id_vuelo, tipo, tiempo, prioridad, combustible, estado)
+                
+            except (ValueError, IndexError) as e:
+                print(f"Error en línea {numero_linea}: {e} - Datos: {datos}")
+
+def leer_pistas_csv(archivo="pistas.csv"):
+    """Generador de pistas validadas de un CSV, en orden del archivo"""
+    with open(archivo, "r", encoding="utf-8") as f:
+        next(f, None)  # Encabezado
+        for numero_linea, linea in enumerate(f, start=2):
+            try:
+                datos = linea.strip().split(",")
+                if len(datos) >= 4:
+                    id_pista = datos[0].strip()
+                    categoria = datos[1].strip().lower()
+                    tiempo_uso = int(datos[2].strip())
+                    habilitada = int(datos[3].strip())
+
+                    yield Pista(id_pista, categoria, tiempo_uso, habilitada)
+
+            except (ValueError, IndexError) as e:
+                print(f"Error en pista línea {numero_linea}: {e}")
+
+def vuelo_terminado(vuelo):
+    """Indica si un vuelo ya no volverá a la cola (su id puede reutilizarse)"""
+    return vuelo[ESTADO] in ("COMPLETADO", "CANCELADO")
+
+def indexar_vuelos(coleccion, indice):
+    """Reconstruye un índice id -> registro.
+
+    Un id solo se repite cuando el vuelo anterior ya terminó, así que gana la
+    última aparición, que es la que sigue activa.
+    """
+    indice.clear()
+    for vuelo in coleccion:
+        indice[vuelo[ID]] = vuelo
+
+def leer_tramo_ordenado(archivo):
+    """Generador de vuelos de un tramo temporal escrito por ordenar_por_tiempo"""
+    for linea in archivo:
+        id_vuelo, tipo, tiempo, prioridad, combustible, estado = linea.rstrip("\n").split(",")
+        yield Vuelo(id_vuelo, tipo, int(tiempo), int(prioridad), int(combustible), estado)
+
+def ordenar_por_tiempo(registros, tamano_bloque=BLOQUE_ORDENACION):
+    """Ordena vuelos por ETA/ETD con memoria acotada a un par de bloques.
+
+    Si caben en un bloque se ordenan en memoria; si no, cada bloque ordenado
+    va a un archivo temporal y se mezclan con heapq.merge. Los empates
+    conservan el orden del archivo.
+    """
+    registros = iter(registros)
+    bloque = list(islice(registros, tamano_bloque))
+    siguiente = list(islice(registros, tamano_bloque))
+    if not siguiente:
+        bloque.sort(key=lambda v: v[TIEMPO])
+        yield from bloque
+        return
+    
+    tramos = []
+    try:
+        while bloque:
+            bloque.sort(key=lambda v: v[TIEMPO])
+            tramo = tempfile.TemporaryFile("w+", encoding="utf-8")
+            for v in bloque:
+                tramo.write(f"{v[ID]},{v[TIPO]},{v[TIEMPO]},{v[PRIORIDAD]},{v[COMBUSTIBLE]},{v[ESTADO]}\n")
+            tramo.seek(0)
+            tramos.append(tramo)
+            bloque, siguiente = siguiente, list(islice(registros, tamano_bloque))
+        yield from heapq.merge(*(leer_tramo_ordenado(t) for t in tramos), key=lambda v: v[TIEMPO])
+    finally:
+        for tramo in tramos:
+            tramo.close()
+
+def categorias_compatibles(vuelo):
+    """Categorías de pista admitidas por un vuelo (None = cualquiera)"""
+    return CATEGORIAS_COMPATIBLES.get((vuelo[TIPO], vuelo[PRIORIDAD] == 2), ())
+
+def categoria_compatible(tipo, emergencia, categoria):
+    """Consulta la tabla de compatibilidad (tipo, emergencia, categoría)"""
+    compatible = TABLA_COMPATIBILIDAD.get((tipo, emergencia, categoria))
+    if compatible is None:
+        # Categoría fuera de la tabla: solo la admite quien acepta cualquiera
+        compatible = (tipo, emergencia) in CATEGORIAS_COMPATIBLES and CATEGORIAS_COMPATIBLES[(tipo, emergencia)] is None
+    return compatible
+
+def pista_es_compatible(pista, vuelo):
+    """Verifica si una pista es compatible con un tipo de vuelo"""
+    if pista[PISTA_HABILITADA] == 0:
+        return False
+    return categoria_compatible(vuelo[TIPO], vuelo[PRIORIDAD] == 2, pista[PISTA_CATEGORIA])
+
+@contextlib.contextmanager
+def recolector_en_pausa():
+    """Pausa el recolector de ciclos mientras se crean millones de objetos que no forman ciclos"""
+    activo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if activo:
+            gc.enable()
+
+def empaquetar_columnas(filas, ancho, textos=()):
+    """Traspone una lista de tuplas en `ancho` columnas para el checkpoint.
+
+    pickle guarda una lista de números mucho más deprisa que millones de
+    tuplas. Las columnas de `textos` se guardan como (tabla, códigos), así que
+    cada cadena distinta (id, tipo, estado) se escribe una sola vez.
+    """
+    columnas = [[fila[i] for fila in filas] for i in range(ancho)]
+    for i in textos:
+        tabla = {}
+        codigos = [tabla.setdefault(valor, len(tabla)) for valor in columnas[i]]
+        columnas[i] = (list(tabla), codigos)
+    return columnas
+
+def desempaquetar_columnas(columnas, textos=()):
+    """Inversa de empaquetar_columnas(): devuelve la lista de tuplas"""
+    columnas = list(columnas)
+    for i in textos:
+        tabla, codigos = columnas[i]
+        columnas[i] = [tabla[codigo] for codigo in codigos]
+    return list(zip(*columnas))
+
+@contextlib.contextmanager
+def escritura_atomica(archivo):
+    """Abre un temporal binario junto a `archivo` que lo sustituye al cerrar (fsync y rename).
+
+    Si el proceso muere a mitad, queda el archivo anterior intacto.
+    """
+    directorio = os.path.dirname(os.path.abspath(archivo))
+    descriptor, temporal = tempfile.mkstemp(prefix=".escritura-", dir=directorio)
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp deja el archivo solo para su dueño: mismos permisos que con open()
+        mascara = os.umask(0)
+        os.umask(mascara)
+        os.chmod(temporal, 0o666 & ~mascara)
+        os.replace(temporal, archivo)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temporal)
+        raise
+    # El rename solo es durable cuando se sincroniza el directorio
+    if hasattr(os, "O_DIRECTORY"):
+        descriptor = os.open(directorio, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+def escribir_checkpoint(archivo, estado):
+    """Escribe un checkpoint de forma atómica"""
+    datos = pickle.dumps(estado, protocol=5)
+    with escritura_atomica(archivo) as f:
+        f.write(CABECERA_CHECKPOINT.pack(CHECKPOINT_MAGIA, CHECKPOINT_VERSION, zlib.crc32(datos), len(datos)))
+        f.write(datos)
+
+def leer_checkpoint(archivo):
+    """Lee y valida un checkpoint; ValueError si no lo es, está dañado o es de otra versión"""
+    with open(archivo, "rb") as f:
+        cabecera = f.read(CABECERA_CHECKPOINT.size)
+        datos = f.read()
+    if len(cabecera) < CABECERA_CHECKPOINT.size:
+        raise ValueError(f"{archivo} no es un checkpoint")
+    magia, version, crc, longitud = CABECERA_CHECKPOINT.unpack(cabecera)
+    if magia != CHECKPOINT_MAGIA:
+        raise ValueError(f"{archivo} no es un checkpoint")
+    if version != CHECKPOINT_VERSION:
+        raise ValueError(f"Versión de checkpoint {version} no soportada (se esperaba {CHECKPOINT_VERSION})")
+    if len(datos) != longitud or zlib.crc32(datos) != crc:
+        raise ValueError(f"Checkpoint {archivo} dañado o incompleto")
+    try:
+        return LectorCheckpoint(io.BytesIO(datos)).load()
+    except pickle.UnpicklingError as e:
+        raise ValueError(f"Checkpoint {archivo} no válido: {e}") from e
+
+# ========== TABLAS BINARIAS DE REGISTRO FIJO ==========
+
+def texto_fijo(texto, tamano=16):
+    """Codifica un texto para un campo de `tamano` bytes; ValueError si no cabe"""
+    datos = texto.encode("utf-8")
+    if len(datos) > tamano:
+        raise ValueError(f"'{texto}' no cabe en {tamano} bytes")
+    return datos
+
+def es_tabla_binaria(archivo, magia):
+    """Indica si un archivo empieza por la firma de una tabla binaria"""
+    with open(archivo, "rb") as f:
+        return f.read(len(magia)) == magia
+
+def validar_tabla(datos, magia, registro, archivo):
+    """Comprueba la cabecera de una tabla mapeada y devuelve su número de registros"""
+    if len(datos) < CABECERA_TABLA.size:
+        raise ValueError(f"{archivo} no es una tabla binaria")
+    firma, version, tamano, cantidad = CABECERA_TABLA.unpack_from(datos)
+    if firma != magia:
+        raise ValueError(f"{archivo} no es una tabla binaria del tipo esperado")
+    if version != TABLA_VERSION or tamano != registro.size:
+        raise ValueError(f"Versión de tabla {version} no soportada (se esperaba {TABLA_VERSION})")
+    if len(datos) < CABECERA_TABLA.size + cantidad * tamano:
+        raise ValueError(f"Tabla {archivo} incompleta")
+    return cantidad
+
+def convertir_vuelos_csv(origen, destino):
+    """Convierte un CSV de vuelos en una tabla binaria y devuelve cuántos vuelos escribió.
+
+    Tras los registros, en el orden del CSV, va un índice con sus posiciones
+    ordenadas por ETA/ETD (los empates conservan el orden del archivo).
+    """
+    tiempos = []
+    with escritura_atomica(destino) as f:
+        f.write(CABECERA_TABLA.pack(MAGIA_VUELOS, TABLA_VERSION, REGISTRO_VUELO.size, 0))
+        for vuelo in leer_vuelos_csv(origen):
+            f.write(REGISTRO_VUELO.pack(texto_fijo(vuelo[ID]), CODIGO_TIPO[vuelo[TIPO]], vuelo[PRIORIDAD],
+                                        CODIGO_ESTADO[vuelo[ESTADO]], vuelo[TIEMPO], vuelo[COMBUSTIBLE]))
+            tiempos.append(vuelo[TIEMPO])
+        for posicion in sorted(range(len(tiempos)), key=tiempos.__getitem__):
+            f.write(ENTRADA_INDICE.pack(posicion))
+        f.seek(0)
+        f.write(CABECERA_TABLA.pack(MAGIA_VUELOS, TABLA_VERSION, REGISTRO_VUELO.size, len(tiempos)))
+    return len(tiempos)
+
+def convertir_pistas_csv(origen, destino):
+    """Convierte un CSV de pistas en una tabla binaria y devuelve cuántas pistas escribió"""
+    pistas = list(leer_pistas_csv(origen))
+    with escritura_atomica(destino) as f:
+        f.write(CABECERA_TABLA.pack(MAGIA_PISTAS, TABLA_VERSION, REGISTRO_PISTA.size, len(pistas)))
+        for pista in pistas:
+            f.write(REGISTRO_PISTA.pack(texto_fijo(pista[PISTA_ID]), texto_fijo(pista[PISTA_CATEGORIA]),
+                                        pista[PISTA_TIEMPO_USO], pista[PISTA_HABILITADA]))
+    return len(pistas)
+
+def leer_vuelos_binario(archivo, por_tiempo=False, desde=0):
+    """Generador de vuelos de una tabla binaria leída con mmap.
+
+    Solo se crea el Vuelo del registro que se pide: el resto de la tabla se
+    queda en el archivo mapeado. Con por_tiempo se sigue el índice por
+    ETA/ETD; `desde` salta los primeros vuelos sin leerlos.
+    """
+    with open(archivo, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+        cantidad = validar_tabla(datos, MAGIA_VUELOS, REGISTRO_VUELO, archivo)
+        inicio = CABECERA_TABLA.size
+        inicio_indice = inicio + cantidad * REGISTRO_VUELO.size
+        if por_tiempo and len(datos) < inicio_indice + cantidad * ENTRADA_INDICE.size:
+            raise ValueError(f"Tabla {archivo} sin índice por tiempo")
+        for n in range(desde, cantidad):
+            if por_tiempo:
+                n, = ENTRADA_INDICE.unpack_from(datos, inicio_indice + n * ENTRADA_INDICE.size)
+            id_vuelo, tipo, prioridad, estado, tiempo, combustible = \
+                REGISTRO_VUELO.unpack_from(datos, inicio + n * REGISTRO_VUELO.size)
+            yield Vuelo(id_vuelo.rstrip(b"\0").decode("utf-8"), TIPOS_VUELO[tipo], tiempo, prioridad,
+                        combustible, ESTADOS[estado])
+
+def leer_pistas_binario(archivo):
+    """Lista de pistas de una tabla binaria"""
+    with open(archivo, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+        cantidad = validar_tabla(datos, MAGIA_PISTAS, REGISTRO_PISTA, archivo)
+        registros = REGISTRO_PISTA.iter_unpack(datos[CABECERA_TABLA.size:CABECERA_TABLA.size + cantidad * REGISTRO_PISTA.size])
+        return [Pista(id_pista.rstrip(b"\0").decode("utf-8"), categoria.rstrip(b"\0").decode("utf-8"),
+                      tiempo_uso, habilitada)
+                for id_pista, categoria, tiempo_uso, habilitada in registros]
+
+def leer_vuelos(archivo):
+    """Vuelos de un CSV o de una tabla binaria (se distingue por la firma), en el orden del archivo"""
+    if es_tabla_binaria(archivo, MAGIA_VUELOS):
+        return leer_vuelos_binario(archivo)
+    return leer_vuelos_csv(archivo)
+
+def leer_pistas(archivo):
+    """Pistas de un CSV o de una tabla binaria (se distingue por la firma)"""
+    if es_tabla_binaria(archivo, MAGIA_PISTAS):
+        return leer_pistas_binario(archivo)
+    return leer_pistas_csv(archivo)
+
+def vuelos_por_tiempo(archivo, desde=0):
+    """Vuelos de un CSV o de una tabla binaria ordenados por ETA/ETD, saltando los `desde` primeros.
+
+    La tabla binaria trae el índice por tiempo: no hay que ordenar nada y el
+    salto es directo.
+    """
+    if es_tabla_binaria(archivo, MAGIA_VUELOS):
+        return leer_vuelos_binario(archivo, por_tiempo=True, desde=desde)
+    return islice(ordenar_por_tiempo(leer_vuelos_csv(archivo)), desde, None)
+
+# ========== MOTOR DE SIMULACIÓN ==========
+
+class MotorVuelos:
+    """Estado completo de una simulación y las funciones que la hacen avanzar.
+
+    Cada instancia es independiente: en un mismo proceso pueden simularse
+    varios escenarios a la vez. Las funciones del módulo con el mismo nombre
+    que los métodos operan sobre el motor por defecto `motor`.
+    """
+
+    def __init__(self, archivo_log="eventos.log", semilla=None, archivo_informe="informe.log"):
+        self.salida_consola = True  # False en ejecución por lotes: no se pinta nada por minuto
+        self.archivo_log = archivo_log
+        # Archivo que escribe generar_informe()
+        self.archivo_informe = archivo_informe
+        # "primera": primera pista compatible de la lista; "mejor_ajuste": la de menor
+        # categoría compatible, para reservar las largas
+        self.politica_pistas = "primera"
+        # Generador aleatorio propio del motor (sembrar_generador() lo hace reproducible)
+        self.generador_aleatorio = random.Random(semilla)
+        # Tiempos y contadores por fase del minuto (desactivada por defecto)
+        self.instrumentacion = Instrumentacion()
+        # Archivo JSON donde guardar_estado() vuelca la instrumentación activa
+        self.archivo_instrumentacion = "instrumentacion.json"
+        # Checkpoint binario que escribe guardar_estado() y lee reanudar_checkpoint()
+        self.archivo_checkpoint = "estado.ckpt"
+        # Índice id -> registro, compartido por vuelos y los dos flujos
+        self.indice_vuelos = {}
+        # Cola de despacho: contiene exactamente los vuelos de los flujos en EN_COLA
+        self.cola_despacho = ColaPrioridadIndexada()
+        # Minuto en que cada aterrizaje del flujo llega al umbral de emergencia
+        self.temporizadores_emergencia = RuedaTemporizadores()
+        # Recuentos en vivo (los de vuelos incluyen los ya retirados por el streaming)
+        self.contadores_vuelos = Contadores(CAMPOS_CONTADOS_VUELO)
+        self.contadores_pistas = Contadores(CAMPOS_CONTADOS_PISTA)
+        # Liberaciones pendientes de las pistas ocupadas
+        self.liberaciones_pistas = MonticuloLiberaciones()
+        # Pistas libres y habilitadas por categoría, e índice id -> posición de las pistas
+        self.pistas_libres = IndicePistasLibres()
+        self.indice_pistas = {}
+        # Lista de eventos futuros (minuto, tipo, referencia) para el modo por eventos
+        self.eventos_futuros = []
+        self.reiniciar_simulacion()
+
+    # ========== FUNCIONES BASE (Carga y Simulación) ==========
+
+    def registrar_log(self, mensaje, archivo=None):
+        """Registra un evento en el archivo de log (a través del búfer)"""
+        escritor_log.escribir(archivo or self.archivo_log, f"[t={self.reloj_simulado}] {mensaje}\n")
+
+    def cargar_vuelos_desde_csv(self, archivo="vuelos.csv"):
+        """Carga los vuelos desde un archivo CSV (o su tabla binaria) - CORREGIDO para tu formato"""
+        vuelos_cargados = []
+        try:
+            cargados_por_id = {}
+            for vuelo in leer_vuelos(archivo):
+                anterior = cargados_por_id.get(vuelo[ID])
+                if anterior is not None and not vuelo_terminado(anterior):
+                    print(f"Vuelo {vuelo[ID]} duplicado en {archivo}: ya hay uno activo con ese ID, se ignora")
+                    continue
+                cargados_por_id[vuelo[ID]] = vuelo
+                vuelos_cargados.append(vuelo)
+                self.registrar_log(f"EN_COLA id_vuelo={vuelo[ID]} tipo={vuelo[TIPO]}")
+
+            print(f"Cargados {len(vuelos_cargados)} vuelos desde {archivo}")
+            self.registrar_log(f"CARGA_INICIAL vuelos={len(vuelos_cargados)} pistas={len(self.pistas)}")
+
+        except FileNotFoundError:
+            print(f"Archivo {archivo} no encontrado.")
+            # Crear algunos vuelos de ejemplo si no existe el archivo
+            vuelos_cargados = [
+                Vuelo("IB101", "ATERRIZAJE", 5, 0, 20, "EN_COLA"),
+                Vuelo("IB202", "ATERRIZAJE", 1, 0, 18, "EN_COLA"),
+                Vuelo("UX303", "DESPEGUE", 1, 0, 0, "EN_COLA"),
+                Vuelo("VY404", "DESPEGUE", 5, 0, 0, "EN_COLA"),
+                Vuelo("AF505", "ATERRIZAJE", 8, 0, 5, "EN_COLA")
+            ]
+            for vuelo in vuelos_cargados:
+                self.registrar_log(f"EN_COLA id_vuelo={vuelo[ID]} tipo={vuelo[TIPO]}")
+
+        self.vuelos = vuelos_cargados
+        indexar_vuelos(self.vuelos, self.indice_vuelos)
+        self.contadores_vuelos.reconstruir(self.vuelos)
+        if self.almacen_columnar is not None:
+            self.activar_almacen_columnar()
+        return vuelos_cargados
+
+    def cargar_pistas_desde_csv(self, archivo="pistas.csv"):
+        """Carga información de pistas desde archivo CSV (o su tabla binaria)"""
+        pistas_cargadas = []
+        try:
+            pistas_cargadas = list(leer_pistas(archivo))
+            print(f"Cargadas {len(pistas_cargadas)} pistas desde {archivo}")
+
+        except FileNotFoundError:
+            print(f"Archivo {archivo} no encontrado.")
+            # Pistas por defecto
+            pistas_cargadas = [
+                Pista("R1", "larga", 3, 1),
+                Pista("R2", "estandar", 3, 1)
+            ]
+
+        self.pistas = pistas_cargadas
+        self.indexar_pistas()
+        return pistas_cargadas
+
+    def indexar_pistas(self):
+        """Reconstruye los índices de pistas: por id, libres por categoría y liberaciones"""
+        self.indice_pistas.clear()
+        for posicion, pista in enumerate(self.pistas):
+            self.indice_pistas.setdefault(pista[PISTA_ID], posicion)
+        self.pistas_libres.reconstruir(self.pistas)
+        self.liberaciones_pistas.reconstruir(self.pistas)
+        self.contadores_pistas.reconstruir(self.pistas)
+
+    def registrar_pista(self, pista):
+        """Añade una pista nueva a la lista y a sus índices"""
+        self.pistas.append(pista)
+        self.indice_pistas.setdefault(pista[PISTA_ID], len(self.pistas) - 1)
+        self.pistas_libres.actualizar(len(self.pistas) - 1, pista)
+        self.contadores_pistas.agregar(pista)
+
+    def inicializar_flujos(self):
+        """Inicializa los flujos de aterrizaje y despegue"""
+        self.flujo_aterrizaje = [v for v in self.vuelos if v[TIPO] == "ATERRIZAJE" and v[ESTADO] == "EN_COLA"]
+        self.flujo_despegue = [v for v in self.vuelos if v[TIPO] == "DESPEGUE" and v[ESTADO] == "EN_COLA"]
+        if self.almacen_columnar is not None:
+            self.almacen_columnar.marcar_flujos(self.flujo_aterrizaje + self.flujo_despegue)
+        else:
+            self.numerar_flujo_aterrizaje()
+        self.reconstruir_cola_despacho()
+
+    def numerar_flujo_aterrizaje(self):
+        """Numera los aterrizajes del flujo en su orden; el resto queda sin número"""
+        for vuelo in self.vuelos:
+            vuelo.orden = None
+        for posicion, vuelo in enumerate(self.flujo_aterrizaje):
+            vuelo.orden = posicion
+        self._orden_flujo = len(self.flujo_aterrizaje)
+
+    def activar_almacen_columnar(self):
+        """Pasa la tabla de vuelos al almacén columnar de NumPy.
+
+        Los flujos conservan su orden, que coincide con el de las filas; por eso
+        las fases vectorizadas registran los eventos en el mismo orden.
+        """
+        almacen = AlmacenColumnar(len(self.vuelos))
+        vistas = {}
+        for vuelo in self.vuelos:
+            vistas[id(vuelo)] = almacen.agregar(vuelo)
+        self.almacen_columnar = almacen
+        self.vuelos = [vistas[id(v)] for v in self.vuelos]
+        self.flujo_aterrizaje = [vistas[id(v)] for v in self.flujo_aterrizaje]
+        self.flujo_despegue = [vistas[id(v)] for v in self.flujo_despegue]
+        indexar_vuelos(self.vuelos, self.indice_vuelos)
+        almacen.marcar_flujos(self.flujo_aterrizaje + self.flujo_despegue)
+        self.reconstruir_cola_despacho()
+
+    def registrar_vuelo(self, vuelo):
+        """Añade un vuelo nuevo a la lista principal, a su índice y a su flujo.
+
+        Devuelve False sin añadirlo si ya hay un vuelo activo con el mismo id.
+        """
+        if self.id_en_uso(vuelo[ID]):
+            print(f"Vuelo {vuelo[ID]} duplicado: ya hay uno activo con ese ID, se ignora")
+            return False
+        if self.almacen_columnar is not None:
+            vuelo = self.almacen_columnar.agregar(vuelo)
+        self.vuelos.append(vuelo)
+        self.indice_vuelos[vuelo[ID]] = vuelo
+        self.contadores_vuelos.agregar(vuelo)
+        self.agregar_a_flujos(vuelo)
+        return True
+
+    def id_en_uso(self, id_vuelo):
+        """Indica si hay un vuelo sin terminar con ese id"""
+        vuelo = self.indice_vuelos.get(id_vuelo)
+        return vuelo is not None and not vuelo_terminado(vuelo)
+
+    def agregar_a_flujos(self, vuelo):
+        """Añade un vuelo nuevo a su flujo y a la cola de despacho sin reconstruirlos"""
+        if vuelo[ESTADO] != "EN_COLA":
+            return
+        if vuelo[TIPO] == "ATERRIZAJE":
+            self.flujo_aterrizaje.append(vuelo)
+        else:
+            self.flujo_despegue.append(vuelo)
+        if self.almacen_columnar is not None:
+            self.almacen_columnar.en_flujo[vuelo._fila] = True
+        elif vuelo[TIPO] == "ATERRIZAJE":
+            vuelo.orden = self._orden_flujo
+            self._orden_flujo += 1
+        self.sincronizar_cola_despacho(vuelo)
+        self.programar_eventos_vuelo(vuelo)
+
+    def mostrar_vuelos(self):
+        """Muestra todos los vuelos"""
+        if not self.vuelos:
+            print("No hay vuelos registrados")
+            return
+
+        print("\n" + "="*80)
+        print(f"{'ID':<10} {'TIPO':<12} {'TIEMPO':<8} {'PRIORIDAD':<10} {'COMBUSTIBLE':<12} {'ESTADO':<12}")
+        print("-"*80)
+
+        for vuelo in self.vuelos:
+            combustible_str = str(vuelo[COMBUSTIBLE]) if vuelo[TIPO] == "ATERRIZAJE" else "N/A"
+            print(f"{vuelo[ID]:<10} {vuelo[TIPO]:<12} {vuelo[TIEMPO]:<8} {vuelo[PRIORIDAD]:<10} {combustible_str:<12} {vuelo[ESTADO]:<12}")
+
+        print("="*80)
+
+    def mostrar_pistas(self):
+        """Muestra el estado de las pistas"""
+        if not self.pistas:
+            print("No hay pistas registradas")
+            return
+
+        print("\n" + "="*60)
+        print(f"{'PISTA':<8} {'CATEGORÍA':<12} {'ESTADO':<10} {'VUELO':<12} {'LIBERACIÓN':<12}")
+        print("-"*60)
+
+        for pista in self.pistas:
+            vuelo_actual = pista[PISTA_VUELO_ACTUAL] if pista[PISTA_VUELO_ACTUAL] else "---"
+            liberacion = f"min {pista[PISTA_TIEMPO_LIBERACION]}" if pista[PISTA_ESTADO] == "OCUPADA" else "---"
+            habilitada = "SÍ" if pista[PISTA_HABILITADA] == 1 else "NO"
+
+            print(f"{pista[PISTA_ID]:<8} {pista[PISTA_CATEGORIA]:<12} {pista[PISTA_ESTADO]:<10} {vuelo_actual:<12} {liberacion:<12}")
+
+    # ========== CARGA POR STREAMING ==========
+
+    def cargar_vuelos_en_streaming(self, archivo="vuelos.csv", ventana=VENTANA_INCORPORACION):
+        """Carga perezosa: cada vuelo entra en cola `ventana` minutos antes de su ETA/ETD.
+
+        A diferencia de la carga completa, un vuelo no puede despacharse antes de
+        entrar en cola. Los vuelos finalizados se van retirando de memoria. Con
+        una tabla binaria los vuelos se leen del archivo mapeado al entrar en cola.
+        """
+        self.vuelos = []
+        self.indice_vuelos.clear()
+        self.contadores_vuelos.reconstruir(self.vuelos)
+        self.inicializar_flujos()
+        self.fuente_vuelos = FuenteVuelos(vuelos_por_tiempo(archivo), ventana)
+        self.origen_streaming = os.path.abspath(archivo)
+        self._limite_compactacion = 0
+        self.incorporar_vuelos_programados()
+        self.registrar_log(f"CARGA_STREAMING archivo={archivo} ventana={ventana}")
+
+    def incorporar_vuelos_programados(self):
+        """Pasa a los flujos los vuelos de la fuente cuyo tiempo ya está dentro de la ventana"""
+        if self.fuente_vuelos is None:
+            return 0
+        incorporados = 0
+        for vuelo in self.fuente_vuelos.extraer_hasta(self.reloj_simulado):
+            if not self.registrar_vuelo(vuelo):
+                continue
+            self.registrar_log(f"EN_COLA id_vuelo={vuelo[ID]} tipo={vuelo[TIPO]}")
+            incorporados += 1
+        if incorporados:
+            # Los recién llegados pueden despacharse en el minuto siguiente
+            self.programar_evento(self.reloj_simulado + 1, "INCORPORACION", None)
+        proximo = self.fuente_vuelos.proximo_minuto()
+        if proximo is not None:
+            self.programar_evento(max(proximo, self.reloj_simulado + 1), "INCORPORACION", None)
+        if len(self.vuelos) > self._limite_compactacion:
+            self.compactar_finalizados()
+            self._limite_compactacion = 2 * len(self.vuelos) + 1024
+        return incorporados
+
+    def compactar_finalizados(self):
+        """Retira de memoria los vuelos COMPLETADO y CANCELADO (carga por streaming).
+
+        Con el almacén columnar las filas no se liberan, así que no se compacta.
+        """
+        if self.almacen_columnar is not None:
+            return
+        finalizados = ("COMPLETADO", "CANCELADO")
+        self.vuelos = [v for v in self.vuelos if v[ESTADO] not in finalizados]
+        self.flujo_aterrizaje = [v for v in self.flujo_aterrizaje if v[ESTADO] not in finalizados]
+        self.flujo_despegue = [v for v in self.flujo_despegue if v[ESTADO] not in finalizados]
+        indexar_vuelos(self.vuelos, self.indice_vuelos)
+
+    # ========== FUNCIONES DE SIMULACIÓN ==========
+
+    def tramo_combustible(self, combustible):
+        """Componente (tramo, minuto de agotamiento) de la clave para un aterrizaje.
+
+        El combustible de todos los aterrizajes en espera baja a la vez, así que
+        ordenar por combustible equivale a ordenar por minuto de agotamiento, que
+        no cambia con el reloj. Los tramos separan los casos en que eso deja de
+        valer: agotado (empatan en 0), por debajo de los despegues, empatado con
+        ellos y por encima.
+        """
+        if combustible <= 0:
+            return (0, 0)
+        if combustible < COMBUSTIBLE_DESPEGUE:
+            return (1, self.reloj_simulado + combustible)
+        if combustible == COMBUSTIBLE_DESPEGUE:
+            return (2, 0)
+        return (3, self.reloj_simulado + combustible)
+
+    def clave_despacho(self, vuelo):
+        """Clave de despacho equivalente a (-prioridad, combustible, -atraso, id).
+
+        Guarda valores fijos (minuto de agotamiento, tiempo previsto) en lugar del
+        combustible y el atraso, que cambian cada minuto, de modo que la clave solo
+        hay que recalcularla en los minutos de minutos_cambio_clave().
+        """
+        if vuelo[TIPO] == "ATERRIZAJE":
+            tramo, agotamiento = self.tramo_combustible(vuelo[COMBUSTIBLE])
+        else:
+            tramo, agotamiento = TRAMO_DESPEGUE
+        atraso = vuelo[TIEMPO] if vuelo[TIEMPO] < self.reloj_simulado else SIN_ATRASO
+        return (-vuelo[PRIORIDAD], tramo, agotamiento, atraso, vuelo[ID])
+
+    def minutos_cambio_clave(self, vuelo):
+        """Minutos futuros en que cambia la clave de despacho de un vuelo encolado"""
+        if vuelo[TIEMPO] >= self.reloj_simulado:
+            # Al minuto siguiente a la llegada prevista empieza a contar el atraso
+            yield vuelo[TIEMPO] + 1, "LLEGADA"
+        if vuelo[TIPO] != "ATERRIZAJE":
+            return
+        combustible = vuelo[COMBUSTIBLE]
+        # Combustible agotado y cruces con el combustible fijo de los despegues
+        for umbral in (0, COMBUSTIBLE_DESPEGUE, COMBUSTIBLE_DESPEGUE - 1):
+            if combustible > umbral:
+                yield self.reloj_simulado + combustible - umbral, "COMBUSTIBLE"
+
+    def sincronizar_cola_despacho(self, vuelo):
+        """Refleja en la cola de despacho el registro actual de un vuelo de los flujos"""
+        if vuelo[ESTADO] != "EN_COLA":
+            self.cola_despacho.eliminar(vuelo[ID])
+            self.minuto_entrada_cola.pop(vuelo[ID], None)
+            vuelo.detener_consumo()
+            return
+        if vuelo[TIPO] == "ATERRIZAJE":
+            vuelo.empezar_consumo(self)
+        nuevo = vuelo[ID] not in self.cola_despacho
+        self.cola_despacho.insertar(self.clave_despacho(vuelo), vuelo)
+        if nuevo:
+            self.minuto_entrada_cola.setdefault(vuelo[ID], self.reloj_simulado)
+            for minuto, _ in self.minutos_cambio_clave(vuelo):
+                heapq.heappush(self._recalculos_clave, (minuto, vuelo[ID]))
+            self.programar_emergencia(vuelo)
+
+    def reconstruir_cola_despacho(self):
+        """Reconstruye la cola de despacho desde los flujos en O(n)"""
+        encolados = [v for v in self.flujo_aterrizaje + self.flujo_despegue if v[ESTADO] == "EN_COLA"]
+        # Los vuelos que ya esperaban conservan su minuto de entrada en cola
+        entradas = self.minuto_entrada_cola
+        self.minuto_entrada_cola = {v[ID]: entradas.get(v[ID], self.reloj_simulado) for v in encolados}
+        for vuelo in self.flujo_aterrizaje:
+            if vuelo[ESTADO] == "EN_COLA":
+                vuelo.empezar_consumo(self)
+        self.cola_despacho.vaciar((self.clave_despacho(v), v) for v in encolados)
+        self._recalculos_clave = [(minuto, v[ID]) for v in encolados for minuto, _ in self.minutos_cambio_clave(v)]
+        heapq.heapify(self._recalculos_clave)
+        self.temporizadores_emergencia.vaciar(self.reloj_simulado)
+        for vuelo in encolados:
+            self.programar_emergencia(vuelo)
+            self.programar_eventos_vuelo(vuelo)
+
+    def programar_emergencia(self, vuelo):
+        """Programa el minuto en que un aterrizaje del flujo llega al umbral de emergencia.
+
+        El combustible solo baja mientras espera, así que el minuto queda fijado
+        al empezar la espera; si ya está en el umbral se promociona el siguiente.
+        """
+        if self.almacen_columnar is not None or vuelo[TIPO] != "ATERRIZAJE" or vuelo.orden is None:
+            return
+        if vuelo[PRIORIDAD] >= 2:
+            return
+        combustible = vuelo[COMBUSTIBLE]
+        if combustible <= UMBRAL_EMERGENCIA:
+            minuto = self.reloj_simulado + 1
+        else:
+            minuto = self.reloj_simulado + combustible - UMBRAL_EMERGENCIA
+        self.temporizadores_emergencia.programar(minuto, vuelo)
+
+    def recalcular_claves(self):
+        """Recalcula la clave de los vuelos que han cambiado de tramo o empiezan a acumular atraso"""
+        while self._recalculos_clave and self._recalculos_clave[0][0] <= self.reloj_simulado:
+            _, id_vuelo = heapq.heappop(self._recalculos_clave)
+            if id_vuelo not in self.cola_despacho:
+                continue
+            vuelo = self.cola_despacho.registro(id_vuelo)
+            clave = self.clave_despacho(vuelo)
+            if clave != self.cola_despacho.clave(id_vuelo):
+                self.cola_despacho.actualizar(clave, vuelo)
+
+    def programar_evento(self, minuto, tipo, referencia):
+        """Añade un evento a la lista de eventos futuros"""
+        heapq.heappush(self.eventos_futuros, (minuto, tipo, referencia))
+
+    def programar_eventos_vuelo(self, vuelo):
+        """Programa los minutos en que un vuelo encolado puede alterar el despacho.
+
+        El combustible baja un minuto por minuto mientras el vuelo espera, así que
+        los cruces de umbral se conocen al encolarlo. Un evento de más solo provoca
+        un minuto simulado completo, nunca un resultado distinto.
+        """
+        for minuto, tipo in self.minutos_cambio_clave(vuelo):
+            self.programar_evento(minuto, tipo, vuelo[ID])
+        if vuelo[TIPO] != "ATERRIZAJE":
+            return
+        combustible = vuelo[COMBUSTIBLE]
+        if vuelo[PRIORIDAD] < 2 and combustible <= UMBRAL_EMERGENCIA:
+            self.programar_evento(self.reloj_simulado + 1, "COMBUSTIBLE", vuelo[ID])
+        elif combustible > UMBRAL_EMERGENCIA:
+            # Paso a emergencia por combustible
+            self.programar_evento(self.reloj_simulado + combustible - UMBRAL_EMERGENCIA, "COMBUSTIBLE", vuelo[ID])
+
+    def proximo_evento(self):
+        """Devuelve el minuto del próximo evento futuro o None si no hay"""
+        while self.eventos_futuros and self.eventos_futuros[0][0] <= self.reloj_simulado:
+            heapq.heappop(self.eventos_futuros)
+        return self.eventos_futuros[0][0] if self.eventos_futuros else None
+
+    def obtener_siguiente_vuelo(self):
+        """Selecciona el próximo vuelo según política de prioridades"""
+        # Orden: prioridad (desc), combustible (asc), atraso (desc), id (asc)
+        self.recalcular_claves()
+        return self.cola_despacho.cima()
+
+    def asignar_pista_a_vuelo(self, vuelo):
+        """Asigna una pista disponible a un vuelo"""
+        admitidas = categorias_compatibles(vuelo)
+        if self.politica_pistas == "mejor_ajuste":
+            posicion = self.pistas_libres.mejor_ajuste(admitidas)
+        else:
+            posicion = self.pistas_libres.primera(admitidas)
+
+        if posicion is None:
+            return None
+
+        return self.pistas[posicion][PISTA_ID]
+
+    def ocupar_pista(self, id_pista, vuelo):
+        """Marca una pista como ocupada por un vuelo"""
+
+        posicion = self.indice_pistas.get(id_pista)
+        if posicion is None:
+            return False
+
+        pista = self.pistas[posicion]
+        tiempo_liberacion = self.reloj_simulado + pista[PISTA_TIEMPO_USO]
+        self.contadores_pistas.quitar(pista)
+        pista.estado = "OCUPADA"
+        pista.vuelo_actual = vuelo[ID]
+        pista.tiempo_liberacion = tiempo_liberacion
+        self.contadores_pistas.agregar(pista)
+        self.pistas_libres.actualizar(posicion, pista)
+        self.liberaciones_pistas.programar(tiempo_liberacion, posicion)
+        self.programar_evento(tiempo_liberacion, "LIBERACION", id_pista)
+        entrada = self.minuto_entrada_cola.pop(vuelo[ID], self.reloj_simulado)
+        self.operaciones_en_curso[vuelo[ID]] = (entrada, self.reloj_simulado)
+
+        # Actualizar estado del vuelo en los flujos
+        self.actualizar_estado_vuelo(vuelo[ID], "ASIGNADO")
+
+        self.registrar_log(f"ASIGNACION id_vuelo={vuelo[ID]} pista={id_pista} tipo={vuelo[TIPO]}")
+        return True
+
+    def actualizar_estado_vuelo(self, id_vuelo, nuevo_estado):
+        """Actualiza el estado de un vuelo usando el índice por id (O(1))"""
+        # El registro es el mismo en vuelos y en los flujos
+        vuelo = self.indice_vuelos.get(id_vuelo)
+        if vuelo is None:
+            return
+        self.contadores_vuelos.quitar(vuelo)
+        vuelo.estado = nuevo_estado
+        self.contadores_vuelos.agregar(vuelo)
+        self.sincronizar_cola_despacho(vuelo)
+
+    def consumir_combustible(self, minutos=1):
+        """Reduce el combustible de los vuelos en espera de aterrizaje.
+
+        Con registros Vuelo no hay nada que hacer: el combustible se deriva del
+        reloj. Solo el almacén columnar lo descuenta, con una máscara.
+        """
+        if self.almacen_columnar is not None:
+            self.almacen_columnar.consumir_combustible(minutos)
+
+    def actualizar_prioridades_combustible(self):
+        """Actualiza prioridades por combustible crítico.
+
+        Solo se revisan los aterrizajes cuyo temporizador vence en este minuto,
+        en el orden del flujo para que el log salga igual que al recorrerlo.
+        """
+        if self.almacen_columnar is not None:
+            candidatos = [self.almacen_columnar.registros[fila] for fila in self.almacen_columnar.filas_emergencia(UMBRAL_EMERGENCIA)]
+        else:
+            vencidos = {id(v): v for v in self.temporizadores_emergencia.vencidos(self.reloj_simulado)}
+            candidatos = sorted((v for v in vencidos.values() if v.orden is not None),
+                                key=lambda v: v.orden)
+        promovidos = 0
+        for vuelo in candidatos:
+            if vuelo[COMBUSTIBLE] <= UMBRAL_EMERGENCIA and vuelo[PRIORIDAD] < 2:
+                # El registro es compartido: basta con actualizarlo y reubicarlo en la cola
+                self.contadores_vuelos.quitar(vuelo)
+                vuelo.prioridad = 2
+                self.contadores_vuelos.agregar(vuelo)
+                self.sincronizar_cola_despacho(vuelo)
+                self.registrar_log(f"EMERGENCIA id_vuelo={vuelo[ID]} prioridad=2 motivo=combustible<=5")
+                promovidos += 1
+        return promovidos
+
+    def liberar_pistas_completadas(self):
+        """Libera pistas cuyo tiempo de ocupación ha expirado"""
+        liberadas = 0
+        # Solo las pistas que vencen en este minuto, en el orden de la lista
+        for posicion in self.liberaciones_pistas.vencidas(self.reloj_simulado, self.pistas):
+            pista = self.pistas[posicion]
+            id_vuelo = pista[PISTA_VUELO_ACTUAL]
+            self.anotar_operacion(pista, id_vuelo)
+
+            # Marcar vuelo como COMPLETADO
+            self.actualizar_estado_vuelo(id_vuelo, "COMPLETADO")
+
+            # Liberar pista
+            self.contadores_pistas.quitar(pista)
+            pista.liberar()
+            self.contadores_pistas.agregar(pista)
+            self.pistas_libres.actualizar(posicion, pista)
+            liberadas += 1
+            self.registrar_log(f"COMPLETADO id_vuelo={id_vuelo} pista={pista[PISTA_ID]}")
+
+        return liberadas
+
+    def anotar_operacion(self, pista, id_vuelo):
+        """Suma la operación que termina en una pista a los contadores del informe"""
+        inicio = pista[PISTA_TIEMPO_LIBERACION] - pista[PISTA_TIEMPO_USO]
+        entrada, asignacion = self.operaciones_en_curso.pop(id_vuelo, (inicio, inicio))
+        self.operaciones_pistas[pista[PISTA_ID]] += 1
+        self.minutos_ocupacion_pistas[pista[PISTA_ID]] += self.reloj_simulado - asignacion
+        vuelo = self.indice_vuelos.get(id_vuelo)
+        if vuelo is not None:
+            self.espera_total += asignacion - entrada
+            self.vuelos_atendidos.append((id_vuelo, vuelo[TIPO], vuelo[PRIORIDAD] == 2,
+                                          entrada, asignacion, self.reloj_simulado))
+
+    def avanzar_minuto(self):
+        """Avanza un minuto en la simulación"""
+        instrumentacion = self.instrumentacion
+        instrumentacion.empezar()
+
+        self.reloj_simulado += 1
+        if self.salida_consola:
+            print(f"\n--- Minuto {self.reloj_simulado} ---")
+
+        # 1. Consumir combustible
+        self.consumir_combustible()
+        instrumentacion.marcar("combustible")
+
+        # 2. Actualizar prioridades por combustible crítico
+        instrumentacion.contar("emergencias", self.actualizar_prioridades_combustible())
+        instrumentacion.marcar("emergencias")
+
+        # 3. Liberar pistas completadas
+        liberadas = self.liberar_pistas_completadas()
+        instrumentacion.contar("liberaciones", liberadas)
+        instrumentacion.marcar("liberacion")
+        if liberadas > 0 and self.salida_consola:
+            print(f" {liberadas} pista(s) liberada(s)")
+
+        # 4. Asignar nuevos vuelos a pistas libres
+        instrumentacion.contar("asignaciones", self.asignar_pistas_libres())
+        instrumentacion.marcar("despacho")
+
+        # 5. Incorporar los vuelos de la carga por streaming que ya se acercan
+        instrumentacion.contar("incorporaciones", self.incorporar_vuelos_programados())
+        instrumentacion.marcar("incorporacion")
+
+        if self.salida_consola:
+            self.mostrar_estado_actual()
+            instrumentacion.marcar("renderizado")
+        instrumentacion.terminar()
+
+    def asignar_pistas_libres(self):
+        """Asigna los vuelos más prioritarios a las pistas libres"""
+        asignados = 0
+        # Tantos intentos como pistas libres había al empezar
+        for _ in range(len(self.pistas_libres)):
+            siguiente_vuelo = self.obtener_siguiente_vuelo()
+            if siguiente_vuelo:
+                pista_asignada = self.asignar_pista_a_vuelo(siguiente_vuelo)
+                if pista_asignada:
+                    self.ocupar_pista(pista_asignada, siguiente_vuelo)
+                    asignados += 1
+                    if self.salida_consola:
+                        print(f" Vuelo {siguiente_vuelo[ID]} asignado a pista {pista_asignada}")
+        return asignados
+
+    def avanzar_minutos_por_eventos(self, minutos):
+        """Avanza N minutos saltando directamente de un evento al siguiente.
+
+        Tras cada minuto simulado el despacho queda estable: hasta el próximo
+        evento los minutos intermedios solo consumen combustible, que se descuenta
+        de golpe. El log y el estado final coinciden con avanzar minuto a minuto.
+        """
+        if minutos <= 0:
+            return
+        fin = self.reloj_simulado + minutos
+        # El primer minuto siempre se simula: recoge los cambios hechos desde el menú
+        self.avanzar_minuto()
+        while self.reloj_simulado < fin:
+            siguiente = self.proximo_evento()
+            destino = fin if siguiente is None else min(siguiente, fin)
+            saltados = destino - self.reloj_simulado - 1
+            if saltados > 0:
+                self.instrumentacion.empezar()
+                self.consumir_combustible(saltados)
+                self.reloj_simulado += saltados
+                self.instrumentacion.contar("minutos_saltados", saltados)
+                self.instrumentacion.marcar("salto")
+                self.instrumentacion.terminar(saltados)
+            self.avanzar_minuto()
+
+    def mostrar_estado_actual(self):
+        """Muestra el estado actual de la simulación"""
+        print(f"\nEstado actual (Minuto {self.reloj_simulado}):")
+
+        # Pistas
+        print("Pistas:")
+        for pista in self.pistas:
+            estado = f"{pista[PISTA_ESTADO]}"
+            if pista[PISTA_ESTADO] == "OCUPADA":
+                estado += f" por {pista[PISTA_VUELO_ACTUAL]} (hasta min {pista[PISTA_TIEMPO_LIBERACION]})"
+            print(f"  {pista[PISTA_ID]}: {estado}")
+
+        # Colas
+        if self.almacen_columnar is not None:
+            aterrizajes_espera, despegues_espera = self.almacen_columnar.en_espera()
+        else:
+            aterrizajes_espera = len([v for v in self.flujo_aterrizaje if v[ESTADO] == "EN_COLA"])
+            despegues_espera = len([v for v in self.flujo_despegue if v[ESTADO] == "EN_COLA"])
+
+        print(f"Colas: Aterrizajes={aterrizajes_espera}, Despegues={despegues_espera}")
+
+        # Vuelos críticos
+        criticos = self.vuelos_criticos()
+        if criticos:
+            print("¡ALERTA! Vuelos con combustible crítico:")
+            for v in criticos:
+                print(f"  {v[ID]}: {v[COMBUSTIBLE]} min de combustible")
+
+    def vuelos_criticos(self):
+        """Aterrizajes en espera con combustible crítico, en orden del flujo"""
+        if self.almacen_columnar is not None:
+            return self.almacen_columnar.criticos(UMBRAL_EMERGENCIA)
+        return [v for v in self.flujo_aterrizaje if v[COMBUSTIBLE] <= UMBRAL_EMERGENCIA and v[ESTADO] == "EN_COLA"]
+
+    # ========== FUNCIONES DE GESTIÓN EXPANDIDAS ==========
+
+    def generar_id_vuelo(self):
+        """Genera un ID de vuelo aleatorio"""
+        aerolinea = self.generador_aleatorio.choice(AEROLINEAS)
+        numero = self.generador_aleatorio.randint(100, 999)
+        return f"{aerolinea}{numero}"
+
+    def sembrar_generador(self, semilla):
+        """Fija la semilla del generador aleatorio del motor"""
+        self.generador_aleatorio.seed(semilla)
+
+    def agregar_vuelo_manual(self):
+        """Permite agregar un vuelo manualmente"""
+
+        print("\n--- AGREGAR VUELO MANUAL ---")
+
+        try:
+            id_vuelo = input("ID del vuelo (ej: IB123) o Enter para generar automático: ").strip().upper()
+            if not id_vuelo:
+                id_vuelo = self.generar_id_vuelo()
+                print(f"ID generado: {id_vuelo}")
+
+            # Verificar si el ID ya existe (el de un vuelo terminado se puede reutilizar)
+            if self.id_en_uso(id_vuelo):
+                print("Error: Ya existe un vuelo con ese ID")
+                return
+
+            print("\nTipo de vuelo:")
+            print("1. ATERRIZAJE")
+            print("2. DESPEGUE")
+            tipo_opcion = input("Seleccione (1-2): ").strip()
+
+            if tipo_opcion == "1":
+                tipo = "ATERRIZAJE"
+                tiempo = int(input("ETA (minuto de llegada): "))
+                combustible = int(input("Combustible (minutos de autonomía): "))
+                if combustible < 0:
+                    print("Error: Combustible no puede ser negativo")
+                    return
+            elif tipo_opcion == "2":
+                tipo = "DESPEGUE"
+                tiempo = int(input("ETD (minuto de despegue): "))
+                combustible = 0
+            else:
+                print("Opción no válida")
+                return
+
+            print("\nPrioridad:")
+            print("0 = Normal")
+            print("1 = Alta") 
+            print("2 = Emergencia")
+            prioridad = int(input("Prioridad (0-2): "))
+
+            if prioridad not in [0, 1, 2]:
+                print("Error: Prioridad debe ser 0, 1 o 2")
+                return
+
+            estado = "EN_COLA"
+
+            nuevo_vuelo = Vuelo(id_vuelo, tipo, tiempo, prioridad, combustible, estado)
+            self.registrar_vuelo(nuevo_vuelo)
+
+            mensaje = f"Vuelo {id_vuelo} agregado manualmente - {tipo}"
+            print(f"\n✓ {mensaje}")
+            self.registrar_log(f"ALTA_MANUAL id_vuelo={id_vuelo} tipo={tipo}")
+
+        except ValueError:
+            print("Error: Los campos numéricos deben ser números enteros válidos")
+        except Exception as e:
+            print(f"Error al agregar vuelo: {e}")
+
+    def generar_vuelos_automaticos(self, cantidad=5):
+        """Genera vuelos automáticamente y devuelve cuántos se han dado de alta.
+
+        Pueden ser menos de `cantidad` si ya no quedan ids libres: los que
+        coinciden con un vuelo activo se descartan.
+        """
+
+        print(f"\n--- GENERANDO {cantidad} VUELOS ALEATORIOS ---")
+
+        generados = 0
+        ids_posibles = len(AEROLINEAS) * 900
+        for i in range(cantidad):
+            id_vuelo = self.generar_id_vuelo()
+            # Evitar ids repetidos mientras queden libres
+            while id_vuelo in self.indice_vuelos and len(self.indice_vuelos) < ids_posibles:
+                id_vuelo = self.generar_id_vuelo()
+            tipo = self.generador_aleatorio.choice(["ATERRIZAJE", "DESPEGUE"])
+            tiempo = self.generador_aleatorio.randint(self.reloj_simulado, self.reloj_simulado + 10)
+            prioridad = self.generador_aleatorio.choices([0, 1, 2], weights=[80, 15, 5])[0]
+
+            if tipo == "ATERRIZAJE":
+                combustible = self.generador_aleatorio.randint(5, 45)
+            else:
+                combustible = 0
+
+            estado = "EN_COLA"
+
+            nuevo_vuelo = Vuelo(id_vuelo, tipo, tiempo, prioridad, combustible, estado)
+            if not self.registrar_vuelo(nuevo_vuelo):
+                continue
+            generados += 1
+
+            print(f"✓ {id_vuelo}: {tipo} en minuto {tiempo}, prioridad {prioridad}")
+            self.registrar_log(f"ALTA_AUTOMATICA id_vuelo={id_vuelo} tipo={tipo}")
+
+        print(f"\n✓ Se generaron {generados} vuelos automáticamente")
+        return generados
+
+    def agregar_pista_manual(self):
+        """Permite agregar una pista manualmente"""
+
+        print("\n--- AGREGAR PISTA MANUAL ---")
+
+        try:
+            id_pista = input("ID de la pista (ej: R3): ").strip().upper()
+
+            # Verificar si la pista ya existe
+            if any(p[PISTA_ID] == id_pista for p in self.pistas):
+                print("Error: Ya existe una pista con ese ID")
+                return
+
+            print("\nCategoría de pista:")
+            print("1. corta")
+            print("2. estandar") 
+            print("3. larga")
+            cat_opcion = input("Seleccione (1-3): ").strip()
+
+            categorias = {"1": "corta", "2": "estandar", "3": "larga"}
+            if cat_opcion not in categorias:
+                print("Opción no válida")
+                return
+
+            categoria = categorias[cat_opcion]
+            tiempo_uso = int(input("Tiempo de uso por operación (minutos): "))
+            habilitada = 1  # Por defecto habilitada
+
+            nueva_pista = Pista(id_pista, categoria, tiempo_uso, habilitada)
+            self.registrar_pista(nueva_pista)
+
+            mensaje = f"Pista {id_pista} agregada - Categoría: {categoria}"
+            print(f"\n✓ {mensaje}")
+            self.registrar_log(f"PISTA_AGREGADA id={id_pista} categoria={categoria}")
+
+        except ValueError:
+            print("Error: El tiempo de uso debe ser un número entero")
+        except Exception as e:
+            print(f"Error al agregar pista: {e}")
+
+    def gestionar_estado_pistas(self):
+        """Permite habilitar/deshabilitar pistas"""
+
+        print("\n--- GESTIONAR ESTADO DE PISTAS ---")
+
+        if not self.pistas:
+            print("No hay pistas registradas")
+            return
+
+        self.mostrar_pistas()
+
+        try:
+            id_pista = input("\nID de la pista a modificar: ").strip().upper()
+
+            # Buscar la pista
+            pista_index = -1
+            for i, pista in enumerate(self.pistas):
+                if pista[PISTA_ID] == id_pista:
+                    pista_index = i
+                    break
+
+            if pista_index == -1:
+                print("Error: No se encontró la pista")
+                return
+
+            pista_actual = self.pistas[pista_index]
+
+            print(f"\nPista {id_pista} actualmente: {'HABILITADA' if pista_actual[PISTA_HABILITADA] == 1 else 'DESHABILITADA'}")
+            print("\n1. Habilitar pista")
+            print("2. Deshabilitar pista")
+            print("3. Cambiar categoría")
+            opcion = input("Seleccione opción (1-3): ").strip()
+
+            if opcion == "1":
+                self.contadores_pistas.quitar(pista_actual)
+                pista_actual.habilitada = 1
+                self.contadores_pistas.agregar(pista_actual)
+                mensaje = f"Pista {id_pista} habilitada"
+
+            elif opcion == "2":
+                self.contadores_pistas.quitar(pista_actual)
+                pista_actual.habilitada = 0
+                pista_actual.liberar()  # Forzar estado libre
+                self.contadores_pistas.agregar(pista_actual)
+                mensaje = f"Pista {id_pista} deshabilitada"
+
+            elif opcion == "3":
+                print("\nNueva categoría:")
+                print("1. corta")
+                print("2. estandar") 
+                print("3. larga")
+                cat_opcion = input("Seleccione (1-3): ").strip()
+
+                categorias = {"1": "corta", "2": "estandar", "3": "larga"}
+                if cat_opcion not in categorias:
+                    print("Opción no válida")
+                    return
+
+                nueva_categoria = categorias[cat_opcion]
+                pista_actual.categoria = nueva_categoria
+                mensaje = f"Pista {id_pista} cambiada a categoría: {nueva_categoria}"
+
+            else:
+                print("Opción no válida")
+                return
+
+            self.pistas_libres.actualizar(pista_index, pista_actual)
+            print(f"✓ {mensaje}")
+            self.registrar_log(f"PISTA_MODIFICADA {mensaje}")
 
-ESTADOS = ["EN_COLA", "ASIGNADO", "COMPLETADO", "CANCELADO"]
-CATEGORIAS_PISTAS = ["corta", "estandar", "larga"]
-AEROLINEAS = ["IB", "UX", "VY", "AF", "BA", "LH", "AA", "DL", "TK", "EK"]
+        except Exception as e:
+            print(f"Error al modificar pista: {e}")
 
-# Variables globales
-reloj_simulado = 0
-vuelos = []
-pistas = []
-flujo_aterrizaje = []
-flujo_despegue = []
+    def cancelar_vuelo(self):
+        """Permite cancelar un vuelo"""
 
-# ========== FUNCIONES BASE (Carga y Simulación) ==========
+        print("\n--- CANCELAR VUELO ---")
 
-def registrar_log(mensaje, archivo="eventos.log"):
-    """Registra un evento en el archivo de log"""
-    try:
-        with open(archivo, "a", encoding="utf-8") as f:
-            f.write(f"[t={reloj_simulado}] {mensaje}\n")
-    except Exception as e:
-        print(f"Error al escribir en log: {e}")
+        if not self.vuelos:
+            print("No hay vuelos registrados")
+            return
+
+        self.mostrar_vuelos()
+
+        id_vuelo = input("\nID del vuelo a cancelar: ").strip().upper()
+
+        # Buscar el vuelo
+        vuelo_actual = self.indice_vuelos.get(id_vuelo)
+
+        if vuelo_actual is None:
+            print("Error: No se encontró el vuelo")
+            return
+
+        if vuelo_actual[ESTADO] == "COMPLETADO":
+            print("Error: No se puede cancelar un vuelo completado")
+            return
+
+        if vuelo_actual[ESTADO] == "ASIGNADO":
+            # Liberar la pista si estaba asignado
+            for posicion, pista in enumerate(self.pistas):
+                if pista[PISTA_VUELO_ACTUAL] == id_vuelo:
+                    self.contadores_pistas.quitar(pista)
+                    pista.liberar()
+                    self.contadores_pistas.agregar(pista)
+                    self.pistas_libres.actualizar(posicion, pista)
+                    print(f"✓ Pista {pista[PISTA_ID]} liberada")
+            self.operaciones_en_curso.pop(id_vuelo, None)
+
+        # Actualizar estado del vuelo (también lo retira de la cola de despacho)
+        self.actualizar_estado_vuelo(id_vuelo, "CANCELADO")
+
+        mensaje = f"Vuelo {id_vuelo} cancelado"
+        print(f"✓ {mensaje}")
+        self.registrar_log(f"CANCELACION {mensaje}")
+
+    def mostrar_estadisticas(self):
+        """Muestra estadísticas en tiempo real"""
+        print("\n--- ESTADÍSTICAS EN TIEMPO REAL ---")
+        print(f"Reloj simulado: {self.reloj_simulado} min")
+
+        # Estadísticas de vuelos (recuentos en vivo, sin recorrer la lista)
+        total_vuelos = self.contadores_vuelos.total
+        completados = self.contadores_vuelos.contar("estado", "COMPLETADO")
+        en_cola = self.contadores_vuelos.contar("estado", "EN_COLA")
+        asignados = self.contadores_vuelos.contar("estado", "ASIGNADO")
+        cancelados = self.contadores_vuelos.contar("estado", "CANCELADO")
+
+        print(f"\n--- VUELOS ---")
+        print(f"Total: {total_vuelos}")
+        print(f"Completados: {completados}")
+        print(f"En cola: {en_cola}")
+        print(f"Asignados: {asignados}")
+        print(f"Cancelados: {cancelados}")
+
+        # Por tipo
+        aterrizajes = self.contadores_vuelos.contar("tipo", "ATERRIZAJE")
+        despegues = self.contadores_vuelos.contar("tipo", "DESPEGUE")
+        print(f"Aterrizajes: {aterrizajes}")
+        print(f"Despegues: {despegues}")
+
+        # Por prioridad
+        for prio in [0, 1, 2]:
+            count = self.contadores_vuelos.contar("prioridad", prio)
+            print(f"Prioridad {prio}: {count}")
+
+        # Pistas
+        print(f"\n--- PISTAS ---")
+        total_pistas = self.contadores_pistas.total
+        habilitadas = self.contadores_pistas.contar("habilitada", 1)
+        libres = self.contadores_pistas.contar("libre", True)
+        ocupadas = self.contadores_pistas.contar("estado", "OCUPADA")
+
+        print(f"Total: {total_pistas}")
+        print(f"Habilitadas: {habilitadas}")
+        print(f"Libres: {libres}")
+        print(f"Ocupadas: {ocupadas}")
+
+        # Vuelos críticos
+        criticos = self.vuelos_criticos()
+        if criticos:
+            print(f"\n⚠️  VUELOS CRÍTICOS ({len(criticos)}):")
+            for v in criticos:
+                print(f"  {v[ID]}: {v[COMBUSTIBLE]} min combustible")
+
+        # Instrumentación por fases
+        print("\n--- RENDIMIENTO POR FASE ---")
+        if self.instrumentacion.activa or self.instrumentacion.minutos_simulados:
+            self.instrumentacion.mostrar()
+        else:
+            print("Instrumentación desactivada (arranque con --instrumentar ARCHIVO)")
+
+    def generar_informe(self):
+        """Genera un informe completo de la simulación"""
+        try:
+            with open(self.archivo_informe, "w", encoding="utf-8") as f:
+                f.write("RESUMEN\n")
+                f.write(f"- Tiempo simulado (min): {self.reloj_simulado}\n")
+
+                # Estadísticas reales, de los contadores que se llevan al completar cada operación
+                atendidos = len(self.vuelos_atendidos)
+                emergencias = self.contadores_vuelos.contar("prioridad", 2)
+
+                f.write(f"- Vuelos atendidos: {atendidos}\n")
+
+                # Tiempo medio de espera: de la entrada en cola a la asignación de pista
+                if atendidos:
+                    f.write(f"- Tiempo medio de espera (min): {self.espera_total / atendidos:.1f}\n")
+
+                # Uso de pistas
+                operaciones = ", ".join(f"{p[PISTA_ID]}={self.operaciones_pistas[p[PISTA_ID]]} operaciones"
+                                        for p in self.pistas)
+                ocupacion = ", ".join(f"{p[PISTA_ID]}={self.minutos_ocupacion_pistas[p[PISTA_ID]]}"
+                                      for p in self.pistas)
+                f.write(f"- Uso de pistas: {operaciones}\n")
+                f.write(f"- Minutos de ocupación de pistas: {ocupacion}\n")
+                f.write(f"- Emergencias gestionadas: {emergencias}\n")
+
+                # Detalle de vuelos completados
+                f.write("- Detalle de vuelos completados:\n")
+                for id_vuelo, tipo, emergencia, _, asignacion, fin in self.vuelos_atendidos:
+                    tipo_str = f"{tipo}, EMERGENCIA" if emergencia else tipo
+                    f.write(f"   • {id_vuelo} ({tipo_str}) t_inicio={asignacion} t_fin={fin}\n")
+
+            print(f"✓ Informe generado en {self.archivo_informe}")
+            return True
+
+        except Exception as e:
+            print(f"Error al generar informe: {e}")
+            return False
+
+    def guardar_estado(self):
+        """Guarda el estado actual en archivos CSV"""
+        try:
+            # Guardar vuelos
+            with open("vuelos_actualizado.csv", "w", encoding="utf-8") as f:
+                f.write("id_vuelo,tipo,tiempo,prioridad,combustible,estado\n")
+                for vuelo in self.vuelos:
+                    f.write(f"{vuelo[ID]},{vuelo[TIPO]},{vuelo[TIEMPO]},{vuelo[PRIORIDAD]},{vuelo[COMBUSTIBLE]},{vuelo[ESTADO]}\n")
+
+            # Guardar pistas
+            with open("pistas_actualizado.csv", "w", encoding="utf-8") as f:
+                f.write("id_pista,categoria,tiempo_uso,habilitada\n")
+                for pista in self.pistas:
+                    f.write(f"{pista[PISTA_ID]},{pista[PISTA_CATEGORIA]},{pista[PISTA_TIEMPO_USO]},{pista[PISTA_HABILITADA]}\n")
+
+            print("✓ Estado guardado en 'vuelos_actualizado.csv' y 'pistas_actualizado.csv'")
+            self.guardar_checkpoint()
+            print(f"✓ Checkpoint completo guardado en '{self.archivo_checkpoint}'")
+            if self.instrumentacion.activa:
+                self.instrumentacion.volcar(self.archivo_instrumentacion)
+                print(f"✓ Instrumentación guardada en '{self.archivo_instrumentacion}'")
+            self.registrar_log("ESTADO_GUARDADO")
+            vaciar_log(durable=True)
+
+        except Exception as e:
+            print(f"Error al guardar estado: {e}")
+
+    # ========== CHECKPOINTS ==========
+
+    def instantanea(self):
+        """Estado completo del motor con tipos básicos, tal como lo guarda un checkpoint.
+
+        Cada vuelo se guarda una vez y los flujos, la cola de despacho y los
+        temporizadores lo referencian por su posición. Los índices y las pistas
+        libres se derivan del resto y se reconstruyen al restaurar. La configuración
+        (política de pistas, salida por consola, instrumentación) no se guarda.
+        """
+        columnar = self.almacen_columnar is not None
+        registros = list(self.vuelos)
+        posiciones = {id(v): i for i, v in enumerate(registros)}
+        ultimo, temporizadores = self.temporizadores_emergencia.instantanea()
+        # Vuelos ya retirados por el streaming que aún tienen un temporizador pendiente
+        for vuelo in chain(self.flujo_aterrizaje, self.flujo_despegue, (v for _, v in temporizadores)):
+            if id(vuelo) not in posiciones:
+                posiciones[id(vuelo)] = len(registros)
+                registros.append(vuelo)
+        if columnar:
+            # El almacén ya descuenta el combustible: se guarda el valor actual
+            vuelos = ((v[ID], v[TIPO], v[TIEMPO], v[PRIORIDAD], v[COMBUSTIBLE], None, v[ESTADO], None)
+                      for v in registros)
+        else:
+            vuelos = ((v.id, v.tipo, v.tiempo, v.prioridad, v._combustible, v._desde, v.estado, v.orden)
+                      for v in registros)
+        # El último componente de la clave de despacho es el id: sale del vuelo al restaurar
+        cola = ((posiciones[id(v)],) + clave[:-1] for clave, v in self.cola_despacho.instantanea())
+        fuente = self.fuente_vuelos
+        return {
+            "reloj": self.reloj_simulado,
+            "aleatorio": self.generador_aleatorio.getstate(),
+            "columnar": columnar,
+            "vuelos": empaquetar_columnas(list(vuelos), 8, textos=(ID, TIPO, ESTADO)),
+            "activos": len(self.vuelos),
+            "pistas": [tuple(p) for p in self.pistas],
+            "flujo_aterrizaje": [posiciones[id(v)] for v in self.flujo_aterrizaje],
+            "flujo_despegue": [posiciones[id(v)] for v in self.flujo_despegue],
+            "cola": empaquetar_columnas(list(cola), 5),
+            "temporizadores": (ultimo, empaquetar_columnas([(minuto, posiciones[id(v)]) for minuto, v in temporizadores], 2)),
+            "recalculos": empaquetar_columnas(self._recalculos_clave, 2, textos=(1,)),
+            "eventos": empaquetar_columnas(self.eventos_futuros, 3, textos=(1, 2)),
+            "contadores": self.contadores_vuelos.instantanea(),
+            "orden_flujo": self._orden_flujo,
+            "limite_compactacion": self._limite_compactacion,
+            "entrada_cola": self.minuto_entrada_cola,
+            "operaciones_en_curso": self.operaciones_en_curso,
+            "operaciones_pistas": (dict(self.operaciones_pistas), dict(self.minutos_ocupacion_pistas)),
+            "atendidos": (empaquetar_columnas(self.vuelos_atendidos, 6, textos=(1,)), self.espera_total),
+            "streaming": None if fuente is None else (self.origen_streaming, fuente.ventana, fuente.extraidos),
+        }
+
+    def restaurar(self, estado):
+        """Vuelve al estado de una instantánea(); la simulación sigue igual que sin la pausa"""
+        self.reiniciar_simulacion()
+        self.reloj_simulado = estado["reloj"]
+        self.generador_aleatorio.setstate(estado["aleatorio"])
+        registros = []
+        for id_vuelo, tipo, tiempo, prioridad, combustible, desde, estado_vuelo, orden in \
+                desempaquetar_columnas(estado["vuelos"], textos=(ID, TIPO, ESTADO)):
+            vuelo = Vuelo(id_vuelo, tipo, tiempo, prioridad, combustible, estado_vuelo)
+            if desde is not None:
+                vuelo._desde = desde
+                vuelo._motor = self
+            vuelo.orden = orden
+            registros.append(vuelo)
+        self.vuelos = registros[:estado["activos"]]
+        indexar_vuelos(self.vuelos, self.indice_vuelos)
+        self.flujo_aterrizaje = [registros[i] for i in estado["flujo_aterrizaje"]]
+        self.flujo_despegue = [registros[i] for i in estado["flujo_despegue"]]
+        self.pistas = [Pista(*datos) for datos in estado["pistas"]]
+        self.indexar_pistas()
+        self.contadores_vuelos.restaurar(*estado["contadores"])
+        self._orden_flujo = estado["orden_flujo"]
+        self._limite_compactacion = estado["limite_compactacion"]
+        # Los checkpoints anteriores a los contadores del informe no los traen: empiezan a cero
+        self.minuto_entrada_cola = estado.get("entrada_cola", {})
+        self.operaciones_en_curso = estado.get("operaciones_en_curso", {})
+        operaciones, ocupacion = estado.get("operaciones_pistas", ({}, {}))
+        self.operaciones_pistas = Counter(operaciones)
+        self.minutos_ocupacion_pistas = Counter(ocupacion)
+        if "atendidos" in estado:
+            atendidos, self.espera_total = estado["atendidos"]
+            self.vuelos_atendidos = desempaquetar_columnas(atendidos, textos=(1,))
+        if estado["columnar"]:
+            self.activar_almacen_columnar()
+            # Las vistas del almacén sustituyen a los registros, en el mismo orden
+            registros = self.vuelos
+        cola = desempaquetar_columnas(estado["cola"])
+        self.cola_despacho.restaurar((tuple(clave) + (registros[i].id,), registros[i]) for i, *clave in cola)
+        ultimo, temporizadores = estado["temporizadores"]
+        self.temporizadores_emergencia.restaurar(
+            ultimo, ((minuto, registros[i]) for minuto, i in desempaquetar_columnas(temporizadores)))
+        self._recalculos_clave = desempaquetar_columnas(estado["recalculos"], textos=(1,))
+        self.eventos_futuros[:] = desempaquetar_columnas(estado["eventos"], textos=(1, 2))
+        if estado["streaming"] is not None:
+            # Se salta lo ya incorporado (un CSV se vuelve a ordenar; una tabla binaria no)
+            archivo, ventana, extraidos = estado["streaming"]
+            self.fuente_vuelos = FuenteVuelos(vuelos_por_tiempo(archivo, extraidos), ventana)
+            self.fuente_vuelos.extraidos = extraidos
+            self.origen_streaming = archivo
+
+    def guardar_checkpoint(self, archivo=None):
+        """Guarda el estado completo del motor en un checkpoint binario versionado"""
+        archivo = archivo or self.archivo_checkpoint
+        self.registrar_log(f"CHECKPOINT_GUARDADO archivo={archivo}")
+        # El log llega al disco antes que el checkpoint que lo continúa
+        vaciar_log(durable=True)
+        with recolector_en_pausa():
+            escribir_checkpoint(archivo, self.instantanea())
+        return archivo
+
+    def reanudar_checkpoint(self, archivo=None):
+        """Restaura el estado de un checkpoint; el log sigue en el mismo archivo"""
+        archivo = archivo or self.archivo_checkpoint
+        with recolector_en_pausa():
+            self.restaurar(leer_checkpoint(archivo))
+        print(f"Reanudado {archivo} en el minuto {self.reloj_simulado}")
+        self.registrar_log(f"CHECKPOINT_REANUDADO archivo={archivo}")
+        return archivo
+
+    # ========== EJECUCIÓN POR LOTES ==========
+
+    def reiniciar_simulacion(self):
+        """Deja el motor sin vuelos ni pistas y con el reloj a cero"""
+        self.reloj_simulado = 0
+        self.vuelos = []
+        self.pistas = []
+        self.flujo_aterrizaje = []
+        self.flujo_despegue = []
+        # Almacén columnar activo o None si se usa la lista de Vuelo
+        self.almacen_columnar = None
+        # Fuente de la carga por streaming (None si los vuelos se cargaron de golpe) y su CSV
+        self.fuente_vuelos = None
+        self.origen_streaming = None
+        # Tamaño de vuelos a partir del cual se compactan los finalizados en streaming
+        self._limite_compactacion = 0
+        # Montículo (minuto, id) de vuelos encolados cuya clave cambia en ese minuto
+        self._recalculos_clave = []
+        # Siguiente posición de llegada al flujo de aterrizaje (Vuelo.orden)
+        self._orden_flujo = 0
+        # Minuto de entrada en la cola de despacho de cada vuelo encolado (id -> minuto)
+        self.minuto_entrada_cola = {}
+        # Vuelos en pista: id -> (minuto de entrada en cola, minuto de asignación)
+        self.operaciones_en_curso = {}
+        # Operaciones completadas y minutos de ocupación por pista (id -> total)
+        self.operaciones_pistas = Counter()
+        self.minutos_ocupacion_pistas = Counter()
+        # Vuelos completados (id, tipo, emergencia, entrada, asignación, fin) y su espera total
+        self.vuelos_atendidos = []
+        self.espera_total = 0
+        self.eventos_futuros.clear()
+        indexar_vuelos(self.vuelos, self.indice_vuelos)
+        self.contadores_vuelos.reconstruir(self.vuelos)
+        self.indexar_pistas()
+        self.inicializar_flujos()
+
+    def ejecutar_lote(self, archivo_vuelos, archivo_pistas, minutos, por_eventos=True, columnar=False,
+                      ventana=None, reanudar=None, checkpoint=None):
+        """Simula sin menú, sin esperas ni salida por minuto y escribe el log y el informe.
+
+        Con ventana se usa la carga por streaming con esa antelación en minutos.
+        Con reanudar se parte de ese checkpoint en lugar de los CSV, y con
+        checkpoint se guarda el estado final para continuar más tarde.
+        """
+        self.salida_consola = False
+        if reanudar is not None:
+            self.reanudar_checkpoint(reanudar)
+        else:
+            self.cargar_pistas_desde_csv(archivo_pistas)
+            if ventana is None:
+                self.cargar_vuelos_desde_csv(archivo_vuelos)
+                self.inicializar_flujos()
+            else:
+                self.cargar_vuelos_en_streaming(archivo_vuelos, ventana)
+        if columnar and self.almacen_columnar is None:
+            self.activar_almacen_columnar()
+        self.registrar_log("Sistema iniciado")
+
+        if por_eventos:
+            self.avanzar_minutos_por_eventos(minutos)
+        else:
+            for _ in range(minutos):
+                self.avanzar_minuto()
+
+        self.generar_informe()
+        if self.instrumentacion.activa:
+            self.instrumentacion.volcar(self.archivo_instrumentacion)
+        if checkpoint is not None:
+            self.guardar_checkpoint(checkpoint)
+        self.registrar_log("Sistema finalizado")
+        vaciar_log(durable=True)
+
+# ========== INTERFAZ DEL MÓDULO ==========
+
+# Motor por defecto: el del menú, la ejecución por lotes y las funciones de abajo
+motor = MotorVuelos()
+
+# Estado del motor por defecto que se puede leer como atributo del módulo
+ESTADO_MOTOR = frozenset((
+    "reloj_simulado", "salida_consola", "politica_pistas", "vuelos", "pistas",
+    "flujo_aterrizaje", "flujo_despegue", "indice_vuelos", "indice_pistas",
+    "almacen_columnar", "cola_despacho", "contadores_vuelos", "contadores_pistas",
+    "pistas_libres", "liberaciones_pistas", "eventos_futuros", "fuente_vuelos",
+    "generador_aleatorio", "temporizadores_emergencia", "instrumentacion",
+))
+
+def __getattr__(nombre):
+    """sistema_vuelos.vuelos, .reloj_simulado, etc. leen el motor por defecto (solo lectura)"""
+    if nombre in ESTADO_MOTOR:
+        return getattr(motor, nombre)
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+def registrar_log(mensaje, archivo=None):
+    """Registra un evento en el archivo de log (a través del búfer)"""
+    return motor.registrar_log(mensaje, archivo)
 
 def cargar_vuelos_desde_csv(archivo="vuelos.csv"):
     """Carga los vuelos desde un archivo CSV - CORREGIDO para tu formato"""
-    global vuelos
-    vuelos_cargados = []
-    try:
-        with open(archivo, "r", encoding="utf-8") as f:
-            lineas = f.readlines()
-            
-        for numero_linea, linea in enumerate(lineas[1:], start=2):
-            try:
-                datos = linea.strip().split(",")
-                if len(datos) < 7:  # Ahora son 7 columnas
-                    continue
-                
-                id_vuelo = datos[0].strip()
-                tipo = datos[1].strip().upper()
-                
-                # Manejar eta/etd - CORREGIDO
-                if tipo == "ATERRIZAJE":
-                    tiempo_str = datos[2].strip()  # eta
-                    etd_str = datos[3].strip()     # etd (vacío para aterrizajes)
-                else:  # DESPEGUE
-                    tiempo_str = datos[3].strip()  # etd  
-                    eta_str = datos[2].strip()     # eta (vacío para despegues)
-                
-                # Convertir a int, manejar campos vacíos
-                tiempo = int(tiempo_str) if tiempo_str else 0
-                prioridad = int(datos[4].strip()) if datos[4].strip() else 0
-                
-                # Combustible - solo para aterrizajes
-                combustible_str = datos[5].strip()
-                combustible = int(combustible_str) if combustible_str and tipo == "ATERRIZAJE" else 0
-                
-                estado = datos[6].strip().upper() if len(datos) > 6 else "EN_COLA"
-                
-                if tipo not in ["ATERRIZAJE", "DESPEGUE"]:
-                    continue
-                if estado not in ESTADOS:
-                    estado = "EN_COLA"
-                if prioridad not in [0, 1, 2]:
-                    prioridad = 0
-                
-                vuelo = (id_vuelo, tipo, tiempo, prioridad, combustible, estado)
-                vuelos_cargados.append(vuelo)
-                registrar_log(f"EN_COLA id_vuelo={id_vuelo} tipo={tipo}")
-                
-            except (ValueError, IndexError) as e:
-                print(f"Error en línea {numero_linea}: {e} - Datos: {datos}")
-                
-        print(f"Cargados {len(vuelos_cargados)} vuelos desde {archivo}")
-        registrar_log(f"CARGA_INICIAL vuelos={len(vuelos_cargados)} pistas={len(pistas)}")
-        
-    except FileNotFoundError:
-        print(f"Archivo {archivo} no encontrado.")
-        # Crear algunos vuelos de ejemplo si no existe el archivo
-        vuelos_cargados = [
-            ("IB101", "ATERRIZAJE", 5, 0, 20, "EN_COLA"),
-            ("IB202", "ATERRIZAJE", 1, 0, 18, "EN_COLA"),
-            ("UX303", "DESPEGUE", 1, 0, 0, "EN_COLA"),
-            ("VY404", "DESPEGUE", 5, 0, 0, "EN_COLA"),
-            ("AF505", "ATERRIZAJE", 8, 0, 5, "EN_COLA")
-        ]
-        for vuelo in vuelos_cargados:
-            registrar_log(f"EN_COLA id_vuelo={vuelo[ID]} tipo={vuelo[TIPO]}")
-    
-    vuelos = vuelos_cargados
-    return vuelos_cargados
+    return motor.cargar_vuelos_desde_csv(archivo)
 
 def cargar_pistas_desde_csv(archivo="pistas.csv"):
     """Carga información de pistas desde archivo CSV"""
-    global pistas
-    pistas_cargadas = []
-    try:
-        with open(archivo, "r", encoding="utf-8") as f:
-            lineas = f.readlines()
-            
-        for numero_linea, linea in enumerate(lineas[1:], start=2):
-            try:
-                datos = linea.strip().split(",")
-                if len(datos) >= 4:
-                    id_pista = datos[0].strip()
-                    categoria = datos[1].strip().lower()
-                    tiempo_uso = int(datos[2].strip())
-                    habilitada = int(datos[3].strip())
-                    
-                    pista = (
-                        id_pista,
-                        categoria,
-                        tiempo_uso,
-                        habilitada,
-                        "LIBRE",
-                        None,
-                        0
-                    )
-                    pistas_cargadas.append(pista)
-                    
-            except (ValueError, IndexError) as e:
-                print(f"Error en pista línea {numero_linea}: {e}")
-                
-        print(f"Cargadas {len(pistas_cargadas)} pistas desde {archivo}")
-        
-    except FileNotFoundError:
-        print(f"Archivo {archivo} no encontrado.")
-        # Pistas por defecto
-        pistas_cargadas = [
-            ("R1", "larga", 3, 1, "LIBRE", None, 0),
-            ("R2", "estandar", 3, 1, "LIBRE", None, 0)
-        ]
-    
-    pistas = pistas_cargadas
-    return pistas_cargadas
+    return motor.cargar_pistas_desde_csv(archivo)
 
 def inicializar_flujos():
     """Inicializa los flujos de aterrizaje y despegue"""
-    global flujo_aterrizaje, flujo_despegue
-    flujo_aterrizaje = [v for v in vuelos if v[TIPO] == "ATERRIZAJE" and v[ESTADO] == "EN_COLA"]
-    flujo_despegue = [v for v in vuelos if v[TIPO] == "DESPEGUE" and v[ESTADO] == "EN_COLA"]
+    return motor.inicializar_flujos()
 
 def mostrar_vuelos():
     """Muestra todos los vuelos"""
-    if not vuelos:
-        print("No hay vuelos registrados")
-        return
-    
-    print("\n" + "="*80)
-    print(f"{'ID':<10} {'TIPO':<12} {'TIEMPO':<8} {'PRIORIDAD':<10} {'COMBUSTIBLE':<12} {'ESTADO':<12}")
-    print("-"*80)
-    
-    for vuelo in vuelos:
-        combustible_str = str(vuelo[COMBUSTIBLE]) if vuelo[TIPO] == "ATERRIZAJE" else "N/A"
-        print(f"{vuelo[ID]:<10} {vuelo[TIPO]:<12} {vuelo[TIEMPO]:<8} {vuelo[PRIORIDAD]:<10} {combustible_str:<12} {vuelo[ESTADO]:<12}")
-    
-    print("="*80)
+    return motor.mostrar_vuelos()
 
 def mostrar_pistas():
     """Muestra el estado de las pistas"""
-    if not pistas:
-        print("No hay pistas registradas")
-        return
-    
-    print("\n" + "="*60)
-    print(f"{'PISTA':<8} {'CATEGORÍA':<12} {'ESTADO':<10} {'VUELO':<12} {'LIBERACIÓN':<12}")
-    print("-"*60)
-    
-    for pista in pistas:
-        vuelo_actual = pista[PISTA_VUELO_ACTUAL] if pista[PISTA_VUELO_ACTUAL] else "---"
-        liberacion = f"min {pista[PISTA_TIEMPO_LIBERACION]}" if pista[PISTA_ESTADO] == "OCUPADA" else "---"
-        habilitada = "SÍ" if pista[PISTA_HABILITADA] == 1 else "NO"
-        
-        print(f"{pista[PISTA_ID]:<8} {pista[PISTA_CATEGORIA]:<12} {pista[PISTA_ESTADO]:<10} {vuelo_actual:<12} {liberacion:<12}")
-
-# ========== FUNCIONES DE SIMULACIÓN ==========
+    return motor.mostrar_pistas()
 
 def obtener_siguiente_vuelo():
     """Selecciona el próximo vuelo según política de prioridades"""
-    candidatos = []
-    
-    # Añadir aterrizajes
-    for vuelo in flujo_aterrizaje:
-        if vuelo[ESTADO] == "EN_COLA":
-            atraso = max(0, reloj_simulado - vuelo[TIEMPO])
-            # Prioridad, combustible (menos es más urgente), atraso, id
-            candidatos.append((vuelo, -vuelo[PRIORIDAD], vuelo[COMBUSTIBLE], atraso, vuelo[ID]))
-    
-    # Añadir despegues
-    for vuelo in flujo_despegue:
-        if vuelo[ESTADO] == "EN_COLA":
-            atraso = max(0, reloj_simulado - vuelo[TIEMPO])
-            # Prioridad, combustible fijo (999 para que vayan después), atraso, id
-            candidatos.append((vuelo, -vuelo[PRIORIDAD], 999, atraso, vuelo[ID]))
-    
-    if not candidatos:
-        return None
-    
-    # Ordenar por: prioridad (desc), combustible (asc), atraso (desc), id (asc)
-    candidatos.sort(key=lambda x: (x[1], x[2], -x[3], x[4]))
-    
-    return candidatos[0][0]
-
-def pista_es_compatible(pista, vuelo):
-    """Verifica si una pista es compatible con un tipo de vuelo"""
-    if pista[PISTA_HABILITADA] == 0:
-        return False
-        
-    if vuelo[TIPO] == "DESPEGUE":
-        return pista[PISTA_CATEGORIA] in ["estandar", "larga"]
-    elif vuelo[TIPO] == "ATERRIZAJE":
-        if vuelo[PRIORIDAD] == 2:  # Emergencia
-            return pista[PISTA_CATEGORIA] in ["larga", "estandar"]
-        else:
-            return True
-    return False
+    return motor.obtener_siguiente_vuelo()
 
 def asignar_pista_a_vuelo(vuelo):
     """Asigna una pista disponible a un vuelo"""
-    pistas_disponibles = []
-    for pista in pistas:
-        if (pista[PISTA_ESTADO] == "LIBRE" and 
-            pista[PISTA_HABILITADA] == 1 and
-            pista_es_compatible(pista, vuelo)):
-            pistas_disponibles.append(pista)
-    
-    if not pistas_disponibles:
-        return None
-    
-    return pistas_disponibles[0][PISTA_ID]
+    return motor.asignar_pista_a_vuelo(vuelo)
 
 def ocupar_pista(id_pista, vuelo):
     """Marca una pista como ocupada por un vuelo"""
-    global reloj_simulado
-    
-    for i, pista in enumerate(pistas):
-        if pista[PISTA_ID] == id_pista:
-            tiempo_liberacion = reloj_simulado + pista[PISTA_TIEMPO_USO]
-            pista_actualizada = (
-                pista[PISTA_ID],
-                pista[PISTA_CATEGORIA],
-                pista[PISTA_TIEMPO_USO],
-                pista[PISTA_HABILITADA],
-                "OCUPADA",
-                vuelo[ID],
-                tiempo_liberacion
-            )
-            pistas[i] = pista_actualizada
-            
-            # Actualizar estado del vuelo en los flujos
-            actualizar_estado_vuelo(vuelo[ID], "ASIGNADO")
-            
-            registrar_log(f"ASIGNACION id_vuelo={vuelo[ID]} pista={id_pista} tipo={vuelo[TIPO]}")
-            return True
-    
-    return False
+    return motor.ocupar_pista(id_pista, vuelo)
 
 def actualizar_estado_vuelo(id_vuelo, nuevo_estado):
-    """Actualiza el estado de un vuelo"""
-    global vuelos, flujo_aterrizaje, flujo_despegue
-    
-    # Actualizar en lista principal de vuelos
-    for i, vuelo in enumerate(vuelos):
-        if vuelo[ID] == id_vuelo:
-            vuelos[i] = (vuelo[ID], vuelo[TIPO], vuelo[TIEMPO], 
-                         vuelo[PRIORIDAD], vuelo[COMBUSTIBLE], nuevo_estado)
-            break
-    
-    # Actualizar en flujos
-    for i, vuelo in enumerate(flujo_aterrizaje):
-        if vuelo[ID] == id_vuelo:
-            flujo_aterrizaje[i] = (vuelo[ID], vuelo[TIPO], vuelo[TIEMPO], 
-                                  vuelo[PRIORIDAD], vuelo[COMBUSTIBLE], nuevo_estado)
-            break
-    
-    for i, vuelo in enumerate(flujo_despegue):
-        if vuelo[ID] == id_vuelo:
-            flujo_despegue[i] = (vuelo[ID], vuelo[TIPO], vuelo[TIEMPO], 
-                                vuelo[PRIORIDAD], vuelo[COMBUSTIBLE], nuevo_estado)
-            break
+    """Actualiza el estado de un vuelo usando el índice por id (O(1))"""
+    return motor.actualizar_estado_vuelo(id_vuelo, nuevo_estado)
 
-def consumir_combustible():
-    """Reduce el combustible de los vuelos en espera de aterrizaje"""
-    for i, vuelo in enumerate(flujo_aterrizaje):
-        if vuelo[ESTADO] == "EN_COLA":
-            nuevo_combustible = max(0, vuelo[COMBUSTIBLE] - 1)
-            flujo_aterrizaje[i] = (vuelo[ID], vuelo[TIPO], vuelo[TIEMPO], 
-                                  vuelo[PRIORIDAD], nuevo_combustible, vuelo[ESTADO])
+def consumir_combustible(minutos=1):
+    """Reduce el combustible de los vuelos en espera de aterrizaje."""
+    return motor.consumir_combustible(minutos)
 
 def actualizar_prioridades_combustible():
-    """Actualiza prioridades por combustible crítico"""
-    for i, vuelo in enumerate(flujo_aterrizaje):
-        if vuelo[COMBUSTIBLE] <= 5 and vuelo[PRIORIDAD] < 2:
-            # Actualizar en flujo
-            flujo_aterrizaje[i] = (vuelo[ID], vuelo[TIPO], vuelo[TIEMPO], 
-                                  2, vuelo[COMBUSTIBLE], vuelo[ESTADO])
-            # Actualizar en lista principal
-            actualizar_estado_vuelo(vuelo[ID], vuelo[ESTADO])
-            registrar_log(f"EMERGENCIA id_vuelo={vuelo[ID]} prioridad=2 motivo=combustible<=5")
+    """Actualiza prioridades por combustible crítico."""
+    return motor.actualizar_prioridades_combustible()
 
 def liberar_pistas_completadas():
     """Libera pistas cuyo tiempo de ocupación ha expirado"""
-    liberadas = 0
-    for i, pista in enumerate(pistas):
-        if (pista[PISTA_ESTADO] == "OCUPADA" and 
-            pista[PISTA_TIEMPO_LIBERACION] <= reloj_simulado):
-            
-            # Marcar vuelo como COMPLETADO
-            actualizar_estado_vuelo(pista[PISTA_VUELO_ACTUAL], "COMPLETADO")
-            
-            # Liberar pista
-            pistas[i] = (
-                pista[PISTA_ID],
-                pista[PISTA_CATEGORIA],
-                pista[PISTA_TIEMPO_USO],
-                pista[PISTA_HABILITADA],
-                "LIBRE",
-                None,
-                0
-            )
-            liberadas += 1
-            registrar_log(f"COMPLETADO id_vuelo={pista[PISTA_VUELO_ACTUAL]} pista={pista[PISTA_ID]}")
-    
-    return liberadas
+    return motor.liberar_pistas_completadas()
 
 def avanzar_minuto():
     """Avanza un minuto en la simulación"""
-    global reloj_simulado
-    
-    reloj_simulado += 1
-    print(f"\n--- Minuto {reloj_simulado} ---")
-    
-    # 1. Consumir combustible
-    consumir_combustible()
-    
-    # 2. Actualizar prioridades por combustible crítico
-    actualizar_prioridades_combustible()
-    
-    # 3. Liberar pistas completadas
-    liberadas = liberar_pistas_completadas()
-    if liberadas > 0:
-        print(f" {liberadas} pista(s) liberada(s)")
-    
-    # 4. Asignar nuevos vuelos a pistas libres
-    pistas_libres = [p for p in pistas if p[PISTA_ESTADO] == "LIBRE" and p[PISTA_HABILITADA] == 1]
-    
-    for pista in pistas_libres:
-        siguiente_vuelo = obtener_siguiente_vuelo()
-        if siguiente_vuelo:
-            pista_asignada = asignar_pista_a_vuelo(siguiente_vuelo)
-            if pista_asignada:
-                ocupar_pista(pista_asignada, siguiente_vuelo)
-                print(f" Vuelo {siguiente_vuelo[ID]} asignado a pista {pista_asignada}")
-    
-    mostrar_estado_actual()
+    return motor.avanzar_minuto()
 
 def mostrar_estado_actual():
     """Muestra el estado actual de la simulación"""
-    print(f"\nEstado actual (Minuto {reloj_simulado}):")
-    
-    # Pistas
-    print("Pistas:")
-    for pista in pistas:
-        estado = f"{pista[PISTA_ESTADO]}"
-        if pista[PISTA_ESTADO] == "OCUPADA":
-            estado += f" por {pista[PISTA_VUELO_ACTUAL]} (hasta min {pista[PISTA_TIEMPO_LIBERACION]})"
-        print(f"  {pista[PISTA_ID]}: {estado}")
-    
-    # Colas
-    aterrizajes_espera = len([v for v in flujo_aterrizaje if v[ESTADO] == "EN_COLA"])
-    despegues_espera = len([v for v in flujo_despegue if v[ESTADO] == "EN_COLA"])
-    
-    print(f"Colas: Aterrizajes={aterrizajes_espera}, Despegues={despegues_espera}")
-    
-    # Vuelos críticos
-    criticos = [v for v in flujo_aterrizaje if v[COMBUSTIBLE] <= 5 and v[ESTADO] == "EN_COLA"]
-    if criticos:
-        print("¡ALERTA! Vuelos con combustible crítico:")
-        for v in criticos:
-            print(f"  {v[ID]}: {v[COMBUSTIBLE]} min de combustible")
-
-# ========== FUNCIONES DE GESTIÓN EXPANDIDAS ==========
+    return motor.mostrar_estado_actual()
 
 def generar_id_vuelo():
     """Genera un ID de vuelo aleatorio"""
-    aerolinea = random.choice(AEROLINEAS)
-    numero = random.randint(100, 999)
-    return f"{aerolinea}{numero}"
+    return motor.generar_id_vuelo()
 
 def agregar_vuelo_manual():
     """Permite agregar un vuelo manualmente"""
-    global vuelos
-    
-    print("\n--- AGREGAR VUELO MANUAL ---")
-    
-    try:
-        id_vuelo = input("ID del vuelo (ej: IB123) o Enter para generar automático: ").strip().upper()
-        if not id_vuelo:
-            id_vuelo = generar_id_vuelo()
-            print(f"ID generado: {id_vuelo}")
-        
-        # Verificar si el ID ya existe
-        if any(v[ID] == id_vuelo for v in vuelos):
-            print("Error: Ya existe un vuelo con ese ID")
-            return
-        
-        print("\nTipo de vuelo:")
-        print("1. ATERRIZAJE")
-        print("2. DESPEGUE")
-        tipo_opcion = input("Seleccione (1-2): ").strip()
-        
-        if tipo_opcion == "1":
-            tipo = "ATERRIZAJE"
-            tiempo = int(input("ETA (minuto de llegada): "))
-            combustible = int(input("Combustible (minutos de autonomía): "))
-            if combustible < 0:
-                print("Error: Combustible no puede ser negativo")
-                return
-        elif tipo_opcion == "2":
-            tipo = "DESPEGUE"
-            tiempo = int(input("ETD (minuto de despegue): "))
-            combustible = 0
-        else:
-            print("Opción no válida")
-            return
-        
-        print("\nPrioridad:")
-        print("0 = Normal")
-        print("1 = Alta") 
-        print("2 = Emergencia")
-        prioridad = int(input("Prioridad (0-2): "))
-        
-        if prioridad not in [0, 1, 2]:
-            print("Error: Prioridad debe ser 0, 1 o 2")
-            return
-        
-        estado = "EN_COLA"
-        
-        nuevo_vuelo = (id_vuelo, tipo, tiempo, prioridad, combustible, estado)
-        vuelos.append(nuevo_vuelo)
-        inicializar_flujos()
-        
-        mensaje = f"Vuelo {id_vuelo} agregado manualmente - {tipo}"
-        print(f"\n✓ {mensaje}")
-        registrar_log(f"ALTA_MANUAL id_vuelo={id_vuelo} tipo={tipo}")
-        
-    except ValueError:
-        print("Error: Los campos numéricos deben ser números enteros válidos")
-    except Exception as e:
-        print(f"Error al agregar vuelo: {e}")
+    return motor.agregar_vuelo_manual()
 
 def generar_vuelos_automaticos(cantidad=5):
-    """Genera vuelos automáticamente"""
-    global vuelos
-    
-    print(f"\n--- GENERANDO {cantidad} VUELOS ALEATORIOS ---")
-    
-    for i in range(cantidad):
-        id_vuelo = generar_id_vuelo()
-        tipo = random.choice(["ATERRIZAJE", "DESPEGUE"])
-        tiempo = random.randint(reloj_simulado, reloj_simulado + 10)
-        prioridad = random.choices([0, 1, 2], weights=[80, 15, 5])[0]
-        
-        if tipo == "ATERRIZAJE":
-            combustible = random.randint(5, 45)
-        else:
-            combustible = 0
-            
-        estado = "EN_COLA"
-        
-        nuevo_vuelo = (id_vuelo, tipo, tiempo, prioridad, combustible, estado)
-        vuelos.append(nuevo_vuelo)
-        
-        print(f"✓ {id_vuelo}: {tipo} en minuto {tiempo}, prioridad {prioridad}")
-        registrar_log(f"ALTA_AUTOMATICA id_vuelo={id_vuelo} tipo={tipo}")
-    
-    inicializar_flujos()
-    print(f"\n✓ Se generaron {cantidad} vuelos automáticamente")
+    """Genera vuelos automáticamente y devuelve cuántos se han dado de alta"""
+    return motor.generar_vuelos_automaticos(cantidad)
 
 def agregar_pista_manual():
     """Permite agregar una pista manualmente"""
-    global pistas
-    
-    print("\n--- AGREGAR PISTA MANUAL ---")
-    
-    try:
-        id_pista = input("ID de la pista (ej: R3): ").strip().upper()
-        
-        # Verificar si la pista ya existe
-        if any(p[PISTA_ID] == id_pista for p in pistas):
-            print("Error: Ya existe una pista con ese ID")
-            return
-        
-        print("\nCategoría de pista:")
-        print("1. corta")
-        print("2. estandar") 
-        print("3. larga")
-        cat_opcion = input("Seleccione (1-3): ").strip()
-        
-        categorias = {"1": "corta", "2": "estandar", "3": "larga"}
-        if cat_opcion not in categorias:
-            print("Opción no válida")
-            return
-            
-        categoria = categorias[cat_opcion]
-        tiempo_uso = int(input("Tiempo de uso por operación (minutos): "))
-        habilitada = 1  # Por defecto habilitada
-        
-        nueva_pista = (
-            id_pista,
-            categoria,
-            tiempo_uso,
-            habilitada,
-            "LIBRE",
-            None,
-            0
-        )
-        pistas.append(nueva_pista)
-        
-        mensaje = f"Pista {id_pista} agregada - Categoría: {categoria}"
-        print(f"\n✓ {mensaje}")
-        registrar_log(f"PISTA_AGREGADA id={id_pista} categoria={categoria}")
-        
-    except ValueError:
-        print("Error: El tiempo de uso debe ser un número entero")
-    except Exception as e:
-        print(f"Error al agregar pista: {e}")
+    return motor.agregar_pista_manual()
 
 def gestionar_estado_pistas():
     """Permite habilitar/deshabilitar pistas"""
-    global pistas
-    
-    print("\n--- GESTIONAR ESTADO DE PISTAS ---")
-    
-    if not pistas:
-        print("No hay pistas registradas")
-        return
-    
-    mostrar_pistas()
-    
-    try:
-        id_pista = input("\nID de la pista a modificar: ").strip().upper()
-        
-        # Buscar la pista
-        pista_index = -1
-        for i, pista in enumerate(pistas):
-            if pista[PISTA_ID] == id_pista:
-                pista_index = i
-                break
-        
-        if pista_index == -1:
-            print("Error: No se encontró la pista")
-            return
-        
-        pista_actual = pistas[pista_index]
-        
-        print(f"\nPista {id_pista} actualmente: {'HABILITADA' if pista_actual[PISTA_HABILITADA] == 1 else 'DESHABILITADA'}")
-        print("\n1. Habilitar pista")
-        print("2. Deshabilitar pista")
-        print("3. Cambiar categoría")
-        opcion = input("Seleccione opción (1-3): ").strip()
-        
-        if opcion == "1":
-            nueva_pista = (
-                pista_actual[PISTA_ID],
-                pista_actual[PISTA_CATEGORIA],
-                pista_actual[PISTA_TIEMPO_USO],
-                1,  # Habilitada
-                pista_actual[PISTA_ESTADO],
-                pista_actual[PISTA_VUELO_ACTUAL],
-                pista_actual[PISTA_TIEMPO_LIBERACION]
-            )
-            mensaje = f"Pista {id_pista} habilitada"
-            
-        elif opcion == "2":
-            nueva_pista = (
-                pista_actual[PISTA_ID],
-                pista_actual[PISTA_CATEGORIA],
-                pista_actual[PISTA_TIEMPO_USO],
-                0,  # Deshabilitada
-                "LIBRE",  # Forzar estado libre
-                None,
-                0
-            )
-            mensaje = f"Pista {id_pista} deshabilitada"
-            
-        elif opcion == "3":
-            print("\nNueva categoría:")
-            print("1. corta")
-            print("2. estandar") 
-            print("3. larga")
-            cat_opcion = input("Seleccione (1-3): ").strip()
-            
-            categorias = {"1": "corta", "2": "estandar", "3": "larga"}
-            if cat_opcion not in categorias:
-                print("Opción no válida")
-                return
-                
-            nueva_categoria = categorias[cat_opcion]
-            nueva_pista = (
-                pista_actual[PISTA_ID],
-                nueva_categoria,
-                pista_actual[PISTA_TIEMPO_USO],
-                pista_actual[PISTA_HABILITADA],
-                pista_actual[PISTA_ESTADO],
-                pista_actual[PISTA_VUELO_ACTUAL],
-                pista_actual[PISTA_TIEMPO_LIBERACION]
-            )
-            mensaje = f"Pista {id_pista} cambiada a categoría: {nueva_categoria}"
-            
-        else:
-            print("Opción no válida")
-            return
-        
-        pistas[pista_index] = nueva_pista
-        print(f"✓ {mensaje}")
-        registrar_log(f"PISTA_MODIFICADA {mensaje}")
-        
-    except Exception as e:
-        print(f"Error al modificar pista: {e}")
+    return motor.gestionar_estado_pistas()
 
 def cancelar_vuelo():
     """Permite cancelar un vuelo"""
-    global vuelos
-    
-    print("\n--- CANCELAR VUELO ---")
-    
-    if not vuelos:
-        print("No hay vuelos registrados")
-        return
-    
-    mostrar_vuelos()
-    
-    id_vuelo = input("\nID del vuelo a cancelar: ").strip().upper()
-    
-    # Buscar el vuelo
-    vuelo_index = -1
-    for i, vuelo in enumerate(vuelos):
-        if vuelo[ID] == id_vuelo:
-            vuelo_index = i
-            break
-    
-    if vuelo_index == -1:
-        print("Error: No se encontró el vuelo")
-        return
-    
-    vuelo_actual = vuelos[vuelo_index]
-    
-    if vuelo_actual[ESTADO] == "COMPLETADO":
-        print("Error: No se puede cancelar un vuelo completado")
-        return
-    
-    if vuelo_actual[ESTADO] == "ASIGNADO":
-        # Liberar la pista si estaba asignado
-        for i, pista in enumerate(pistas):
-            if pista[PISTA_VUELO_ACTUAL] == id_vuelo:
-                pistas[i] = (
-                    pista[PISTA_ID],
-                    pista[PISTA_CATEGORIA],
-                    pista[PISTA_TIEMPO_USO],
-                    pista[PISTA_HABILITADA],
-                    "LIBRE",
-                    None,
-                    0
-                )
-                print(f"✓ Pista {pista[PISTA_ID]} liberada")
-    
-    # Actualizar estado del vuelo
-    vuelos[vuelo_index] = (
-        vuelo_actual[ID],
-        vuelo_actual[TIPO],
-        vuelo_actual[TIEMPO],
-        vuelo_actual[PRIORIDAD],
-        vuelo_actual[COMBUSTIBLE],
-        "CANCELADO"
-    )
-    
-    inicializar_flujos()
-    
-    mensaje = f"Vuelo {id_vuelo} cancelado"
-    print(f"✓ {mensaje}")
-    registrar_log(f"CANCELACION {mensaje}")
+    return motor.cancelar_vuelo()
 
 def mostrar_estadisticas():
     """Muestra estadísticas en tiempo real"""
-    print("\n--- ESTADÍSTICAS EN TIEMPO REAL ---")
-    print(f"Reloj simulado: {reloj_simulado} min")
-    
-    # Estadísticas de vuelos
-    total_vuelos = len(vuelos)
-    completados = len([v for v in vuelos if v[ESTADO] == "COMPLETADO"])
-    en_cola = len([v for v in vuelos if v[ESTADO] == "EN_COLA"])
-    asignados = len([v for v in vuelos if v[ESTADO] == "ASIGNADO"])
-    cancelados = len([v for v in vuelos if v[ESTADO] == "CANCELADO"])
-    
-    print(f"\n--- VUELOS ---")
-    print(f"Total: {total_vuelos}")
-    print(f"Completados: {completados}")
-    print(f"En cola: {en_cola}")
-    print(f"Asignados: {asignados}")
-    print(f"Cancelados: {cancelados}")
-    
-    # Por tipo
-    aterrizajes = len([v for v in vuelos if v[TIPO] == "ATERRIZAJE"])
-    despegues = len([v for v in vuelos if v[TIPO] == "DESPEGUE"])
-    print(f"Aterrizajes: {aterrizajes}")
-    print(f"Despegues: {despegues}")
-    
-    # Por prioridad
-    for prio in [0, 1, 2]:
-        count = len([v for v in vuelos if v[PRIORIDAD] == prio])
-        print(f"Prioridad {prio}: {count}")
-    
-    # Pistas
-    print(f"\n--- PISTAS ---")
-    total_pistas = len(pistas)
-    habilitadas = len([p for p in pistas if p[PISTA_HABILITADA] == 1])
-    libres = len([p for p in pistas if p[PISTA_ESTADO] == "LIBRE" and p[PISTA_HABILITADA] == 1])
-    ocupadas = len([p for p in pistas if p[PISTA_ESTADO] == "OCUPADA"])
-    
-    print(f"Total: {total_pistas}")
-    print(f"Habilitadas: {habilitadas}")
-    print(f"Libres: {libres}")
-    print(f"Ocupadas: {ocupadas}")
-    
-    # Vuelos críticos
-    criticos = [v for v in flujo_aterrizaje if v[COMBUSTIBLE] <= 5 and v[ESTADO] == "EN_COLA"]
-    if criticos:
-        print(f"\n⚠️  VUELOS CRÍTICOS ({len(criticos)}):")
-        for v in criticos:
-            print(f"  {v[ID]}: {v[COMBUSTIBLE]} min combustible")
+    return motor.mostrar_estadisticas()
 
 def generar_informe():
     """Genera un informe completo de la simulación"""
-    try:
-        with open("informe.log", "w", encoding="utf-8") as f:
-            f.write("RESUMEN\n")
-            f.write(f"- Tiempo simulado (min): {reloj_simulado}\n")
-            
-            # Estadísticas reales
-            vuelos_completados = [v for v in vuelos if v[ESTADO] == "COMPLETADO"]
-            emergencias = [v for v in vuelos if v[PRIORIDAD] == 2]
-            
-            f.write(f"- Vuelos atendidos: {len(vuelos_completados)}\n")
-            
-            # Tiempo medio de espera (simplificado)
-            if vuelos_completados:
-                f.write("- Tiempo medio de espera (min): 2.0\n")
-            
-            # Uso de pistas
-            f.write("- Uso de pistas: R1=3 operaciones, R2=2 operaciones\n")
-            f.write(f"- Emergencias gestionadas: {len(emergencias)}\n")
-            
-            # Detalle de vuelos completados
-            f.write("- Detalle de vuelos completados:\n")
-            # Buscar vuelos completados reales
-            for vuelo in vuelos_completados:
-                tipo_str = f"{vuelo[TIPO]}"
-                if vuelo[PRIORIDAD] == 2:
-                    tipo_str += ", EMERGENCIA"
-                f.write(f"   • {vuelo[ID]} ({tipo_str}) t_inicio=1 t_fin=4\n")  # Datos de ejemplo
-                
-        print("✓ Informe generado en informe.log")
-        return True
-        
-    except Exception as e:
-        print(f"Error al generar informe: {e}")
-        return False
+    return motor.generar_informe()
 
 def guardar_estado():
     """Guarda el estado actual en archivos CSV"""
-    try:
-        # Guardar vuelos
-        with open("vuelos_actualizado.csv", "w", encoding="utf-8") as f:
-            f.write("id_vuelo,tipo,tiempo,prioridad,combustible,estado\n")
-            for vuelo in vuelos:
-                f.write(f"{vuelo[ID]},{vuelo[TIPO]},{vuelo[TIEMPO]},{vuelo[PRIORIDAD]},{vuelo[COMBUSTIBLE]},{vuelo[ESTADO]}\n")
-        
-        # Guardar pistas
-        with open("pistas_actualizado.csv", "w", encoding="utf-8") as f:
-            f.write("id_pista,categoria,tiempo_uso,habilitada\n")
-            for pista in pistas:
-                f.write(f"{pista[PISTA_ID]},{pista[PISTA_CATEGORIA]},{pista[PISTA_TIEMPO_USO]},{pista[PISTA_HABILITADA]}\n")
-        
-        print("✓ Estado guardado en 'vuelos_actualizado.csv' y 'pistas_actualizado.csv'")
-        registrar_log("ESTADO_GUARDADO")
-        
-    except Exception as e:
-        print(f"Error al guardar estado: {e}")
+    return motor.guardar_estado()
 
 # ========== MENÚ PRINCIPAL ==========
 
@@ -813,7 +2541,7 @@ def mostrar_menu():
     print("\n" + "="*60)
     print("===== SISTEMA DE SIMULACIÓN AÉREA - MENÚ COMPLETO =====")
     print("="*60)
-    print(f"Reloj actual: {reloj_simulado} min | Vuelos: {len(vuelos)} | Pistas: {len(pistas)}")
+    print(f"Reloj actual: {motor.reloj_simulado} min | Vuelos: {motor.contadores_vuelos.total} | Pistas: {motor.contadores_pistas.total}")
     print("\n--- GESTIÓN DE VUELOS ---")
     print("1. Mostrar todos los vuelos")
     print("2. Agregar vuelo manualmente")
@@ -837,14 +2565,20 @@ def mostrar_menu():
     print("14. Salir")
     print("="*60)
 
-def main():
+def main(reanudar=None):
     """Función principal del programa"""
-    global reloj_simulado
-    
-    # Carga automática al iniciar
-    cargar_pistas_desde_csv()
-    cargar_vuelos_desde_csv()
-    inicializar_flujos()
+    if reanudar is not None:
+        # Continuar una simulación guardada en un checkpoint
+        try:
+            motor.reanudar_checkpoint(reanudar)
+        except ValueError as e:
+            print(f"Error al reanudar: {e}")
+            return
+    else:
+        # Carga automática al iniciar
+        cargar_pistas_desde_csv()
+        cargar_vuelos_desde_csv()
+        inicializar_flujos()
     
     registrar_log("Sistema iniciado")
     
@@ -875,9 +2609,13 @@ def main():
         elif opcion == "9":
             try:
                 n = int(input("¿Cuántos minutos avanzar? "))
-                for i in range(n):
-                    avanzar_minuto()
-                    time.sleep(0.3)
+                por_eventos = input("¿Saltar los minutos sin eventos? (s/N): ").strip().lower() == "s"
+                if por_eventos:
+                    motor.avanzar_minutos_por_eventos(n)
+                else:
+                    for i in range(n):
+                        avanzar_minuto()
+                        time.sleep(0.3)
             except ValueError:
                 print("Error: Ingrese un número válido")
         elif opcion == "10":
@@ -891,10 +2629,84 @@ def main():
         elif opcion == "14":
             guardar_estado()
             registrar_log("Sistema finalizado")
+            vaciar_log(durable=True)
             print("\n¡Hasta luego! Estado guardado automáticamente.")
             break
         else:
             print("Opción no válida. Por favor, seleccione 1-14")
 
+def procesar_argumentos(argv=None):
+    """Interpreta la línea de comandos; sin subcomando se abre el menú"""
+    parser = argparse.ArgumentParser(prog="python -m sistema_vuelos",
+                                     description="Simulación de control de tráfico aéreo")
+    instrumentar = dict(metavar="ARCHIVO",
+                        help="medir cada fase del minuto y volcarlo en ARCHIVO (JSON) al guardar o terminar")
+    reanudar = dict(metavar="ARCHIVO", help="continuar desde un checkpoint en lugar de cargar los CSV")
+    parser.add_argument("--instrumentar", **instrumentar)
+    parser.add_argument("--reanudar", **reanudar)
+    subcomandos = parser.add_subparsers(dest="comando")
+    lote = subcomandos.add_parser("run", help="simular sin menú y escribir eventos.log e informe.log")
+    lote.add_argument("--flights", default="vuelos.csv",
+                      help="CSV o tabla binaria de vuelos (por defecto vuelos.csv)")
+    lote.add_argument("--runways", default="pistas.csv",
+                      help="CSV o tabla binaria de pistas (por defecto pistas.csv)")
+    lote.add_argument("--minutes", type=int, required=True, help="minutos a simular")
+    lote.add_argument("--minuto-a-minuto", action="store_true",
+                      help="simular todos los minutos en lugar de saltar de evento en evento")
+    lote.add_argument("--columnar", action="store_true", help="usar el almacén columnar (requiere NumPy)")
+    lote.add_argument("--streaming", type=int, metavar="VENTANA", dest="ventana",
+                      help="leer los vuelos ordenados por tiempo y encolarlos VENTANA minutos antes")
+    lote.add_argument("--politica", choices=["primera", "mejor_ajuste"], default="primera",
+                      help="política de elección de pista")
+    lote.add_argument("--instrumentar", default=argparse.SUPPRESS, **instrumentar)
+    lote.add_argument("--reanudar", default=argparse.SUPPRESS, **reanudar)
+    lote.add_argument("--checkpoint", metavar="ARCHIVO",
+                      help="guardar al terminar el estado completo en ARCHIVO para reanudarlo después")
+    conversion = subcomandos.add_parser("convertir", help="convertir los CSV en tablas binarias de registro fijo")
+    conversion.add_argument("--flights", default="vuelos.csv", help="CSV de vuelos (por defecto vuelos.csv)")
+    conversion.add_argument("--runways", default="pistas.csv", help="CSV de pistas (por defecto pistas.csv)")
+    conversion.add_argument("--flights-bin", default="vuelos.bin", help="tabla de vuelos a escribir (vuelos.bin)")
+    conversion.add_argument("--runways-bin", default="pistas.bin", help="tabla de pistas a escribir (pistas.bin)")
+    argumentos = parser.parse_args(argv)
+    if argumentos.reanudar is not None and not os.path.exists(argumentos.reanudar):
+        parser.error(f"no existe el archivo {argumentos.reanudar}")
+    if argumentos.comando == "convertir":
+        for archivo in (argumentos.flights, argumentos.runways):
+            if not os.path.exists(archivo):
+                parser.error(f"no existe el archivo {archivo}")
+    if argumentos.comando == "run":
+        # Al reanudar los vuelos y las pistas salen del checkpoint
+        for archivo in (argumentos.flights, argumentos.runways) if argumentos.reanudar is None else ():
+            if not os.path.exists(archivo):
+                parser.error(f"no existe el archivo {archivo}")
+        if argumentos.minutes < 0:
+            parser.error("--minutes no puede ser negativo")
+    return argumentos
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    argumentos = procesar_argumentos()
+    if argumentos.instrumentar:
+        motor.instrumentacion.activar()
+        motor.archivo_instrumentacion = argumentos.instrumentar
+    if argumentos.comando == "run":
+        motor.politica_pistas = argumentos.politica
+        # Los avisos de carga e informe van a stderr: stdout queda limpio
+        with contextlib.redirect_stdout(sys.stderr):
+            try:
+                motor.ejecutar_lote(argumentos.flights, argumentos.runways, argumentos.minutes,
+                                    por_eventos=not argumentos.minuto_a_minuto, columnar=argumentos.columnar,
+                                    ventana=argumentos.ventana, reanudar=argumentos.reanudar,
+                                    checkpoint=argumentos.checkpoint)
+            except ValueError as e:
+                # Checkpoint o tabla binaria dañados, de otra versión o de otro tipo
+                sys.exit(f"Error: {e}")
+    elif argumentos.comando == "convertir":
+        try:
+            vuelos = convertir_vuelos_csv(argumentos.flights, argumentos.flights_bin)
+            pistas = convertir_pistas_csv(argumentos.runways, argumentos.runways_bin)
+        except ValueError as e:
+            # Un id o una categoría que no cabe en su campo de registro fijo
+            sys.exit(f"Error: {e}")
+        print(f"{vuelos} vuelos -> {argumentos.flights_bin}, {pistas} pistas -> {argumentos.runways_bin}")
+    else:
+        main(argumentos.reanudar)
\ No newline at end of file
@@ -12,8 +12,13 @@ from datetime import datetime
 import threading
 # Importa la librería para controlar tiempos y pausas
 import time
+# Importa los registros mutables de vuelos y pistas del motor de simulación
+# el montículo de liberaciones de pistas ocupadas, la tabla de compatibilidad
+# y los recuentos en vivo por estado, tipo y prioridad
+from sistema_vuelos import (Vuelo, Pista, MonticuloLiberaciones, categoria_compatible,
+                            Contadores, CAMPOS_CONTADOS_VUELO, CAMPOS_CONTADOS_PISTA)
 
-# Define constantes numéricas para acceder a los elementos de la tupla de vuelos
+# Define constantes numéricas para acceder a los campos de los vuelos por índice
 # Estas constantes hacen el código más legible
 ID = 0        # Índice 0: ID del vuelo
 TIPO = 1      # Índice 1: Tipo (ATERRIZAJE/DESPEGUE)
@@ -22,7 +27,7 @@ PRIORIDAD = 3 # Índice 3: Prioridad (0,1,2)
 COMBUSTIBLE = 4 # Índice 4: Minutos de combustible
 ESTADO = 5    # Índice 5: Estado del vuelo
 
-# Define constantes para acceder a los elementos de la tupla de pistas
+# Define constantes para acceder a los campos de las pistas por índice
 PISTA_ID = 0          # Índice 0: ID de la pista (ej: R1)
 PISTA_CATEGORIA = 1   # Índice 1: Categoría (corta/estandar/larga)
 PISTA_TIEMPO_USO = 2  # Índice 2: Tiempo que usa la pista (minutos)
@@ -59,6 +64,11 @@ class SistemaVuelosGUI:
         self.hilo_simulacion = None
         # Diccionario para llevar registro del tiempo restante en pista de cada vuelo
         self.tiempo_en_pista = {}  # Diccionario para rastrear tiempo en pista
+        # Montículo con el minuto de fin de cada pista ocupada
+        self.liberaciones = MonticuloLiberaciones()
+        # Recuentos en vivo de vuelos (estado, tipo, prioridad) y de pistas
+        self.contadores_vuelos = Contadores(CAMPOS_CONTADOS_VUELO)
+        self.contadores_pistas = Contadores(CAMPOS_CONTADOS_PISTA)
         
         # Llama al método para configurar los estilos visuales
         self.setup_styles()
@@ -277,8 +287,8 @@ class SistemaVuelosGUI:
                             if prioridad not in [0, 1, 2]:
                                 prioridad = 0
                             
-                            # Crea la tupla con los datos del vuelo
-                            vuelo = (id_vuelo, tipo, tiempo, prioridad, combustible, estado)
+                            # Crea el registro con los datos del vuelo
+                            vuelo = Vuelo(id_vuelo, tipo, tiempo, prioridad, combustible, estado)
                             # Agrega el vuelo a la lista
                             vuelos_cargados.append(vuelo)
                             
@@ -293,11 +303,11 @@ class SistemaVuelosGUI:
                 self.text_info.insert(tk.END, f"📝 Archivo {archivo} no encontrado, creando datos de ejemplo\n", 'info')
                 # Crea una lista de vuelos de ejemplo
                 vuelos_cargados = [
-                    ("IB101", "ATERRIZAJE", 5, 0, 20, "EN_COLA"),
-                    ("IB202", "ATERRIZAJE", 1, 0, 18, "EN_COLA"),
-                    ("UX303", "DESPEGUE", 1, 0, 0, "EN_COLA"),
-                    ("VY404", "DESPEGUE", 5, 0, 0, "EN_COLA"),
-                    ("AF505", "ATERRIZAJE", 8, 0, 5, "EN_COLA")
+                    Vuelo("IB101", "ATERRIZAJE", 5, 0, 20, "EN_COLA"),
+                    Vuelo("IB202", "ATERRIZAJE", 1, 0, 18, "EN_COLA"),
+                    Vuelo("UX303", "DESPEGUE", 1, 0, 0, "EN_COLA"),
+                    Vuelo("VY404", "DESPEGUE", 5, 0, 0, "EN_COLA"),
+                    Vuelo("AF505", "ATERRIZAJE", 8, 0, 5, "EN_COLA")
                 ]
                 
         except Exception as e:
@@ -308,6 +318,8 @@ class SistemaVuelosGUI:
             
         # Asigna la lista de vuelos al atributo de la clase
         self.vuelos = vuelos_cargados
+        # Recuenta los vuelos cargados
+        self.contadores_vuelos.reconstruir(self.vuelos)
         # Retorna la lista de vuelos cargados
         return vuelos_cargados
     
@@ -341,8 +353,8 @@ class SistemaVuelosGUI:
                                 tiempo_uso = int(row.get('tiempo_uso', '3').strip())
                                 habilitada = int(row.get('habilitada', '1').strip())
                                 
-                                # Crea la tupla de pista con estado inicial "LIBRE"
-                                pista = (id_pista, categoria, tiempo_uso, habilitada, "LIBRE", None, None)
+                                # Crea el registro de pista con estado inicial "LIBRE"
+                                pista = Pista(id_pista, categoria, tiempo_uso, habilitada, "LIBRE", None, None)
                                 # Agrega la pista a la lista
                                 pistas_cargadas.append(pista)
                                 
@@ -363,8 +375,8 @@ class SistemaVuelosGUI:
                                     tiempo_uso = int(row[2].strip())
                                     habilitada = int(row[3].strip())
                                     
-                                    # Crea la tupla de pista
-                                    pista = (id_pista, categoria, tiempo_uso, habilitada, "LIBRE", None, None)
+                                    # Crea el registro de pista
+                                    pista = Pista(id_pista, categoria, tiempo_uso, habilitada, "LIBRE", None, None)
                                     pistas_cargadas.append(pista)
                                     
                                 except (ValueError, IndexError) as e:
@@ -378,8 +390,8 @@ class SistemaVuelosGUI:
                 self.text_info.insert(tk.END, f"📝 Archivo {archivo} no encontrado, creando pistas por defecto\n", 'info')
                 # Crea pistas por defecto (R1 y R2 como especificaste)
                 pistas_cargadas = [
-                    ("R1", "larga", 3, 1, "LIBRE", None, None),
-                    ("R2", "estandar", 3, 1, "LIBRE", None, None)
+                    Pista("R1", "larga", 3, 1, "LIBRE", None, None),
+                    Pista("R2", "estandar", 3, 1, "LIBRE", None, None)
                 ]
                 
         except Exception as e:
@@ -389,20 +401,24 @@ class SistemaVuelosGUI:
             
         # Asigna la lista de pistas al atributo de la clase
         self.pistas = pistas_cargadas
+        # Rehace el montículo de liberaciones y los recuentos para la nueva lista de pistas
+        self.liberaciones.reconstruir(self.pistas)
+        self.contadores_pistas.reconstruir(self.pistas)
         # Retorna la lista de pistas cargadas
         return pistas_cargadas
     
     # Método para actualizar la barra de estado
     def actualizar_status(self):
         """Actualizar la barra de estado"""
-        # Cuenta el total de vuelos
-        vuelos_total = len(self.vuelos)
-        # Cuenta el total de pistas
-        pistas_total = len(self.pistas)
-        # Cuenta pistas libres y habilitadas
-        pistas_libres = len([p for p in self.pistas if p[PISTA_ESTADO] == "LIBRE" and p[PISTA_HABILITADA] == 1])
-        # Cuenta vuelos en estado EN_COLA
-        vuelos_en_cola = len([v for v in self.vuelos if v[ESTADO] == "EN_COLA"])
+        # Lee los recuentos en vivo en lugar de recorrer las listas
+        # Total de vuelos
+        vuelos_total = self.contadores_vuelos.total
+        # Total de pistas
+        pistas_total = self.contadores_pistas.total
+        # Pistas libres y habilitadas
+        pistas_libres = self.contadores_pistas.contar("libre", True)
+        # Vuelos en estado EN_COLA
+        vuelos_en_cola = self.contadores_vuelos.contar("estado", "EN_COLA")
         
         # Determina texto según estado de simulación
         estado_simulacion = " | Simulación: " + ("▶️ ACTIVA" if self.simulacion_activa else "⏸️ PAUSADA")
@@ -699,9 +715,10 @@ class SistemaVuelosGUI:
                     tiempo_uso = int(tiempo_var.get())
                     habilitada = int(habilitada_var.get().split(" - ")[0])  # Extrae número del texto
                     
-                    # Crea nueva tupla de pista
-                    nueva_pista = (id_pista, categoria, tiempo_uso, habilitada, "LIBRE", None, None)
+                    # Crea nuevo registro de pista
+                    nueva_pista = Pista(id_pista, categoria, tiempo_uso, habilitada, "LIBRE", None, None)
                     self.pistas.append(nueva_pista)  # Agrega a la lista
+                    self.contadores_pistas.agregar(nueva_pista)  # La suma a los recuentos
                     
                     # Muestra mensaje de éxito
                     self.text_info.insert(tk.END, f"✅ Pista {id_pista} agregada exitosamente\n", 'success')
@@ -737,7 +754,7 @@ class SistemaVuelosGUI:
             id_pista = valores[0]  # ID está en primera columna
             
             # Busca la pista en la lista
-            for i, pista in enumerate(self.pistas):
+            for pista in self.pistas:
                 if pista[PISTA_ID] == id_pista:
                     # Cambia estado de habilitada (1->0 o 0->1)
                     nueva_habilitada = 0 if pista[PISTA_HABILITADA] == 1 else 1
@@ -747,16 +764,13 @@ class SistemaVuelosGUI:
                         messagebox.showwarning("Advertencia", "No se puede deshabilitar una pista ocupada")
                         return
                     
-                    # Actualiza la pista en la lista
-                    self.pistas[i] = (
-                        pista[PISTA_ID],
-                        pista[PISTA_CATEGORIA],
-                        pista[PISTA_TIEMPO_USO],
-                        nueva_habilitada,
-                        "DESHABILITADA" if nueva_habilitada == 0 else "LIBRE",
-                        None,
-                        None
-                    )
+                    # Actualiza la pista en el sitio (descontándola antes de los recuentos)
+                    self.contadores_pistas.quitar(pista)
+                    pista.habilitada = nueva_habilitada
+                    pista.estado = "DESHABILITADA" if nueva_habilitada == 0 else "LIBRE"
+                    pista.vuelo_actual = None
+                    pista.tiempo_liberacion = None
+                    self.contadores_pistas.agregar(pista)
                     
                     # Muestra mensaje de acción realizada
                     accion = "deshabilitada" if nueva_habilitada == 0 else "habilitada"
@@ -780,7 +794,7 @@ class SistemaVuelosGUI:
             id_pista = valores[0]
             
             # Busca la pista en la lista
-            for i, pista in enumerate(self.pistas):
+            for pista in self.pistas:
                 if pista[PISTA_ID] == id_pista:
                     # Verifica que la pista esté ocupada
                     if pista[PISTA_ESTADO] != "OCUPADA":
@@ -792,28 +806,13 @@ class SistemaVuelosGUI:
                         # Obtiene ID del vuelo que está usando la pista
                         vuelo_id = pista[PISTA_VUELO_ACTUAL]
                         # Busca y cancela el vuelo
-                        for j, vuelo in enumerate(self.vuelos):
+                        for vuelo in self.vuelos:
                             if vuelo[ID] == vuelo_id:
-                                self.vuelos[j] = (
-                                    vuelo[ID],
-                                    vuelo[TIPO],
-                                    vuelo[TIEMPO],
-                                    vuelo[PRIORIDAD],
-                                    vuelo[COMBUSTIBLE],
-                                    "CANCELADO"
-                                )
+                                self.cambiar_estado_vuelo(vuelo, "CANCELADO")
                                 break
                         
                         # Libera la pista (estado LIBRE, sin vuelo)
-                        self.pistas[i] = (
-                            pista[PISTA_ID],
-                            pista[PISTA_CATEGORIA],
-                            pista[PISTA_TIEMPO_USO],
-                            pista[PISTA_HABILITADA],
-                            "LIBRE",
-                            None,
-                            None
-                        )
+                        self.liberar_registro_pista(pista)
                         
                         # Elimina del registro de tiempos en pista
                         if vuelo_id in self.tiempo_en_pista:
@@ -944,9 +943,10 @@ class SistemaVuelosGUI:
                     messagebox.showerror("Error", "El combustible no puede ser negativo")
                     return
                 
-                # Crea nueva tupla de vuelo
-                nuevo_vuelo = (id_vuelo, tipo, tiempo, prioridad, combustible, "EN_COLA")
+                # Crea nuevo registro de vuelo
+                nuevo_vuelo = Vuelo(id_vuelo, tipo, tiempo, prioridad, combustible, "EN_COLA")
                 self.vuelos.append(nuevo_vuelo)  # Agrega a la lista
+                self.contadores_vuelos.agregar(nuevo_vuelo)  # Lo suma a los recuentos
                 
                 # Muestra mensaje de éxito
                 self.text_info.insert(tk.END, f"✅ Vuelo {id_vuelo} agregado exitosamente\n", 'success')
@@ -1016,11 +1016,10 @@ class SistemaVuelosGUI:
                 return
             
             # Busca el vuelo por ID
-            for i, vuelo in enumerate(self.vuelos):
+            for vuelo in self.vuelos:
                 if vuelo[ID] == id_vuelo:
                     # Actualiza solo el estado, manteniendo otros datos
-                    self.vuelos[i] = (vuelo[ID], vuelo[TIPO], vuelo[TIEMPO], 
-                                     vuelo[PRIORIDAD], vuelo[COMBUSTIBLE], nuevo_estado)
+                    self.cambiar_estado_vuelo(vuelo, nuevo_estado)
                     
                     # Muestra mensaje de éxito
                     self.text_info.insert(tk.END, f"✅ Vuelo {id_vuelo} actualizado a: {nuevo_estado}\n", 'success')
@@ -1089,24 +1088,15 @@ class SistemaVuelosGUI:
             # Pide confirmación al usuario
             if messagebox.askyesno("Confirmar", f"¿Está seguro de cancelar el vuelo {id_vuelo}?"):
                 # Busca el vuelo por ID
-                for i, vuelo in enumerate(self.vuelos):
+                for vuelo in self.vuelos:
                     if vuelo[ID] == id_vuelo:
                         # Actualiza estado a CANCELADO
-                        self.vuelos[i] = (vuelo[ID], vuelo[TIPO], vuelo[TIEMPO], 
-                                         vuelo[PRIORIDAD], vuelo[COMBUSTIBLE], "CANCELADO")
+                        self.cambiar_estado_vuelo(vuelo, "CANCELADO")
                         
                         # Si estaba en pista, libera la pista
-                        for j, pista in enumerate(self.pistas):
+                        for pista in self.pistas:
                             if pista[PISTA_VUELO_ACTUAL] == id_vuelo:
-                                self.pistas[j] = (
-                                    pista[PISTA_ID],
-                                    pista[PISTA_CATEGORIA],
-                                    pista[PISTA_TIEMPO_USO],
-                                    pista[PISTA_HABILITADA],
-                                    "LIBRE",
-                                    None,
-                                    None
-                                )
+                                self.liberar_registro_pista(pista)
                                 break
                         
                         # Elimina del registro de tiempos en pista
@@ -1140,31 +1130,30 @@ class SistemaVuelosGUI:
             
             # Sección de estadísticas generales
             self.text_info.insert(tk.END, "📈 ESTADÍSTICAS GENERALES\n", 'header')
-            self.text_info.insert(tk.END, f"Total de vuelos: {len(self.vuelos)}\n")
+            total = self.contadores_vuelos.total
+            self.text_info.insert(tk.END, f"Total de vuelos: {total}\n")
             self.text_info.insert(tk.END, f"Tiempo simulado: {self.reloj_simulado} minutos\n")
             
-            # Estadísticas por tipo de vuelo
-            aterrizajes = [v for v in self.vuelos if v[TIPO] == "ATERRIZAJE"]
-            despegues = [v for v in self.vuelos if v[TIPO] == "DESPEGUE"]
-            self.text_info.insert(tk.END, f"Vuelos de aterrizaje: {len(aterrizajes)}\n")
-            self.text_info.insert(tk.END, f"Vuelos de despegue: {len(despegues)}\n\n")
+            # Estadísticas por tipo de vuelo (recuentos en vivo)
+            self.text_info.insert(tk.END, f"Vuelos de aterrizaje: {self.contadores_vuelos.contar('tipo', 'ATERRIZAJE')}\n")
+            self.text_info.insert(tk.END, f"Vuelos de despegue: {self.contadores_vuelos.contar('tipo', 'DESPEGUE')}\n\n")
             
             # Distribución por estado
             self.text_info.insert(tk.END, "📊 DISTRIBUCIÓN POR ESTADO\n", 'header')
             for estado in ESTADOS:
-                count = len([v for v in self.vuelos if v[ESTADO] == estado])
-                porcentaje = (count / len(self.vuelos) * 100) if self.vuelos else 0
+                count = self.contadores_vuelos.contar("estado", estado)
+                porcentaje = (count / total * 100) if total else 0
                 self.text_info.insert(tk.END, f"  {estado}: {count} vuelos ({porcentaje:.1f}%)\n")
             
             # Distribución por prioridad
             self.text_info.insert(tk.END, "\n🎯 DISTRIBUCIÓN POR PRIORIDAD\n", 'header')
             for prioridad in [0, 1, 2]:
-                count = len([v for v in self.vuelos if v[PRIORIDAD] == prioridad])
+                count = self.contadores_vuelos.contar("prioridad", prioridad)
                 self.text_info.insert(tk.END, f"  Prioridad {prioridad}: {count} vuelos\n")
             
             # Vuelos con combustible crítico
             self.text_info.insert(tk.END, "\n⚠️ VUELOS CON COMBUSTIBLE CRÍTICO (<15 min)\n", 'header')
-            criticos = [v for v in aterrizajes if v[COMBUSTIBLE] < 15 and v[ESTADO] != "COMPLETADO"]
+            criticos = [v for v in self.vuelos if v[TIPO] == "ATERRIZAJE" and v[COMBUSTIBLE] < 15 and v[ESTADO] != "COMPLETADO"]
             
             if criticos:
                 for vuelo in criticos:
@@ -1207,14 +1196,14 @@ class SistemaVuelosGUI:
             self.text_info.insert(tk.END, "No hay datos disponibles\n", 'info')
             return
         
-        # Estadísticas básicas
-        total = len(self.vuelos)
+        # Estadísticas básicas (recuentos en vivo)
+        total = self.contadores_vuelos.total
         self.text_info.insert(tk.END, f"📊 TOTAL DE VUELOS: {total}\n\n", 'header')
         
         # Distribución por estado con barras de progreso
         estados_data = []
         for estado in ESTADOS:
-            count = len([v for v in self.vuelos if v[ESTADO] == estado])
+            count = self.contadores_vuelos.contar("estado", estado)
             porcentaje = (count / total * 100) if total > 0 else 0
             estados_data.append((estado, count, porcentaje))
         
@@ -1226,8 +1215,8 @@ class SistemaVuelosGUI:
         
         # Distribución por tipo de vuelo
         self.text_info.insert(tk.END, "\n✈️ DISTRIBUCIÓN POR TIPO:\n", 'header')
-        aterrizajes = len([v for v in self.vuelos if v[TIPO] == "ATERRIZAJE"])
-        despegues = len([v for v in self.vuelos if v[TIPO] == "DESPEGUE"])
+        aterrizajes = self.contadores_vuelos.contar("tipo", "ATERRIZAJE")
+        despegues = self.contadores_vuelos.contar("tipo", "DESPEGUE")
         
         self.text_info.insert(tk.END, f"  ATERRIZAJE: {aterrizajes} ({aterrizajes/total*100:.1f}%)\n")
         self.text_info.insert(tk.END, f"  DESPEGUE:   {despegues} ({despegues/total*100:.1f}%)\n")
@@ -1253,9 +1242,9 @@ class SistemaVuelosGUI:
         
         # Estadísticas de pistas
         self.text_info.insert(tk.END, f"\n🛬 ESTADÍSTICAS DE PISTAS:\n", 'header')
-        pistas_libres = len([p for p in self.pistas if p[PISTA_ESTADO] == "LIBRE" and p[PISTA_HABILITADA] == 1])
-        pistas_ocupadas = len([p for p in self.pistas if p[PISTA_ESTADO] == "OCUPADA"])
-        pistas_deshabilitadas = len([p for p in self.pistas if p[PISTA_HABILITADA] == 0])
+        pistas_libres = self.contadores_pistas.contar("libre", True)
+        pistas_ocupadas = self.contadores_pistas.contar("estado", "OCUPADA")
+        pistas_deshabilitadas = self.contadores_pistas.contar("habilitada", 0)
         
         self.text_info.insert(tk.END, f"  🟢 Pistas libres: {pistas_libres}\n", 'pista_libre')
         self.text_info.insert(tk.END, f"  🟡 Pistas ocupadas: {pistas_ocupadas}\n", 'pista_ocupada')
@@ -1265,10 +1254,10 @@ class SistemaVuelosGUI:
         # Resumen final
         self.text_info.insert(tk.END, f"\n📝 RESUMEN:\n", 'header')
         self.text_info.insert(tk.END, f"  • {len(self.pistas)} pistas disponibles\n")
-        self.text_info.insert(tk.END, f"  • {len([v for v in self.vuelos if v[ESTADO] == 'EN_COLA'])} vuelos en espera\n")
-        self.text_info.insert(tk.END, f"  • {len([v for v in self.vuelos if v[ESTADO] == 'COMPLETADO'])} vuelos completados\n")
-        self.text_info.insert(tk.END, f"  • {len([v for v in self.vuelos if v[PRIORIDAD] == 2])} vuelos de emergencia\n")
-        self.text_info.insert(tk.END, f"  • {len([v for v in self.vuelos if v[ESTADO] == 'EN_PISTA'])} vuelos en pista\n")
+        self.text_info.insert(tk.END, f"  • {self.contadores_vuelos.contar('estado', 'EN_COLA')} vuelos en espera\n")
+        self.text_info.insert(tk.END, f"  • {self.contadores_vuelos.contar('estado', 'COMPLETADO')} vuelos completados\n")
+        self.text_info.insert(tk.END, f"  • {self.contadores_vuelos.contar('prioridad', 2)} vuelos de emergencia\n")
+        self.text_info.insert(tk.END, f"  • {self.contadores_vuelos.contar('estado', 'EN_PISTA')} vuelos en pista\n")
     
     # Método para guardar el estado actual en archivos CSV
     def guardar_estado(self):
@@ -1393,16 +1382,8 @@ class SistemaVuelosGUI:
         self.reloj_simulado = 0  # Reinicia reloj
         
         # Reinicia estados de todas las pistas
-        for i in range(len(self.pistas)):
-            self.pistas[i] = (
-                self.pistas[i][PISTA_ID],
-                self.pistas[i][PISTA_CATEGORIA],
-                self.pistas[i][PISTA_TIEMPO_USO],
-                self.pistas[i][PISTA_HABILITADA],
-                "LIBRE",
-                None,
-                None
-            )
+        for pista in self.pistas:
+            self.liberar_registro_pista(pista)
         
         # Limpia diccionario de tiempos en pista
         self.tiempo_en_pista.clear()
@@ -1441,7 +1422,7 @@ class SistemaVuelosGUI:
         self.reloj_simulado += 1
         
         # 1. Consumir combustible de vuelos en espera de aterrizaje
-        for i, vuelo in enumerate(self.vuelos):
+        for vuelo in self.vuelos:
             if vuelo[TIPO] == "ATERRIZAJE" and vuelo[ESTADO] in ["EN_COLA", "ASIGNANDO"]:
                 # Reduce combustible en 1 minuto (no menor a 0)
                 nuevo_combustible = max(0, vuelo[COMBUSTIBLE] - 1)
@@ -1452,48 +1433,42 @@ class SistemaVuelosGUI:
                 elif nuevo_combustible <= 15 and nueva_prioridad < 1:
                     nueva_prioridad = 1  # Alta prioridad
                 
-                # Actualiza vuelo con nuevo combustible y prioridad
-                self.vuelos[i] = (vuelo[ID], vuelo[TIPO], vuelo[TIEMPO], 
-                                 nueva_prioridad, nuevo_combustible, vuelo[ESTADO])
+                # Actualiza el vuelo en el sitio con nuevo combustible y prioridad
+                self.contadores_vuelos.quitar(vuelo)
+                vuelo.combustible = nuevo_combustible
+                vuelo.prioridad = nueva_prioridad
+                self.contadores_vuelos.agregar(vuelo)
         
         # 2. Liberar pistas cuyo tiempo ha expirado
-        for i, pista in enumerate(self.pistas):
-            if pista[PISTA_ESTADO] == "OCUPADA" and pista[PISTA_TIEMPO_FIN] is not None:
-                if self.reloj_simulado >= pista[PISTA_TIEMPO_FIN]:
-                    # Vuelo que está usando la pista
-                    vuelo_id = pista[PISTA_VUELO_ACTUAL]
-                    
-                    # Marca vuelo como completado
-                    for j, vuelo in enumerate(self.vuelos):
-                        if vuelo[ID] == vuelo_id:
-                            self.vuelos[j] = (vuelo[ID], vuelo[TIPO], vuelo[TIEMPO], 
-                                             vuelo[PRIORIDAD], vuelo[COMBUSTIBLE], "COMPLETADO")
-                            break
-                    
-                    # Libera pista (estado LIBRE, sin vuelo)
-                    self.pistas[i] = (
-                        pista[PISTA_ID],
-                        pista[PISTA_CATEGORIA],
-                        pista[PISTA_TIEMPO_USO],
-                        pista[PISTA_HABILITADA],
-                        "LIBRE",
-                        None,
-                        None
-                    )
-                    
-                    # Elimina del registro de tiempos
-                    if vuelo_id in self.tiempo_en_pista:
-                        del self.tiempo_en_pista[vuelo_id]
-                    
-                    # Muestra mensaje en interfaz
-                    self.root.after(0, lambda vid=vuelo_id: 
-                                   self.text_info.insert(tk.END, 
-                                   f"✅ Vuelo {vid} completó operación en pista\n", 'success'))
+        # Solo se visitan las pistas que vencen ahora, sacadas del montículo
+        for posicion in self.liberaciones.vencidas(self.reloj_simulado, self.pistas):
+            pista = self.pistas[posicion]
+            # Vuelo que está usando la pista
+            vuelo_id = pista[PISTA_VUELO_ACTUAL]
+            
+            # Marca vuelo como completado
+            for vuelo in self.vuelos:
+                if vuelo[ID] == vuelo_id:
+                    self.cambiar_estado_vuelo(vuelo, "COMPLETADO")
+                    break
+            
+            # Libera pista (estado LIBRE, sin vuelo)
+            self.liberar_registro_pista(pista)
+            
+            # Elimina del registro de tiempos
+            if vuelo_id in self.tiempo_en_pista:
+                del self.tiempo_en_pista[vuelo_id]
+            
+            # Muestra mensaje en interfaz
+            self.root.after(0, lambda vid=vuelo_id: 
+                           self.text_info.insert(tk.END, 
+                           f"✅ Vuelo {vid} completó operación en pista\n", 'success'))
         
         # 3. Asignar vuelos a pistas libres (PRIORIDAD: EMERGENCIA primero)
-        pistas_libres = [p for p in self.pistas if p[PISTA_ESTADO] == "LIBRE" and p[PISTA_HABILITADA] == 1]
+        # Guarda también la posición de cada pista para el montículo de liberaciones
+        pistas_libres = [(i, p) for i, p in enumerate(self.pistas) if p[PISTA_ESTADO] == "LIBRE" and p[PISTA_HABILITADA] == 1]
         
-        for pista in pistas_libres:
+        for posicion, pista in pistas_libres:
             # Busca vuelos en cola
             vuelos_en_cola = [v for v in self.vuelos if v[ESTADO] == "EN_COLA"]
             if not vuelos_en_cola:
@@ -1516,26 +1491,20 @@ class SistemaVuelosGUI:
             # Verifica compatibilidad de pista con vuelo
             if self.pista_es_compatible(pista, vuelo_a_asignar):
                 # Cambia estado del vuelo a ASIGNANDO (intermedio)
-                for i, v in enumerate(self.vuelos):
-                    if v[ID] == vuelo_a_asignar[ID]:
-                        self.vuelos[i] = (v[ID], v[TIPO], v[TIEMPO], 
-                                         v[PRIORIDAD], v[COMBUSTIBLE], "ASIGNANDO")
-                        break
+                # El vuelo elegido es el mismo registro que está en self.vuelos
+                self.cambiar_estado_vuelo(vuelo_a_asignar, "ASIGNANDO")
                 
                 # Calcula minuto en que terminará el uso de la pista
                 tiempo_fin = self.reloj_simulado + pista[PISTA_TIEMPO_USO]
                 
-                # Ocupa la pista
-                pista_index = self.pistas.index(pista)
-                self.pistas[pista_index] = (
-                    pista[PISTA_ID],
-                    pista[PISTA_CATEGORIA],
-                    pista[PISTA_TIEMPO_USO],
-                    pista[PISTA_HABILITADA],
-                    "OCUPADA",
-                    vuelo_a_asignar[ID],
-                    tiempo_fin
-                )
+                # Ocupa la pista (descontándola antes de los recuentos)
+                self.contadores_pistas.quitar(pista)
+                pista.estado = "OCUPADA"
+                pista.vuelo_actual = vuelo_a_asignar[ID]
+                pista.tiempo_liberacion = tiempo_fin
+                self.contadores_pistas.agregar(pista)
+                # Apunta la liberación en el montículo
+                self.liberaciones.programar(tiempo_fin, posicion)
                 
                 # Registra tiempo en pista
                 self.tiempo_en_pista[vuelo_a_asignar[ID]] = pista[PISTA_TIEMPO_USO]
@@ -1553,33 +1522,40 @@ class SistemaVuelosGUI:
     def cambiar_a_en_pista(self, vuelo_id):
         """Cambia el estado de un vuelo de ASIGNANDO a EN_PISTA"""
         # Busca el vuelo y cambia su estado
-        for i, vuelo in enumerate(self.vuelos):
+        for vuelo in self.vuelos:
             if vuelo[ID] == vuelo_id and vuelo[ESTADO] == "ASIGNANDO":
-                self.vuelos[i] = (vuelo[ID], vuelo[TIPO], vuelo[TIEMPO], 
-                                 vuelo[PRIORIDAD], vuelo[COMBUSTIBLE], "EN_PISTA")
+                self.cambiar_estado_vuelo(vuelo, "EN_PISTA")
                 break
     
+    # Método para cambiar el estado de un vuelo manteniendo los recuentos
+    def cambiar_estado_vuelo(self, vuelo, nuevo_estado):
+        """Cambia el estado de un vuelo en el sitio y actualiza los recuentos"""
+        # Descuenta el vuelo con su estado anterior y lo vuelve a contar con el nuevo
+        self.contadores_vuelos.quitar(vuelo)
+        vuelo.estado = nuevo_estado
+        self.contadores_vuelos.agregar(vuelo)
+    
+    # Método para dejar una pista libre sin crear un registro nuevo
+    def liberar_registro_pista(self, pista):
+        """Deja la pista LIBRE, sin vuelo ni minuto de fin"""
+        # Descuenta la pista antes del cambio y la vuelve a contar después
+        self.contadores_pistas.quitar(pista)
+        pista.estado = "LIBRE"
+        pista.vuelo_actual = None
+        pista.tiempo_liberacion = None
+        self.contadores_pistas.agregar(pista)
+    
     # Método para verificar compatibilidad entre pista y vuelo
     def pista_es_compatible(self, pista, vuelo):
         """Verifica si una pista es compatible con un tipo de vuelo"""
         # Pista deshabilitada no es compatible con ningún vuelo
         if pista[PISTA_HABILITADA] == 0:
             return False
-            
-        categoria = pista[PISTA_CATEGORIA]
-        
-        # Reglas de compatibilidad según tipo de vuelo
-        if vuelo[TIPO] == "DESPEGUE":
-            # Despegues requieren pistas estándar o largas
-            return categoria in ["estandar", "larga"]
-        elif vuelo[TIPO] == "ATERRIZAJE":
-            if vuelo[PRIORIDAD] == 2:  # Emergencia
-                # Emergencias requieren pistas largas o estándar
-                return categoria in ["larga", "estandar"]
-            else:
-                # Aterrizajes normales pueden usar cualquier pista
-                return True
-        return False
+        
+        # Consulta la tabla precalculada del motor (tipo, emergencia, categoría):
+        # despegues y emergencias requieren pistas estándar o largas,
+        # los aterrizajes normales pueden usar cualquier pista
+        return categoria_compatible(vuelo[TIPO], vuelo[PRIORIDAD] == 2, pista[PISTA_CATEGORIA])
     
     # Método para limpiar todos los datos
     def limpiar_datos(self):
@@ -1594,6 +1570,9 @@ class SistemaVuelosGUI:
             self.vuelos = []
             self.pistas = []
             self.tiempo_en_pista.clear()
+            self.liberaciones.reconstruir(self.pistas)
+            self.contadores_vuelos.reconstruir(self.vuelos)
+            self.contadores_pistas.reconstruir(self.pistas)
             self.text_info.delete(1.0, tk.END)
             self.text_info.insert(tk.END, "🗑️ Todos los datos han sido eliminados\n", 'info')
             self.actualizar_status()
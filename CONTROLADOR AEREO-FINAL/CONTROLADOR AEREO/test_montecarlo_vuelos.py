@@ -0,0 +1,49 @@
+"""Pruebas de regresión de montecarlo_vuelos.
+
+Uso: python -m unittest test_montecarlo_vuelos
+"""
+import contextlib
+import io
+import os
+import unittest
+
+import montecarlo_vuelos as mc
+import sistema_vuelos as sv
+
+PISTAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pistas.csv")
+
+class PruebaTotalesReplica(unittest.TestCase):
+    """Con muchas llegadas se agotan los ids y parte de los vuelos generados se descarta"""
+
+    def test_generar_devuelve_los_registrados(self):
+        motor = sv.MotorVuelos(archivo_log=os.devnull, semilla=1)
+        motor.salida_consola = False
+        ids_posibles = len(sv.AEROLINEAS) * 900
+        with contextlib.redirect_stdout(io.StringIO()):
+            registrados = motor.generar_vuelos_automaticos(ids_posibles + 500)
+        self.assertEqual(registrados, motor.contadores_vuelos.total)
+        self.assertEqual(registrados, ids_posibles)
+
+    def test_generados_con_muchas_llegadas(self):
+        resultado = mc.simular_replica(0, 0, 150, 100, PISTAS)
+        # Por encima de los ids posibles solo entran los que reutilizan el id de un vuelo terminado
+        self.assertLessEqual(resultado["generados"], len(sv.AEROLINEAS) * 900 + resultado["completados"])
+        # Cada vuelo dado de alta está completado, en cola o en una pista
+        en_pista = resultado["generados"] - resultado["completados"] - resultado["pendientes"]
+        self.assertGreaterEqual(en_pista, 0)
+        self.assertLessEqual(en_pista, len(list(sv.leer_pistas_csv(PISTAS))))
+        self.assertGreaterEqual(resultado["emergencias"], 0)
+
+class PruebaReparto(unittest.TestCase):
+    """Los resultados no dependen de cuántos procesos se repartan las réplicas"""
+
+    def test_mismos_totales_con_uno_o_varios_procesos(self):
+        un_proceso = mc.ejecutar_replicas(4, 120, 1, PISTAS, semilla_base=3, procesos=1)
+        varios = mc.ejecutar_replicas(4, 120, 1, PISTAS, semilla_base=3, procesos=2)
+        self.assertEqual(varios, un_proceso)
+        self.assertEqual([fila["replica"] for fila in un_proceso], [0, 1, 2, 3])
+        for fila in un_proceso:
+            self.assertGreaterEqual(fila["generados"], fila["completados"] + fila["pendientes"])
+
+if __name__ == "__main__":
+    unittest.main()
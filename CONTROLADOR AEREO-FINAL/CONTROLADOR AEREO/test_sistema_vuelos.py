@@ -0,0 +1,179 @@
+"""Pruebas de regresión de sistema_vuelos.
+
+Uso: python -m unittest test_sistema_vuelos
+"""
+import contextlib
+import io
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import sistema_vuelos as sv
+
+MODULO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sistema_vuelos.py")
+MINUTOS = 120
+PAUSA = 10
+
+def escribir_escenario(directorio, cantidad=80, semilla=7):
+    """Escribe v.csv y p.csv con un escenario fijo (con emergencias por combustible)"""
+    rnd = random.Random(semilla)
+    with open(os.path.join(directorio, "v.csv"), "w", encoding="utf-8") as f:
+        f.write("id_vuelo,tipo,eta,etd,prioridad,combustible,estado\n")
+        for i in range(cantidad):
+            prioridad = rnd.choices([0, 1, 2], weights=[80, 15, 5])[0]
+            if rnd.random() < 0.5:
+                f.write(f"V{i:03d},ATERRIZAJE,{rnd.randint(0, 60)},,{prioridad},{rnd.randint(3, 40)},EN_COLA\n")
+            else:
+                f.write(f"V{i:03d},DESPEGUE,,{rnd.randint(0, 60)},{prioridad},,EN_COLA\n")
+    with open(os.path.join(directorio, "p.csv"), "w", encoding="utf-8") as f:
+        f.write("id_pista,categoria,tiempo_uso,habilitada\nR1,larga,3,1\nR2,estandar,2,1\nR3,corta,2,1\n")
+    return os.path.join(directorio, "v.csv"), os.path.join(directorio, "p.csv")
+
+def simular(directorio, nombre, archivo_vuelos, archivo_pistas, minutos=MINUTOS, **opciones):
+    """Simula por lotes en un motor propio y devuelve las líneas de su log"""
+    archivo_log = os.path.join(directorio, f"{nombre}.log")
+    motor = sv.MotorVuelos(archivo_log=archivo_log,
+                           archivo_informe=os.path.join(directorio, f"{nombre}_informe.log"))
+    opciones.setdefault("por_eventos", False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        motor.ejecutar_lote(archivo_vuelos, archivo_pistas, minutos, **opciones)
+    with open(archivo_log, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+class PruebaIdsDuplicados(unittest.TestCase):
+    """Un CSV con dos filas iguales no debe romper la cola de despacho"""
+
+    def test_run_con_ids_duplicados(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            with open(os.path.join(directorio, "vuelos.csv"), "w", encoding="utf-8") as f:
+                f.write("id_vuelo,tipo,eta,etd,prioridad,combustible,estado\n")
+                f.write("IB1,ATERRIZAJE,3,,0,20,EN_COLA\n")
+                f.write("IB1,ATERRIZAJE,3,,0,20,EN_COLA\n")
+            with open(os.path.join(directorio, "pistas.csv"), "w", encoding="utf-8") as f:
+                f.write("id_pista,categoria,tiempo_uso,habilitada\nR1,larga,3,1\nR2,estandar,3,1\n")
+            resultado = subprocess.run([sys.executable, MODULO, "run", "--minutes", "10"],
+                                       cwd=directorio, capture_output=True, text=True)
+            self.assertEqual(resultado.returncode, 0, resultado.stderr)
+            self.assertIn("IB1 duplicado", resultado.stderr)
+            with open(os.path.join(directorio, "informe.log"), encoding="utf-8") as f:
+                informe = f.read()
+            self.assertIn("- Vuelos atendidos: 1", informe)
+
+    def test_cola_con_claves_iguales(self):
+        cola = sv.ColaPrioridadIndexada()
+        primero = sv.Vuelo("IB1", "ATERRIZAJE", 3, 0, 20, "EN_COLA")
+        segundo = sv.Vuelo("IB2", "ATERRIZAJE", 3, 0, 20, "EN_COLA")
+        cola.vaciar([((0,), primero), ((0,), segundo)])
+        self.assertIs(cola.extraer(), primero)
+        self.assertIs(cola.extraer(), segundo)
+        cola.insertar((0,), primero)
+        with self.assertRaises(ValueError):
+            cola.insertar((0,), sv.Vuelo("IB1", "ATERRIZAJE", 3, 0, 20, "EN_COLA"))
+
+class PruebaModoEventos(unittest.TestCase):
+    """Saltar de evento en evento deja el mismo log que avanzar minuto a minuto"""
+
+    def test_eventos_igual_que_minuto_a_minuto(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            vuelos, pistas = escribir_escenario(directorio)
+            por_minuto = simular(directorio, "minuto", vuelos, pistas)
+            por_eventos = simular(directorio, "eventos", vuelos, pistas, por_eventos=True)
+            self.assertIn("EMERGENCIA", "\n".join(por_minuto))
+            self.assertEqual(por_eventos, por_minuto)
+
+@unittest.skipIf(sv.np is None, "el almacén columnar necesita NumPy")
+class PruebaAlmacenColumnar(unittest.TestCase):
+    """El almacén columnar de NumPy deja el mismo log que los registros Vuelo"""
+
+    def test_columnar_igual_que_minuto_a_minuto(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            vuelos, pistas = escribir_escenario(directorio)
+            por_minuto = simular(directorio, "minuto", vuelos, pistas)
+            self.assertEqual(simular(directorio, "columnar", vuelos, pistas, columnar=True), por_minuto)
+            self.assertEqual(simular(directorio, "columnar_eventos", vuelos, pistas, columnar=True,
+                                     por_eventos=True), por_minuto)
+
+class PruebaCargaStreaming(unittest.TestCase):
+    """La carga por streaming incorpora cada vuelo una vez y no depende del modo de avance"""
+
+    def test_streaming_por_eventos_igual_que_minuto_a_minuto(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            vuelos, pistas = escribir_escenario(directorio)
+            por_minuto = simular(directorio, "minuto", vuelos, pistas, ventana=10)
+            self.assertEqual(sum(" EN_COLA " in linea for linea in por_minuto), 80)
+            self.assertEqual(sum(" COMPLETADO " in linea for linea in por_minuto), 80)
+            self.assertEqual(simular(directorio, "eventos", vuelos, pistas, ventana=10, por_eventos=True),
+                             por_minuto)
+
+    def test_ventana_completa_igual_que_carga_completa(self):
+        # Con una ventana que abarca toda la programación todo entra en el minuto 0;
+        # solo cambia el orden de las altas y, dentro de un minuto, el de los eventos
+        def sin_carga(lineas):
+            return sorted(linea for linea in lineas if " EN_COLA " not in linea and "CARGA" not in linea)
+        with tempfile.TemporaryDirectory() as directorio:
+            vuelos, pistas = escribir_escenario(directorio)
+            completa = simular(directorio, "completa", vuelos, pistas)
+            streaming = simular(directorio, "streaming", vuelos, pistas, ventana=1000)
+            self.assertEqual(sin_carga(streaming), sin_carga(completa))
+
+class PruebaCheckpoint(unittest.TestCase):
+    """Guardar a mitad y reanudar en otro motor da el mismo log e informe que sin pausa"""
+
+    def comprobar_reanudacion(self, **opciones):
+        def sin_pausa(lineas):
+            return [linea for linea in lineas if "CHECKPOINT" not in linea and "] Sistema " not in linea]
+        with tempfile.TemporaryDirectory() as directorio:
+            vuelos, pistas = escribir_escenario(directorio)
+            continua = simular(directorio, "continua", vuelos, pistas, **opciones)
+            checkpoint = os.path.join(directorio, "estado.ckpt")
+            # Pausa temprana: aún quedan aterrizajes en espera con combustible
+            simular(directorio, "partida", vuelos, pistas, minutos=PAUSA, checkpoint=checkpoint, **opciones)
+            partida = simular(directorio, "partida", None, None, minutos=MINUTOS - PAUSA,
+                              reanudar=checkpoint, **opciones)
+            self.assertEqual(sin_pausa(partida), sin_pausa(continua))
+            informes = []
+            for nombre in ("continua", "partida"):
+                with open(os.path.join(directorio, f"{nombre}_informe.log"), encoding="utf-8") as f:
+                    informes.append(f.read())
+            self.assertEqual(informes[1], informes[0])
+
+    def test_reanudar_minuto_a_minuto(self):
+        self.comprobar_reanudacion()
+
+    def test_reanudar_por_eventos(self):
+        self.comprobar_reanudacion(por_eventos=True)
+
+    def test_reanudar_streaming(self):
+        self.comprobar_reanudacion(ventana=10)
+
+    @unittest.skipIf(sv.np is None, "el almacén columnar necesita NumPy")
+    def test_reanudar_columnar(self):
+        self.comprobar_reanudacion(columnar=True)
+
+class PruebaTablasBinarias(unittest.TestCase):
+    """Las tablas binarias de registro fijo dan el mismo log que los CSV de los que salen"""
+
+    def comprobar_tablas(self, **opciones):
+        def sin_archivo(lineas):
+            # La carga por streaming anota el nombre del archivo de origen
+            return [linea for linea in lineas if "CARGA_STREAMING" not in linea]
+        with tempfile.TemporaryDirectory() as directorio:
+            vuelos, pistas = escribir_escenario(directorio)
+            vuelos_bin, pistas_bin = os.path.join(directorio, "v.bin"), os.path.join(directorio, "p.bin")
+            self.assertEqual(sv.convertir_vuelos_csv(vuelos, vuelos_bin), 80)
+            self.assertEqual(sv.convertir_pistas_csv(pistas, pistas_bin), 3)
+            desde_csv = simular(directorio, "csv", vuelos, pistas, **opciones)
+            desde_tablas = simular(directorio, "tablas", vuelos_bin, pistas_bin, **opciones)
+            self.assertEqual(sin_archivo(desde_tablas), sin_archivo(desde_csv))
+
+    def test_tablas_carga_completa(self):
+        self.comprobar_tablas()
+
+    def test_tablas_streaming(self):
+        self.comprobar_tablas(ventana=10, por_eventos=True)
+
+if __name__ == "__main__":
+    unittest.main()